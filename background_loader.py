@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+백그라운드 덱 로더 (작업 스레드)
+- 덱 파일을 따로 mmap해서 카드 줄 오프셋을 묶음 단위로 구성하고, 검색 색인까지 만듦
+- 결과는 스레드 안전한 queue로만 전달 — Tk 위젯은 건드리지 않음 (UI는 root.after로 polling)
+- 메시지 (첫 원소가 종류)
+    ("cards", starts, ends, 읽은 바이트, 전체 바이트)  카드 줄 오프셋 묶음
+    ("indexing", 처리한 카드 수, 전체 카드 수)          검색 색인 구성 진행률
+    ("index", SearchIndex)                              검색 색인 완료
+    ("done",) / ("cancelled",) / ("error", 예외)        종료 (셋 중 하나만, 마지막 메시지)
+- cancel(): 다음 묶음/다음 카드 경계에서 멈추고 ("cancelled",)를 보냄
+- FolderLoader: 폴더 아래 덱 파일 전체를 프로세스 풀로 읽어 MemoryDeck 묶음으로 보냄
+    ("decks", [MemoryDeck, ...], 읽은 파일 수, 전체 파일 수)   ("cards" 대신)
+  검색 색인은 폴더 전체로 구성 (캐시하지 않음)
+"""
+
+import mmap
+import multiprocessing
+import os
+import queue
+import threading
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+from deck_loader import INDEX_CHUNK, iter_index_chunks, load_index, parse_line, save_index
+from deck_set import MemoryDeck, iter_deck_files, scan_deck
+from search_index import SearchIndex
+
+INDEXING_REPORT_EVERY = 65536  # 검색 색인 진행률 보고 간격 (카드 수)
+DECKS_PER_MESSAGE = 256        # 폴더 로딩: 한 번에 보내는 덱 수 (또는 INDEX_CHUNK 바이트)
+FILES_PER_JOB = 500            # 폴더 로딩: 작업 프로세스 하나당 최소 파일 수 (프로세스 시작 비용보다 커야 함)
+
+
+class LoadCancelled(Exception):
+    pass
+
+
+class DeckLoader(threading.Thread):
+    def __init__(self, path: str, chunk_size: int = INDEX_CHUNK):
+        super().__init__(name=f"DeckLoader({os.path.basename(path)})", daemon=True)
+        self.path = path
+        self.chunk_size = chunk_size
+        self.messages: "queue.Queue[tuple]" = queue.Queue()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def _check(self):
+        if self._cancelled.is_set():
+            raise LoadCancelled()
+
+    def run(self):
+        try:
+            self._load()
+        except LoadCancelled:
+            self.messages.put(("cancelled",))
+        except Exception as e:
+            self.messages.put(("error", e))
+        else:
+            self.messages.put(("done",))
+
+    def _load(self):
+        with open(self.path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                starts, ends = self._scan(data, size)
+                self._check()
+                index = SearchIndex.load(self.path)
+                if index is None:
+                    index = SearchIndex.build(self._texts(data, starts, ends))
+                    index.save(self.path)
+                self.messages.put(("index", index))
+
+    def _scan(self, data, size: int) -> Tuple[array, array]:
+        """오프셋 인덱스: 캐시가 있으면 한 번에, 없으면 묶음마다 보내면서 구성 후 캐시에 저장"""
+        cached = load_index(self.path)
+        if cached is not None:
+            self.messages.put(("cards", cached[0], cached[1], size, size))
+            return cached
+
+        starts, ends = array('q'), array('q')
+        for chunk_starts, chunk_ends, scanned in iter_index_chunks(data, self.chunk_size):
+            self._check()
+            starts.extend(chunk_starts)
+            ends.extend(chunk_ends)
+            self.messages.put(("cards", chunk_starts, chunk_ends, scanned, size))
+        save_index(self.path, starts, ends)
+        return starts, ends
+
+    def _texts(self, data, starts: array, ends: array) -> Iterator[Tuple[str, str]]:
+        """검색 색인용 (단어, 뜻) — 취소되면 LoadCancelled로 색인 구성을 끊음"""
+        total = len(starts)
+        for card_id in range(total):
+            if card_id % INDEXING_REPORT_EVERY == 0:
+                self._check()
+                self.messages.put(("indexing", card_id, total))
+            word, meaning, _ = parse_line(data[starts[card_id]:ends[card_id]].decode('utf-8'))
+            yield word, meaning
+
+
+class FolderLoader(DeckLoader):
+    def __init__(self, folder: str, jobs: Optional[int] = None):
+        super().__init__(folder)
+        self.jobs = jobs or os.cpu_count() or 1
+
+    def _load(self):
+        paths = iter_deck_files(self.path)
+        decks: List[MemoryDeck] = []
+        batch: List[MemoryDeck] = []
+        batch_bytes = 0
+
+        # Tk와 작업 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+        jobs = min(self.jobs, len(paths) // FILES_PER_JOB)
+        pool = multiprocessing.get_context('spawn').Pool(jobs) if jobs > 1 else None
+        try:
+            scanned = pool.imap(scan_deck, paths, chunksize=max(1, len(paths) // (jobs * 8))) if pool \
+                else map(scan_deck, paths)
+            for count, result in enumerate(scanned, 1):
+                self._check()
+                deck = MemoryDeck(*result)
+                decks.append(deck)
+                batch.append(deck)
+                batch_bytes += deck.ends[-1] if len(deck) else 0
+                if len(batch) >= DECKS_PER_MESSAGE or batch_bytes >= self.chunk_size or count == len(paths):
+                    self.messages.put(("decks", batch, count, len(paths)))
+                    batch, batch_bytes = [], 0
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+        self._check()
+        self.messages.put(("index", SearchIndex.build(self._deck_texts(decks))))
+
+    def _deck_texts(self, decks: List[MemoryDeck]) -> Iterator[Tuple[str, str]]:
+        total = sum(len(deck) for deck in decks)
+        card_id = 0
+        for deck in decks:
+            for local in range(len(deck)):
+                if card_id % INDEXING_REPORT_EVERY == 0:
+                    self._check()
+                    self.messages.put(("indexing", card_id, total))
+                word, meaning, _ = deck.fields(local)
+                card_id += 1
+                yield word, meaning
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱 백업 저장소 (내용 주소 방식, 세대 보관)
+- 덱 폴더의 .flashcard_backups/ 아래에 보관
+    objects/<blake2b 해시>   덱 내용 (같은 내용은 덱/세대가 달라도 한 벌만)
+    <덱 파일명>.json          세대 목록 (오래된 것 → 최신, 해시/시각/크기)
+- snapshot(): 세션마다(또는 긴 세션이면 window초마다) 덱당 한 번만 실제로 확인
+    * 최신 세대와 내용이 같으면 아무것도 쓰지 않음, 이미 있는 내용이면 목록에만 추가
+    * keep개 세대만 남기고 어느 목록에서도 쓰지 않는 객체는 삭제
+    * 예전 방식의 <덱>.txt.backup 파일이 있으면 가장 오래된 세대로 가져온 뒤 삭제
+- restore(): 고른 세대로 덱을 원자적으로 교체 (교체 전 현재 내용도 세대로 남김)
+    * 고른 세대를 덱 옆 임시 파일로 먼저 꺼내 둠 (현재 내용을 남기며 오래된 세대가 정리돼도 복원 가능)
+사용법:
+    python backup_store.py list <덱.txt>
+    python backup_store.py restore <덱.txt> [세대 번호(1 = 최신)] [--discard-journal]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from typing import Dict, List, Optional
+
+from deck_cache import content_hash
+
+BACKUP_DIR = '.flashcard_backups'
+OBJECTS_DIR = 'objects'
+MANIFEST_VERSION = 1
+LEGACY_SUFFIX = '.backup'
+RESTORE_SUFFIX = '.restore'  # 복원할 세대를 꺼내 두는 임시 파일
+KEEP = 5                # 덱당 보관 세대 수
+WINDOW = 6 * 60 * 60    # 한 세션에서 같은 덱을 다시 백업하기까지의 간격 (초)
+
+
+def backup_dir(deck_path: str) -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(deck_path)), BACKUP_DIR)
+
+
+def _manifest_path(deck_path: str) -> str:
+    return os.path.join(backup_dir(deck_path), os.path.basename(deck_path) + '.json')
+
+
+def _object_path(root: str, digest: str) -> str:
+    return os.path.join(root, OBJECTS_DIR, digest)
+
+
+def _read_generations(path: str) -> List[Dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return []
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+        return []
+    return manifest.get('generations', [])
+
+
+def _write_generations(path: str, generations: List[Dict]):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump({'version': MANIFEST_VERSION, 'generations': generations}, file, ensure_ascii=False, indent=1)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+def _copy_atomic(src: str, dst: str):
+    """src를 dst로 복사 (임시 파일에 쓰고 fsync 후 교체)"""
+    tmp_path = dst + '.tmp'
+    with open(src, 'rb') as source, open(tmp_path, 'wb') as target:
+        shutil.copyfileobj(source, target, 1 << 20)
+        target.flush()
+        os.fsync(target.fileno())
+    os.replace(tmp_path, dst)
+
+
+class BackupStore:
+    def __init__(self, keep: int = KEEP, window: float = WINDOW):
+        self.keep = keep
+        self.window = window
+        self._taken: Dict[str, float] = {}  # 덱 절대 경로 → 이번 세션에서 마지막으로 확인한 시각 (monotonic)
+
+    def generations(self, deck_path: str) -> List[Dict]:
+        """보관 중인 세대 (최신 → 오래된 순)"""
+        return _read_generations(_manifest_path(deck_path))[::-1]
+
+    def snapshot(self, deck_path: str, force: bool = False) -> bool:
+        """필요하면 덱 내용을 세대로 남김 (새 세대를 추가했으면 True)"""
+        key = os.path.abspath(deck_path)
+        now = time.monotonic()
+        taken = self._taken.get(key)
+        if not force and taken is not None and now - taken < self.window:
+            return False
+        if not os.path.exists(deck_path):
+            return False
+        self._taken[key] = now
+
+        root = backup_dir(deck_path)
+        os.makedirs(os.path.join(root, OBJECTS_DIR), exist_ok=True)
+        manifest = _manifest_path(deck_path)
+        generations = _read_generations(manifest)
+        imported = self._import_legacy(deck_path, root, generations)
+        added = self._add(deck_path, root, generations, time.time())
+        if imported or added:
+            del generations[:-self.keep]
+            _write_generations(manifest, generations)
+            self._collect(root)
+            legacy = deck_path + LEGACY_SUFFIX
+            if imported and os.path.exists(legacy):
+                os.remove(legacy)  # 세대 목록에 기록된 뒤에만 삭제
+        return added
+
+    def _add(self, path: str, root: str, generations: List[Dict], when: float) -> bool:
+        """path 내용을 최신 세대로 추가 (최신 세대와 같으면 그대로)"""
+        digest = content_hash(path).hex()
+        if generations and generations[-1]['hash'] == digest:
+            return False
+        self._store_object(path, root, digest)
+        generations.append({'hash': digest, 'time': when, 'size': os.path.getsize(path)})
+        return True
+
+    @staticmethod
+    def _store_object(path: str, root: str, digest: str):
+        target = _object_path(root, digest)
+        if not os.path.exists(target):
+            _copy_atomic(path, target)
+
+    def _import_legacy(self, deck_path: str, root: str, generations: List[Dict]) -> bool:
+        """예전 copy2 백업(<덱>.txt.backup)을 가장 오래된 세대로 가져옴"""
+        legacy = deck_path + LEGACY_SUFFIX
+        if not os.path.exists(legacy):
+            return False
+        digest = content_hash(legacy).hex()
+        if all(generation['hash'] != digest for generation in generations):
+            self._store_object(legacy, root, digest)
+            generations.insert(0, {'hash': digest, 'time': os.path.getmtime(legacy),
+                                   'size': os.path.getsize(legacy)})
+        return True
+
+    def _collect(self, root: str):
+        """어느 덱의 세대 목록에도 없는 객체 삭제"""
+        used = set()
+        for name in os.listdir(root):
+            if name.endswith('.json'):
+                used.update(g['hash'] for g in _read_generations(os.path.join(root, name)))
+        objects = os.path.join(root, OBJECTS_DIR)
+        for name in os.listdir(objects):
+            if name not in used:
+                os.remove(os.path.join(objects, name))
+
+    def restore(self, deck_path: str, number: int = 1) -> Dict:
+        """number번째 최신 세대(1 = 최신)로 덱을 교체하고 그 세대 정보를 반환"""
+        generations = self.generations(deck_path)
+        if not 1 <= number <= len(generations):
+            raise ValueError(f"세대 번호는 1 ~ {len(generations)} 사이여야 합니다.")
+        generation = generations[number - 1]
+        source = _object_path(backup_dir(deck_path), generation['hash'])
+
+        # 현재 내용을 세대로 남기면 keep개를 넘은 가장 오래된 세대(복원할 세대일 수 있음)가
+        # 정리되므로, 고른 세대를 먼저 덱 옆에 꺼내 두고 검증
+        staged = deck_path + RESTORE_SUFFIX
+        try:
+            _copy_atomic(source, staged)
+            if content_hash(staged).hex() != generation['hash']:
+                raise ValueError("백업 파일이 손상되었습니다.")
+            # 되돌릴 수 있도록 현재 내용을 먼저 세대로 남김 (같은 내용이면 추가되지 않음)
+            self.snapshot(deck_path, force=True)
+            os.replace(staged, deck_path)
+        finally:
+            if os.path.exists(staged):
+                os.remove(staged)
+        return generation
+
+
+_session: Optional[BackupStore] = None
+
+
+def session_store() -> BackupStore:
+    """프로세스 전체에서 공유하는 백업 저장소 (세션당 한 번 규칙이 덱을 다시 열어도 유지되도록)"""
+    global _session
+    if _session is None:
+        _session = BackupStore()
+    return _session
+
+
+def describe(generation: Dict) -> str:
+    when = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(generation['time']))
+    return f"{when}  {generation['size']:>10,} bytes  {generation['hash'][:12]}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="플래시카드 덱 백업 목록/복원")
+    sub = parser.add_subparsers(dest='command', required=True)
+    list_parser = sub.add_parser('list', help="보관 중인 세대 목록")
+    list_parser.add_argument('deck')
+    restore_parser = sub.add_parser('restore', help="세대로 덱 복원")
+    restore_parser.add_argument('deck')
+    restore_parser.add_argument('number', nargs='?', type=int, default=1, help="세대 번호 (1 = 최신)")
+    restore_parser.add_argument('--discard-journal', action='store_true',
+                                help="반영되지 않은 채점 저널을 버리고 복원")
+    args = parser.parse_args(argv)
+
+    store = BackupStore()
+    if args.command == 'list':
+        generations = store.generations(args.deck)
+        if not generations:
+            print("백업이 없습니다.")
+        for number, generation in enumerate(generations, 1):
+            print(f"{number:>3}  {describe(generation)}")
+        return 0
+
+    from result_journal import JOURNAL_SUFFIX
+    journal = args.deck + JOURNAL_SUFFIX
+    if os.path.exists(journal) and not args.discard_journal:
+        print(f"반영되지 않은 채점 저널이 있습니다: {journal}\n"
+              f"앱에서 덱을 열었다 닫아 반영하거나 --discard-journal로 버리세요.", file=sys.stderr)
+        return 1
+    try:
+        generation = store.restore(args.deck, args.number)
+    except (OSError, ValueError) as e:
+        print(f"복원 실패: {e}", file=sys.stderr)
+        return 1
+    # 저널은 복원이 끝난 뒤에만 버림 (복원에 실패하면 채점 기록이 그대로 남음)
+    if args.discard_journal and os.path.exists(journal):
+        os.remove(journal)
+    print(f"복원했습니다: {describe(generation)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
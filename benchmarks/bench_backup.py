@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+백업 저장소 벤치마크 + 복원 확인
+- 세대 keep개를 채운 뒤 세대마다 복원해서 덱 내용이 그 세대와 같은지 확인
+  (가장 오래된 세대 복원: 복원 전 스냅샷이 그 세대를 정리해도 복원돼야 함)
+- 덱 크기별 snapshot(내용 같음 / 새 내용)과 restore 시간
+사용법: python benchmarks/bench_backup.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backup_store import KEEP, RESTORE_SUFFIX, BackupStore
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+
+def write_deck(path: Path, cards: int, tag: str):
+    path.write_bytes("".join(f"{tag}단어{i}\\뜻{i}\\\n" for i in range(cards)).encode("utf-8"))
+
+
+def fill(store: BackupStore, deck: Path, cards: int):
+    """서로 다른 내용의 세대 keep개 (1 = 최신 = 'g1')"""
+    for number in range(store.keep, 0, -1):
+        write_deck(deck, cards, f"g{number}")
+        store.snapshot(str(deck), force=True)
+    assert len(store.generations(str(deck))) == store.keep
+
+
+def check_restore(work: Path):
+    """세대 1 ~ keep 모두 복원되는지 확인"""
+    for number in range(1, KEEP + 1):
+        deck = work / f"restore{number}" / "deck.txt"
+        deck.parent.mkdir()
+        store = BackupStore()
+        fill(store, deck, 10)
+        write_deck(deck, 10, "current")
+        store.restore(str(deck), number)
+        expected = "".join(f"g{number}단어{i}\\뜻{i}\\\n" for i in range(10)).encode("utf-8")
+        assert deck.read_bytes() == expected, f"세대 {number} 복원 내용이 다름"
+        assert not os.path.exists(str(deck) + RESTORE_SUFFIX)
+        # 복원 전 내용이 최신 세대로 남아 있어야 함
+        store.restore(str(deck), 1)
+        assert deck.read_bytes().startswith("current".encode("utf-8"))
+    print(f"세대 1 ~ {KEEP} 복원 확인")
+
+
+def bench(work: Path, cards: int):
+    deck = work / f"bench{cards}" / "deck.txt"
+    deck.parent.mkdir()
+    store = BackupStore()
+    fill(store, deck, cards)
+
+    start = time.perf_counter()
+    store.snapshot(str(deck), force=True)
+    same = time.perf_counter() - start
+
+    write_deck(deck, cards, "new")
+    start = time.perf_counter()
+    store.snapshot(str(deck), force=True)
+    added = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store.restore(str(deck), store.keep)
+    restored = time.perf_counter() - start
+
+    size = deck.stat().st_size
+    print(f"{cards:>9,} cards ({size / 1e6:6.1f} MB): snapshot 같은 내용 {same * 1e3:7.1f} ms, "
+          f"새 내용 {added * 1e3:7.1f} ms, restore(가장 오래된 세대) {restored * 1e3:7.1f} ms")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp)
+        check_restore(work)
+        for cards in SIZES:
+            bench(work, cards)
+
+
+if __name__ == "__main__":
+    main()
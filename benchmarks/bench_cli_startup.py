@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+터미널 학습 시작 시간 벤치마크: 새 프로세스에서 첫 카드가 출력되기까지 (목표 100 ms 미만)
+- python study_cli.py <덱> --first-card 를 여러 번 실행해 중앙값/최댓값 측정
+- 첫 실행은 줄 오프셋 캐시(.idx)를 만들고, 이후 실행은 캐시를 읽음
+- 이어서: 셔플한 세션 스냅샷(시드 + 위치)에서 다시 열 때 (스냅샷 파일은 임시 디렉터리에)
+- 비교용으로 빈 인터프리터(python -c pass) 시작 시간도 측정
+- study_cli를 import해도 tkinter가 로드되지 않는지 확인
+사용법: python benchmarks/bench_cli_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SIZES = [1_000, 100_000, 1_000_000]
+TARGET_MS = 100
+
+
+def make_deck(path: Path, size: int):
+    with path.open('w', encoding='utf-8') as file:
+        for i in range(size):
+            file.write(f"word{i}\\meaning{i}\\\n")
+
+
+def run_ms(command) -> float:
+    start = time.perf_counter()
+    subprocess.run(command, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1e3
+
+
+def loads_tk() -> bool:
+    check = "import sys, study_cli; print(any(m.split('.')[0] == 'tkinter' for m in sys.modules))"
+    output = subprocess.run([sys.executable, '-c', check], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return output.strip() == 'True'
+
+
+def report(label: str, prefix: str, times):
+    median = statistics.median(times)
+    verdict = "OK" if median < TARGET_MS else "목표 초과"
+    print(f"{label}  {prefix} 중앙값 {median:6.1f} ms / 최대 {max(times):6.1f} ms  [{verdict}]")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"tkinter import: {'있음 (실패)' if loads_tk() else '없음'}")
+    bare = [run_ms([sys.executable, '-c', 'pass']) for _ in range(args.runs)]
+    print(f"{'빈 인터프리터':>18}  중앙값 {statistics.median(bare):6.1f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['FLASHCARD_SESSION_FILE'] = str(Path(tmp) / 'session.json')
+        for size in SIZES:
+            deck = Path(tmp) / f"deck_{size}.txt"
+            make_deck(deck, size)
+            command = [sys.executable, str(ROOT / 'study_cli.py'), str(deck), '--first-card']
+            first = run_ms(command + ['--restart'])
+            times = [run_ms(command + ['--restart']) for _ in range(args.runs)]
+            report(f"{size:>12,} cards", f"첫 실행 {first:7.1f} ms, 이후", times)
+            run_ms(command + ['--restart', '--shuffle'])
+            report(f"{'이어서(셔플)':>12}", " " * 20, [run_ms(command) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
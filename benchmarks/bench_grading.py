@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+채점 비용 벤치마크: 덱 크기(100 ~ 1M)에 따라 save_results 비용이 일정한지 확인
+- UI 스레드 비용(save_results)과 저장 스레드가 남은 채점을 기록·fsync하는 flush 시간을 따로 측정
+- GUI와 같은 StudyEngine을 Tk 없이 직접 사용
+사용법: python benchmarks/bench_grading.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from study_engine import StudyEngine
+
+SIZES = [100, 10_000, 100_000, 1_000_000]
+GRADES = 2_000
+
+
+def bench(size: int, work_dir: Path) -> float:
+    deck = work_dir / f"deck_{size}.txt"
+    with deck.open('w', encoding='utf-8') as file:
+        for i in range(size):
+            file.write(f"word{i}\\meaning{i}\\\n")
+
+    app = StudyEngine()
+    app.load_cards(str(deck))
+    app.journal.compact_threshold = GRADES + 1  # 측정 중 compact 방지
+    app.store.shuffle()
+
+    start = time.perf_counter()
+    for n in range(GRADES):
+        app.current_index = n % size
+        app.store.set_result(app.store.card_id(app.current_index), '1')
+        app.save_results()
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    app.writer.flush()
+    flushed = time.perf_counter() - start
+    app.reset()
+    return elapsed / GRADES, flushed
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in SIZES:
+            per_grade, flushed = bench(size, Path(tmp))
+            print(f"{size:>9,} cards: {per_grade * 1e6:8.1f} µs/grade (UI), 마지막 flush {flushed * 1e3:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
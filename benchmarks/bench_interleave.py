@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱 섞어 학습 벤치마크: 덱 수(D)에 따른 세션 시작/카드 한 장 뽑기/가중치 변경 비용
+- 카드는 덱당 20장 이상 (뽑기 도중 세션이 끝나지 않을 만큼), 뽑기는 O(log D) 힙, 시작은 덱별 초기 항목만 (카드 순서는 처음 뽑을 때 구성)
+사용법: python benchmarks/bench_interleave.py
+"""
+
+import random
+import sys
+import time
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from interleave import InterleavedSession
+
+DECK_COUNTS = [10, 1_000, 100_000]
+CARDS_PER_DECK = 20
+DRAWS = 20_000
+
+
+def main():
+    for decks in DECK_COUNTS:
+        per_deck = max(CARDS_PER_DECK, 2 * DRAWS // decks)
+        offsets = array('q', range(0, (decks + 1) * per_deck, per_deck))
+        rng = random.Random(0)
+        weights = [rng.choice([0.5, 1, 2, 4]) for _ in range(decks)]
+
+        start = time.perf_counter()
+        session = InterleavedSession(offsets, weights, shuffle=True, rng=rng)
+        built = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(DRAWS):
+            session.draw()
+        drawn = (time.perf_counter() - start) / DRAWS
+
+        start = time.perf_counter()
+        for _ in range(DRAWS):
+            session.set_weight(rng.randrange(decks), rng.choice([0.5, 1, 2, 4]))
+        changed = (time.perf_counter() - start) / DRAWS
+
+        print(f"D={decks:>7,}: 시작 {built * 1e3:8.1f} ms, 뽑기 {drawn * 1e6:5.2f} µs, 가중치 변경 {changed * 1e6:5.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
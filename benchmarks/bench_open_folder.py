@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+폴더 열기 벤치마크: 작은 덱 5,000개 트리
+- 읽기만      : 파일을 열고 바이트를 읽는 시간 (하한)
+- scan_deck   : 읽기 + 카드 줄 오프셋 구성 (직렬)
+- FolderLoader: 프로세스 풀(--jobs) + MemoryDeck 구성, 검색 색인 제외
+사용법: python benchmarks/bench_open_folder.py [--jobs N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from background_loader import FolderLoader
+from deck_set import iter_deck_files, scan_deck
+
+FOLDERS = 50
+DECKS_PER_FOLDER = 100
+CARDS_PER_DECK = 20
+
+
+def make_tree(root: Path):
+    for folder in range(FOLDERS):
+        directory = root / f"sub{folder:02d}"
+        directory.mkdir()
+        for deck in range(DECKS_PER_FOLDER):
+            with (directory / f"deck{deck:03d}.txt").open('w', encoding='utf-8') as file:
+                for i in range(CARDS_PER_DECK):
+                    file.write(f"단어{folder}_{deck}_{i}\\뜻 {i}\\\n")
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def read_all(paths):
+    for path in paths:
+        with open(path, 'rb') as file:
+            file.read()
+
+
+def load_folder(root: str, jobs: int):
+    class NoIndex(FolderLoader):
+        def _deck_texts(self, decks):
+            return iter(())  # 검색 색인 구성은 측정에서 제외
+
+    loader = NoIndex(root, jobs)
+    loader.run()
+    kind = None
+    while kind not in ("done", "error", "cancelled"):
+        kind = loader.messages.get()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        make_tree(Path(tmp))
+        paths = iter_deck_files(tmp)
+        print(f"{len(paths):,} files, {len(paths) * CARDS_PER_DECK:,} cards")
+        print(f"목록 (os.walk)    {timed(lambda: iter_deck_files(tmp)) * 1e3:8.1f} ms")
+        print(f"읽기만            {timed(lambda: read_all(paths)) * 1e3:8.1f} ms")
+        print(f"scan_deck 직렬    {timed(lambda: [scan_deck(p) for p in paths]) * 1e3:8.1f} ms")
+        for jobs in sorted({1, args.jobs}):
+            print(f"FolderLoader x{jobs:<3} {timed(lambda: load_folder(tmp, jobs)) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
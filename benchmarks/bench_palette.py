@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+애니메이션 프레임당 색상/크기 계산 비용 마이크로벤치마크
+- 이전    : 프레임마다 cos + hex 문자열 두 번 파싱하는 blend_colors
+- 팔레트  : 프레임마다 cos + palette.blend (파싱 결과 캐시)
+- 키프레임: 미리 계산한 표에서 조회만 (현재 ver7 방식)
+사용법: python benchmarks/bench_palette.py
+"""
+
+import math
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import palette
+
+STEPS = 20
+WIDTH = 560
+REPEAT = 20_000
+
+
+def old_blend_colors(color1, color2, ratio):
+    """palette 도입 전 FlashcardApp.blend_colors 그대로"""
+    def hex_to_rgb(hex_color):
+        hex_color = hex_color.lstrip('#')
+        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+    def rgb_to_hex(rgb):
+        return '#%02x%02x%02x' % rgb
+
+    rgb1 = hex_to_rgb(color1)
+    rgb2 = hex_to_rgb(color2)
+
+    blended = tuple(int(rgb1[i] * (1 - ratio) + rgb2[i] * ratio) for i in range(3))
+    return rgb_to_hex(blended)
+
+
+def frame_values(step, blend):
+    scale_x = max(math.cos((step / STEPS) * (math.pi / 2)), 0)
+    width = max(int(WIDTH * scale_x), 5)
+    height = int(200 * (0.95 + (0.05 * scale_x)))
+    return width, height, blend('#f0f0f0', '#cccccc', 1.0 - scale_x)
+
+
+def main():
+    keyframes = tuple(frame_values(step, palette.blend) for step in range(STEPS + 1))
+    assert keyframes == tuple(frame_values(step, old_blend_colors) for step in range(STEPS + 1))
+
+    cases = {
+        "이전 (blend_colors)": lambda: [frame_values(step, old_blend_colors) for step in range(STEPS + 1)],
+        "팔레트 (palette.blend)": lambda: [frame_values(step, palette.blend) for step in range(STEPS + 1)],
+        "키프레임 표 조회": lambda: [keyframes[step] for step in range(STEPS + 1)],
+    }
+    frames = REPEAT * (STEPS + 1)
+    for name, func in cases.items():
+        elapsed = min(timeit.repeat(func, number=REPEAT, repeat=3))
+        print(f"{name:<24} {elapsed / frames * 1e9:8.0f} ns/프레임")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+진행 상황 저장소 벤치마크: progress.json(+델타 로그) vs SQLite
+- open : 앱 시작/덱 열기 시 통계를 읽는 비용 (JSON은 전체, SQLite는 덱 등록(import_deck) + 오늘 만기 카드만)
+- save : 카드 한 장 채점 후 저장 비용
+사용법: python benchmarks/bench_progress_backends.py
+"""
+
+import datetime as dt
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from flash_card_ver2 import CardStats
+from progress_store import ProgressStore
+from sqlite_store import SqliteStore
+
+SIZES = [10_000, 100_000]
+DUE_RATIO = 50  # 카드 50장 중 1장이 오늘 만기
+
+
+def make_stats(size: int, today: dt.date):
+    stats = {}
+    for i in range(size):
+        due = today if i % DUE_RATIO == 0 else today + dt.timedelta(days=1 + i % 30)
+        stats[f"word{i}"] = {"ef": 2.5, "interval": 1 + i % 30, "reps": 2, "next_due": due.isoformat()}
+    return stats
+
+
+def bench_json(work: Path, stats: dict, today: dt.date):
+    path = str(work / "progress.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"stats": stats, "results": {}}, f, ensure_ascii=False, indent=2)
+
+    start = time.perf_counter()
+    store = ProgressStore(path)
+    data = store.load()
+    loaded = {w: CardStats.from_json(v) for w, v in data["stats"].items()}
+    opened = time.perf_counter() - start
+
+    cs = loaded["word0"]
+    start = time.perf_counter()
+    store.record("word0", cs.to_json(), 1)
+    store.flush()
+    saved = time.perf_counter() - start
+    return opened, saved
+
+
+def bench_sqlite(work: Path, stats: dict, today: dt.date):
+    path = str(work / "progress.db")
+    deck_path = str(work / "deck.txt")
+    rows = [(w, "뜻") for w in stats]
+    db = SqliteStore(path)
+    _, card_ids = db.import_deck(deck_path, rows)
+    with db.conn:
+        db.conn.executemany(
+            "INSERT INTO stats(card_id, ef, interval, reps, next_due) VALUES (?, ?, ?, ?, ?)",
+            ((cid, s["ef"], s["interval"], s["reps"], s["next_due"]) for cid, s in zip(card_ids, stats.values())),
+        )
+    db.close()
+
+    # ver2 _queue_due_from_db와 같이 덱을 열 때마다 import_deck(덱 전체 upsert)도 포함
+    start = time.perf_counter()
+    db = SqliteStore(path)
+    deck_id, card_ids = db.import_deck(deck_path, rows)
+    due = db.due_cards(deck_id, today)
+    loaded = {card_id: CardStats(ef, iv, reps, nd) for card_id, _, _, _, ef, iv, reps, nd in due}
+    opened = time.perf_counter() - start
+
+    cs = loaded[card_ids[0]]
+    start = time.perf_counter()
+    db.record_review(card_ids[0], cs.ef, cs.interval, cs.reps, cs.next_due, 5, 1)
+    saved = time.perf_counter() - start
+    db.close()
+    return opened, saved
+
+
+def main():
+    today = dt.date.today()
+    for size in SIZES:
+        stats = make_stats(size, today)
+        with tempfile.TemporaryDirectory() as tmp:
+            j_open, j_save = bench_json(Path(tmp), stats, today)
+            s_open, s_save = bench_sqlite(Path(tmp), stats, today)
+        print(f"{size:>8,} cards | json  open {j_open * 1e3:8.1f} ms  save {j_save * 1e3:6.2f} ms")
+        print(f"{'':>8}       | sqlite open {s_open * 1e3:8.1f} ms  save {s_save * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+셔플/재시작 벤치마크: 덱 크기(1k ~ 10M)에 따른 재시작(원본 순서 + 셔플) 비용
+- array + random.shuffle: 예전 방식 (O(N) 시간/메모리)
+- ShuffledOrder: Feistel 시드 순열 (재시작 O(1), 위치 → 카드 ID와 카드 ID → 위치 각각 O(1))
+- 같은 시드로 다시 만든 순서가 같은지도 확인
+사용법: python benchmarks/bench_shuffle.py
+"""
+
+import random
+import sys
+import time
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from permutation import ShuffledOrder
+
+SIZES = [1_000, 100_000, 1_000_000, 10_000_000]
+ARRAY_LIMIT = 1_000_000  # 이보다 큰 덱은 예전 방식 측정 생략 (너무 느림)
+LOOKUPS = 20_000
+
+
+def restart_array(size: int):
+    order = array('l', range(size))
+    random.shuffle(order)
+    return order
+
+
+def restart_lazy(size: int, seed: int):
+    order = ShuffledOrder(size)
+    order.shuffle(0, size, seed)
+    return order
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    for size in SIZES:
+        old = f"{timed(lambda: restart_array(size)) * 1e3:9.1f} ms" if size <= ARRAY_LIMIT else "        -   "
+        new = timed(lambda: restart_lazy(size, 1))
+
+        order = restart_lazy(size, 1)
+        positions = [random.randrange(size) for _ in range(LOOKUPS)]
+        lookup = timed(lambda: [order[p] for p in positions]) / LOOKUPS
+        inverse = timed(lambda: [order.index(p) for p in positions]) / LOOKUPS
+        same = all(restart_lazy(size, 1)[p] == order[p] for p in positions[:100])
+        print(f"{size:>12,} cards: array+shuffle {old}, 시드 순열 {new * 1e6:6.1f} µs,"
+              f" 조회 {lookup * 1e6:5.2f} µs, 역조회 {inverse * 1e6:5.2f} µs, 재현 {'OK' if same else '불일치'}")
+
+
+if __name__ == "__main__":
+    main()
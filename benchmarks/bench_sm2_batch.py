@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SM-2 일괄 계산 벤치마크
+- 공유 코퍼스에서 sm2_update_batch 결과가 스칼라 sm2_update와 완전히 같은지 확인
+- 1M 카드에서 스칼라 루프 대비 속도 비교 (sm2_update 단독 / ver2 answer()처럼 next_due까지 갱신)
+- 90일 복습량 예측 시간 측정
+사용법: python benchmarks/bench_sm2_batch.py
+"""
+
+import datetime as dt
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+
+from flash_card_ver2 import sm2_update
+from sm2_batch import forecast, review_batch, sm2_update_batch
+
+SIZE = 1_000_000
+
+
+def corpus(size: int, seed: int = 0):
+    """여러 번 채점된 상태를 흉내 낸 (ef, interval, reps, quality) 코퍼스"""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(size):
+        ef, interval, reps = 2.5, 0, 0
+        for _ in range(rng.randrange(0, 8)):
+            ef, interval, reps = sm2_update(ef, interval, reps, rng.randrange(0, 6))
+        rows.append((ef, interval, reps, rng.randrange(0, 6)))
+    return rows
+
+
+def best_of(func, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    rows = corpus(SIZE)
+    ef, interval, reps, quality = (list(col) for col in zip(*rows))
+
+    start = time.perf_counter()
+    expected = [sm2_update(*row) for row in rows]
+    scalar = time.perf_counter() - start
+
+    ef_a, interval_a, reps_a, quality_a = (np.array(col) for col in (ef, interval, reps, quality))
+    got_ef, got_interval, got_reps = sm2_update_batch(ef_a, interval_a, reps_a, quality_a)
+    batch = best_of(lambda: sm2_update_batch(ef_a, interval_a, reps_a, quality_a))
+
+    exp_ef, exp_interval, exp_reps = (np.array(col) for col in zip(*expected))
+    assert np.array_equal(got_ef, exp_ef), "ef 불일치"
+    assert np.array_equal(got_interval, exp_interval), "interval 불일치"
+    assert np.array_equal(got_reps, exp_reps), "reps 불일치"
+    print(f"{SIZE:,} cards: scalar {scalar:.3f}s, batch {batch:.4f}s ({scalar / batch:.0f}x), results identical")
+
+    # ver2 answer()와 같은 카드 상태 갱신: (ef, interval, reps) + next_due
+    today = dt.date.today()
+    states = [[ef, interval, reps, today] for ef, interval, reps, _ in rows]
+    start = time.perf_counter()
+    for state, row in zip(states, rows):
+        state[0], state[1], state[2] = sm2_update(*row)
+        state[3] = today + dt.timedelta(days=state[1])
+    scalar = time.perf_counter() - start
+
+    next_due = np.full(SIZE, today.toordinal())
+    batch = best_of(lambda: review_batch(ef_a, interval_a, reps_a, next_due, quality_a, today))
+    print(f"{SIZE:,} card reviews incl. next_due: scalar {scalar:.3f}s, batch {batch:.4f}s ({scalar / batch:.0f}x)")
+
+    next_due = next_due + interval_a
+    start = time.perf_counter()
+    counts = forecast(ef_a, interval_a, reps_a, next_due, days=90, today=today, seed=0)
+    print(f"90-day forecast: {time.perf_counter() - start:.2f}s, first week {counts[:7].tolist()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+변환 파이프라인 벤치마크: 검증 후 변환(두 번 읽기) vs 단일 패스(convert_file)
+- 시간과 함께 읽은 바이트 수(/proc/self/io 의 rchar, Linux에서만)를 비교
+  (단일 패스는 mmap 으로 읽으므로 read 호출이 없어 0에 가깝게 나옴)
+- 두 번 읽기 기준선에는 매니페스트용 원본/결과 해시 읽기를 포함하지 않음
+- 변환 엔진만 비교: 줄마다 str 변환(transform_line) vs mmap 위 바이트 변환(transform_bytes), MB/s
+사용법: python benchmarks/bench_transform.py
+"""
+
+import mmap
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from transform_flashcards import convert_file, process_file, transform_bytes, transform_line
+from validate_flashcards import validate_file
+
+FILES = 50
+LINES_PER_FILE = 40_000
+
+
+def read_bytes() -> int:
+    """이 프로세스가 지금까지 read 계열 호출로 읽은 바이트 수 (지원하지 않으면 -1)"""
+    try:
+        with open("/proc/self/io", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return -1
+
+
+def make_tree(root: Path) -> int:
+    root.mkdir()
+    body = "".join(f"단어{i}\\뜻 {i} 설명 문장\n" for i in range(LINES_PER_FILE)).encode("utf-8")
+    for i in range(FILES):
+        (root / f"deck{i}.txt").write_bytes(body)
+    return FILES * len(body)
+
+
+def two_pass(src: Path, dst: Path):
+    for f in sorted(src.glob("*.txt")):
+        if validate_file(f):
+            process_file(f, dst / f.name)
+
+
+def fused(src: Path, dst: Path):
+    for f in sorted(src.glob("*.txt")):
+        convert_file(str(f), str(dst / f.name))
+
+
+def run(name: str, func, src: Path, dst: Path, total: int):
+    shutil.rmtree(dst, ignore_errors=True)
+    dst.mkdir()
+    before = read_bytes()
+    start = time.perf_counter()
+    func(src, dst)
+    elapsed = time.perf_counter() - start
+    after = read_bytes()
+    read_info = f"읽기 {(after - before) / total:4.2f}배" if before >= 0 else "읽기 측정 불가"
+    print(f"{name:<12} {elapsed:7.3f}s  {total / elapsed / 1e6:7.1f} MB/s  {read_info}")
+
+
+def bench_engine(path: Path):
+    size = path.stat().st_size
+    with path.open(encoding="utf-8") as f:
+        start = time.perf_counter()
+        text_out = "".join(transform_line(line) for line in f).encode("utf-8")
+        text_time = time.perf_counter() - start
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = time.perf_counter()
+        bytes_out = transform_bytes(data)
+        bytes_time = time.perf_counter() - start
+
+    assert text_out == bytes_out
+    print(f"transform_line  {size / text_time / 1e6:7.1f} MB/s")
+    print(f"transform_bytes {size / bytes_time / 1e6:7.1f} MB/s  ({text_time / bytes_time:.1f}배)")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp)
+        total = make_tree(work / "src")
+        print(f"파일 {FILES}개, 총 {total / 1e6:.1f} MB")
+        run("두 번 읽기", two_pass, work / "src", work / "dst", total)
+        run("단일 패스", fused, work / "src", work / "dst", total)
+        bench_engine(work / "src" / "deck0.txt")
+
+
+if __name__ == "__main__":
+    main()
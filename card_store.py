@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+열(column) 단위 카드 저장소
+- 단어/뜻: intern된 문자열 리스트
+- 결과: bytearray (카드당 1바이트)
+- 학습 순서: 위치 → 카드 ID (permutation.ShuffledOrder — 원본 순서 + 시드 셔플 목록, 배열 없음)
+  * 재시작/셔플은 덱 크기와 무관하게 즉시, 같은 시드면 같은 순서 (replay_shuffles)
+  * 덱 섞어 학습 세션은 지금까지 뽑은 카드 ID array를 순서로 씀
+- 카드 ID = 원본 순서상의 위치 (로드 시 고정)
+- from_source: mmap 덱(MappedDeck)을 원본으로 두고 필요한 카드만 디코딩
+"""
+
+import random
+import sys
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+
+from permutation import ShuffledOrder
+
+# 결과 문자열 ↔ 1바이트 코드
+RESULT_NONE = 0
+RESULT_CORRECT = 1
+RESULT_WRONG = 2
+RESULT_OTHER = 3  # 알 수 없는 결과 문자열 (원문 보존용)
+RESULT_UNLOADED = 255  # 지연 로딩: 아직 원본에서 읽지 않음
+
+_RESULT_CODES = {'': RESULT_NONE, '1': RESULT_CORRECT, '0': RESULT_WRONG}
+_RESULT_TEXTS = ('', '1', '0')
+
+
+class CardStore:
+    __slots__ = ('words', 'meanings', 'results', 'order', '_other_results', 'source', '_decoded', 'dirty')
+
+    def __init__(self):
+        self.words: List[str] = []
+        self.meanings: List[str] = []
+        self.results = bytearray()
+        self.order = ShuffledOrder(0)  # 학습 위치 → 카드 ID
+        self._other_results: Dict[int, str] = {}
+        self.source = None  # 지연 로딩 원본 (fields(card_id), close(), open() 제공)
+        self._decoded: Dict[int, Tuple[str, str]] = {}  # 지연 로딩: 디코딩된 카드만 보관
+        self.dirty: Set[int] = set()  # 마지막 저장 이후 결과가 바뀐 카드 ID
+
+    @classmethod
+    def from_source(cls, source) -> 'CardStore':
+        """카드 수만 알고 내용은 필요할 때 source에서 읽는 저장소"""
+        store = cls()
+        store.source = source
+        store.results = bytearray([RESULT_UNLOADED]) * len(source)
+        store.reset_order()
+        return store
+
+    def extend_source(self, count: int):
+        """지연 로딩 원본에 카드 count장이 더 들어옴 (백그라운드 로딩) — 학습 순서 끝에 붙임"""
+        start = len(self.results)
+        self.results.extend(bytes([RESULT_UNLOADED]) * count)
+        self.order.extend(range(start, start + count))
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def add(self, word: str, meaning: str, result: str = '') -> int:
+        """카드 한 장을 추가하고 ID를 반환"""
+        card_id = len(self.words)
+        self.words.append(sys.intern(word))
+        self.meanings.append(sys.intern(meaning))
+        self.results.append(RESULT_NONE)
+        self.order.append(card_id)
+        self._store_result(card_id, result)
+        return card_id
+
+    # ---------- 카드 조회 ----------
+    def card_id(self, position: int) -> int:
+        """현재 학습 순서의 position번째 카드 ID"""
+        return self.order[position]
+
+    def _text(self, card_id: int) -> Tuple[str, str]:
+        if self.source is None:
+            return self.words[card_id], self.meanings[card_id]
+
+        text = self._decoded.get(card_id)
+        if text is None:
+            word, meaning, result = self.source.fields(card_id)
+            text = (sys.intern(word), sys.intern(meaning))
+            self._decoded[card_id] = text
+            if self.results[card_id] == RESULT_UNLOADED:
+                self._store_result(card_id, result)
+        return text
+
+    def word(self, card_id: int) -> str:
+        return self._text(card_id)[0]
+
+    def meaning(self, card_id: int) -> str:
+        return self._text(card_id)[1]
+
+    def result(self, card_id: int) -> str:
+        code = self.results[card_id]
+        if code == RESULT_UNLOADED:
+            self._text(card_id)
+            code = self.results[card_id]
+        if code == RESULT_OTHER:
+            return self._other_results[card_id]
+        return _RESULT_TEXTS[code]
+
+    def set_result(self, card_id: int, result: str):
+        """채점 결과 변경 (다음 저장 대상으로 표시)"""
+        self._store_result(card_id, result)
+        self.dirty.add(card_id)
+
+    def _store_result(self, card_id: int, result: str):
+        code = _RESULT_CODES.get(result, RESULT_OTHER)
+        if code == RESULT_OTHER:
+            self._other_results[card_id] = result
+        else:
+            self._other_results.pop(card_id, None)
+        self.results[card_id] = code
+
+    def card(self, position: int) -> Tuple[str, str, str]:
+        """학습 순서 position의 (단어, 뜻, 결과)"""
+        card_id = self.order[position]
+        word, meaning = self._text(card_id)
+        return word, meaning, self.result(card_id)
+
+    # ---------- 학습 순서 ----------
+    def reset_order(self):
+        """원본 순서로 되돌림 (O(1), 순서 배열을 만들지 않음)"""
+        self.order = ShuffledOrder(len(self.results))
+
+    def shuffle(self, start: int = 0, seed: Optional[int] = None):
+        """학습 순서만 섞음 (start 이후 위치만, 시드로 기록해 같은 순서를 다시 만들 수 있음)"""
+        if seed is None:
+            seed = random.getrandbits(64)
+        if isinstance(self.order, ShuffledOrder):
+            self.order.shuffle(start, len(self.order), seed)
+            return
+        # 덱 섞어 학습의 뽑은 카드 array
+        tail = self.order[start:]
+        random.Random(seed).shuffle(tail)
+        self.order[start:] = tail
+
+    @property
+    def shuffles(self) -> List[Tuple[int, int, int]]:
+        """원본 순서 이후 적용한 셔플 (시작, 끝, 시드) — 세션 스냅샷용"""
+        return self.order.shuffles if isinstance(self.order, ShuffledOrder) else []
+
+    def replay_shuffles(self, shuffles: List[Tuple[int, int, int]]) -> bool:
+        """원본 순서에 기록된 셔플을 다시 적용 (O(셔플 수), 카드 수와 맞지 않으면 False — 순서는 원본 그대로)"""
+        # 로딩 중 일부만 있을 때 섞은 구간도 뒤에 붙은 카드는 원본 순서이므로 그대로 재현됨
+        try:
+            self.order = ShuffledOrder(len(self.results), shuffles)
+        except ValueError:
+            self.reset_order()
+            return False
+        return True
+
+    # ---------- 저장 ----------
+    def format_row(self, card_id: int) -> str:
+        word, meaning = self._text(card_id)
+        return f"{word}\\{meaning}\\{self.result(card_id)}"
+
+    def write_to(self, file: BinaryIO):
+        """원본 순서로 덱 파일 내용을 기록 (UTF-8 바이트)"""
+        if self.source is None:
+            for word, meaning, result in self.iter_rows():
+                file.write(f"{word}\\{meaning}\\{result}\n".encode('utf-8'))
+            return
+
+        # 지연 로딩: 바뀐 카드 줄만 새로 쓰고 나머지는 원본 바이트를 그대로 복사
+        patches = {card_id: self.format_row(card_id) for card_id in self.dirty}
+        self.source.write_patched(file, patches)
+
+    def mark_clean(self):
+        self.dirty.clear()
+
+    def close(self):
+        """지연 로딩 원본(mmap) 해제"""
+        if self.source is not None:
+            self.source.close()
+
+    def iter_rows(self) -> Iterator[Tuple[str, str, str]]:
+        """원본 순서의 (단어, 뜻, 결과)"""
+        if self.source is None:
+            for card_id in range(len(self.words)):
+                yield self.words[card_id], self.meanings[card_id], self.result(card_id)
+            return
+
+        # 지연 로딩: 디코딩 캐시를 늘리지 않고 원본에서 바로 읽음
+        for card_id in range(len(self.results)):
+            word, meaning, result = self.source.fields(card_id)
+            if self.results[card_id] != RESULT_UNLOADED:
+                result = self.result(card_id)
+            yield word, meaning, result
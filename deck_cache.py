@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱 바이너리 캐시 공통 헤더
+- 캐시 파일은 덱 옆(<덱>.txt<접미사>) 또는 FLASHCARD_CACHE_DIR 디렉터리에 저장
+- 헤더: magic, 포맷 버전, 원본 크기, 원본 mtime_ns, 원본 내용 해시(blake2b)
+- 크기/mtime이 같으면 바로 사용, mtime만 다르면 내용 해시로 재확인
+- 사용처: deck_loader의 줄 오프셋 인덱스(.idx)와 파싱된 카드 캐시(.cache)
+"""
+
+import hashlib
+import os
+import struct
+from typing import Iterable, Optional
+
+CACHE_VERSION = 1
+CACHE_DIR_ENV = 'FLASHCARD_CACHE_DIR'
+
+# magic, 버전, 원본 크기, 원본 mtime_ns, 원본 해시
+_HEADER = struct.Struct('<4sHQq16s')
+_HASH_CHUNK = 1 << 20
+
+
+def cache_path(deck_path: str, suffix: str) -> str:
+    """덱에 대응하는 캐시 파일 경로 (캐시 디렉터리가 지정되면 그 안에)"""
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return deck_path + suffix
+
+    key = hashlib.blake2b(os.path.abspath(deck_path).encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, key + suffix)
+
+
+def content_hash(deck_path: str) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(deck_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(_HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def read_cache(deck_path: str, suffix: str, magic: bytes) -> Optional[memoryview]:
+    """유효한 캐시면 헤더를 제외한 본문을, 아니면 None을 반환 (한 번에 읽음)"""
+    path = cache_path(deck_path, suffix)
+    try:
+        stat = os.stat(deck_path)
+        with open(path, 'rb') as file:
+            data = file.read()
+    except OSError:
+        return None
+
+    if len(data) < _HEADER.size:
+        return None
+    cached_magic, version, size, mtime_ns, digest = _HEADER.unpack_from(data)
+    if cached_magic != magic or version != CACHE_VERSION or size != stat.st_size:
+        return None
+
+    # mtime만 바뀐 경우(복사, touch 등) 내용 해시가 같으면 캐시 유지
+    if mtime_ns != stat.st_mtime_ns:
+        if content_hash(deck_path) != digest:
+            return None
+        _touch_header(path, magic, stat, digest)
+
+    return memoryview(data)[_HEADER.size:]
+
+
+def write_cache(deck_path: str, suffix: str, magic: bytes, parts: Iterable[bytes]):
+    """캐시 파일을 원자적으로 기록 (실패는 무시 — 캐시는 없어도 동작)"""
+    path = cache_path(deck_path, suffix)
+    tmp_path = path + '.tmp'
+    try:
+        stat = os.stat(deck_path)
+        digest = content_hash(deck_path)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(tmp_path, 'wb') as file:
+            file.write(_HEADER.pack(magic, CACHE_VERSION, stat.st_size, stat.st_mtime_ns, digest))
+            for part in parts:
+                file.write(part)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _touch_header(path: str, magic: bytes, stat, digest: bytes):
+    try:
+        with open(path, 'r+b') as file:
+            file.write(_HEADER.pack(magic, CACHE_VERSION, stat.st_size, stat.st_mtime_ns, digest))
+    except OSError:
+        pass
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱 로더
+- MappedDeck: 파일 전체를 mmap하고 카드 줄의 바이트 오프셋 인덱스만 구성
+  * 오프셋 인덱스는 <덱>.txt.idx 캐시에 저장 (deck_cache 헤더로 유효성 확인)
+  * build_index=False로 열면 인덱스를 비워 두고 extend_index로 조금씩 채움 (백그라운드 로딩)
+- index_lines: 바이트 전체의 오프셋 인덱스 (폴더 세션의 작은 덱, deck_set)
+- iter_index_chunks: 오프셋 인덱스를 줄 경계에 맞춘 바이트 묶음 단위로 구성
+  * 단어/뜻/결과는 카드가 화면에 표시되거나 목록에 나올 때만 디코딩
+- load_rows: 파싱된 카드 전체를 <덱>.txt.cache 바이너리 캐시에서 한 번에 읽음
+- load_csv_rows: ver2 CSV 덱 (단어, 뜻…, [0|1]) 파싱
+"""
+
+import csv
+import mmap
+import os
+import struct
+from array import array
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from deck_cache import read_cache, write_cache
+
+DELIM = '\\'
+INDEX_SUFFIX = '.idx'
+INDEX_MAGIC = b'FCIX'
+CARDS_SUFFIX = '.cache'
+CARDS_MAGIC = b'FCDK'
+_COUNT = struct.Struct('<Q')
+INDEX_CHUNK = 1 << 22  # iter_index_chunks 기본 묶음 크기 (바이트)
+
+
+def _index_range(data, position: int, end: int, starts: array, ends: array):
+    """data[position:end]의 카드 줄 (시작, 끝) 오프셋을 starts/ends에 추가
+    카드 줄 = 백슬래시가 하나 이상 있는 줄 (load_cards의 건너뛰기 규칙과 동일)
+    줄마다 find로 개행과 백슬래시만 찾음 (정규식 역추적 없이 줄 길이와 무관하게 선형)"""
+    find = data.find
+    add_start, add_end = starts.append, ends.append
+    while position < end:
+        line_end = find(b'\n', position, end)
+        if line_end < 0:
+            line_end = end
+        if find(b'\\', position, line_end) >= 0:
+            add_start(position)
+            add_end(line_end)
+        position = line_end + 1
+
+
+def parse_line(line: str) -> Optional[Tuple[str, str, str]]:
+    """'단어\\뜻\\결과' 한 줄을 (단어, 뜻, 결과)로 분해, 카드가 아니면 None"""
+    line = line.strip()
+    if not line:
+        return None
+
+    parts = line.split(DELIM)
+    if len(parts) < 2:
+        return None
+
+    word = parts[0].strip()
+    meaning = parts[1].strip()
+    result = parts[2].strip() if len(parts) > 2 else ''
+    return word, meaning, result
+
+
+def index_lines(data) -> Tuple[array, array]:
+    """data(mmap/bytes) 전체의 카드 줄 (시작, 끝) 오프셋"""
+    starts, ends = array('q'), array('q')
+    _index_range(data, 0, len(data), starts, ends)
+    return starts, ends
+
+
+def iter_index_chunks(data, chunk_size: int = INDEX_CHUNK) -> Iterator[Tuple[array, array, int]]:
+    """data(mmap/bytes)의 카드 줄 (시작, 끝) 오프셋을 약 chunk_size 바이트씩 (starts, ends, 읽은 위치)로"""
+    size = len(data)
+    position = 0
+    while position < size:
+        cut = data.find(b'\n', min(position + chunk_size, size - 1))
+        cut = size if cut < 0 else cut + 1
+        starts, ends = array('q'), array('q')
+        _index_range(data, position, cut, starts, ends)
+        yield starts, ends, cut
+        position = cut
+
+
+def load_index(path: str) -> Optional[Tuple[array, array]]:
+    """<덱>.txt.idx 캐시의 (starts, ends), 없거나 낡았으면 None"""
+    body = read_cache(path, INDEX_SUFFIX, INDEX_MAGIC)
+    if body is None or len(body) < _COUNT.size:
+        return None
+
+    (count,) = _COUNT.unpack_from(body)
+    width = array('q').itemsize * count
+    body = body[_COUNT.size:]
+    if len(body) != width * 2:
+        return None
+    starts, ends = array('q'), array('q')
+    starts.frombytes(body[:width])
+    ends.frombytes(body[width:])
+    return starts, ends
+
+
+def save_index(path: str, starts: array, ends: array):
+    write_cache(path, INDEX_SUFFIX, INDEX_MAGIC, [_COUNT.pack(len(starts)), starts.tobytes(), ends.tobytes()])
+
+
+class MappedDeck:
+    """mmap된 덱 파일과 카드 줄 오프셋 인덱스"""
+
+    def __init__(self, path: str, build_index: bool = True):
+        self.path = path
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self.starts = array('q')  # 카드 ID → 줄 시작 오프셋
+        self.ends = array('q')    # 카드 ID → 줄 끝 오프셋 (개행 제외)
+        self.open(build_index)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def open(self, build_index: bool = True):
+        """파일을 mmap하고 오프셋 인덱스를 캐시에서 읽거나 새로 구성 (build_index=False면 비워 둠)"""
+        self._file = open(self.path, 'rb')
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self.starts, self.ends = array('q'), array('q')
+            return
+
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if not build_index:
+            self.starts, self.ends = array('q'), array('q')
+            return
+        if not self._load_index():
+            self._build_index()
+            self._save_index()
+
+    def extend_index(self, starts: array, ends: array):
+        """백그라운드에서 구성한 오프셋 묶음을 이어 붙임"""
+        self.starts.extend(starts)
+        self.ends.extend(ends)
+
+    def close(self):
+        """mmap 해제 (파일 교체 전에 호출)"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def fields(self, card_id: int) -> Tuple[str, str, str]:
+        """카드 한 장의 (단어, 뜻, 결과)를 디코딩"""
+        raw = self._map[self.starts[card_id]:self.ends[card_id]]
+        return parse_line(raw.decode('utf-8'))
+
+    def write_patched(self, file: BinaryIO, patches: Dict[int, str]):
+        """원본 바이트를 복사하되 patches의 카드 줄만 새 내용으로 교체"""
+        if self._map is None:
+            return
+
+        position = 0
+        for card_id in sorted(patches):
+            file.write(self._map[position:self.starts[card_id]])
+            file.write(patches[card_id].encode('utf-8'))
+            position = self.ends[card_id]
+        file.write(self._map[position:])
+
+    # ---------- 오프셋 인덱스 ----------
+    def _build_index(self):
+        self.starts, self.ends = index_lines(self._map)
+
+    def _load_index(self) -> bool:
+        loaded = load_index(self.path)
+        if loaded is None:
+            return False
+        self.starts, self.ends = loaded
+        return True
+
+    def _save_index(self):
+        save_index(self.path, self.starts, self.ends)
+
+
+def load_rows(deck_path: str) -> Iterable[Tuple[str, str, str]]:
+    """덱의 (단어, 뜻, 결과) 목록 — 캐시가 유효하면 파싱 없이 한 번에 읽음"""
+    body = read_cache(deck_path, CARDS_SUFFIX, CARDS_MAGIC)
+    if body is not None:
+        # 필드는 줄 단위 형식에서 왔으므로 개행을 포함하지 않음 → 개행으로 구분해 저장
+        try:
+            fields = str(body, 'utf-8').split('\n') if len(body) else []
+        except UnicodeDecodeError:
+            fields = None
+        if fields is not None and len(fields) % 3 == 0:
+            return zip(fields[0::3], fields[1::3], fields[2::3])
+
+    rows = []
+    with open(deck_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            row = parse_line(line)
+            if row is not None:
+                rows.append(row)
+
+    blob = '\n'.join(field for row in rows for field in row).encode('utf-8')
+    write_cache(deck_path, CARDS_SUFFIX, CARDS_MAGIC, [blob])
+    return rows
+
+
+def load_csv_rows(deck_path: str) -> List[Tuple[str, str, str]]:
+    """CSV 덱의 (단어, 뜻, 결과) 목록 — 마지막 칸이 0/1이면 결과, 뜻 칸이 여럿이면 ', '로 합침"""
+    rows = []
+    with open(deck_path, newline='', encoding='utf-8') as file:
+        for row in csv.reader(file):
+            if len(row) < 2:      # 단어 칸조차 없으면 skip
+                continue
+            word = row[0].strip()
+            maybe_result = row[-1].strip()
+            if maybe_result in ('0', '1'):
+                result = maybe_result
+                meaning_cells = row[1:-1]
+            else:
+                result = ''
+                meaning_cells = row[1:]
+            meaning = ', '.join(c.strip() for c in meaning_cells)
+            rows.append((word, meaning, result))
+    return rows
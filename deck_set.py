@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱 폴더 세션
+- 폴더 아래 모든 .txt 덱을 카드 저장소 원본 하나로 묶음
+  (카드 ID = 덱들을 경로 순서로 이어 붙인 위치, 덱 안에서는 원본 순서)
+- scan_deck: 프로세스 풀 작업 함수 — 파일 바이트와 카드 줄 오프셋을 함께 돌려줌
+  (단어/뜻 디코딩은 카드가 표시될 때만, 부모 프로세스는 bytes/array 언피클만 함)
+- MemoryDeck: MappedDeck과 같은 인터페이스를 bytes 위에 구현
+  (덱 수천 개를 열어도 파일 핸들/mmap을 잡고 있지 않음)
+- DeckSet: 카드 ID → (덱 번호, 덱 안의 카드 ID) 변환 (누적 오프셋 이분 탐색)
+- DeckView: 덱 하나만 보이는 카드 저장소 창 — ResultJournal.replay/compact를 덱 파일별로 그대로 사용
+- JournalSet: 덱별 ResultJournal 묶음 (ResultJournal 인터페이스, 채점은 카드가 속한 덱의 저널로)
+"""
+
+import bisect
+import os
+from array import array
+from typing import BinaryIO, Dict, Iterable, List, Tuple
+
+from card_store import CardStore
+from deck_loader import index_lines, parse_line
+from result_journal import JOURNAL_SUFFIX, ResultJournal
+
+DECK_SUFFIX = '.txt'
+
+
+def iter_deck_files(folder: str) -> List[str]:
+    """폴더 아래 .txt 덱 경로 (경로 순서, 숨김 폴더 제외)"""
+    paths = []
+    for current, dirs, files in os.walk(folder):
+        dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+        paths.extend(os.path.join(current, name) for name in sorted(files) if name.endswith(DECK_SUFFIX))
+    return paths
+
+
+def scan_deck(path: str) -> Tuple[str, bytes, array, array]:
+    """덱 파일 하나를 읽고 카드 줄 오프셋 구성 (프로세스 풀 작업 함수)"""
+    with open(path, 'rb') as file:
+        data = file.read()
+    starts, ends = index_lines(data)
+    return path, data, starts, ends
+
+
+class MemoryDeck:
+    """메모리에 읽어 둔 작은 덱 파일과 카드 줄 오프셋 인덱스"""
+
+    def __init__(self, path: str, data: bytes, starts: array, ends: array):
+        self.path = path
+        self._data = data
+        self.starts = starts  # 카드 ID → 줄 시작 오프셋
+        self.ends = ends      # 카드 ID → 줄 끝 오프셋 (개행 제외)
+
+    @classmethod
+    def read(cls, path: str) -> 'MemoryDeck':
+        return cls(*scan_deck(path))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def open(self):
+        """파일을 다시 읽음 (compact로 덱 파일이 교체된 뒤)"""
+        _, self._data, self.starts, self.ends = scan_deck(self.path)
+
+    def close(self):
+        self._data = b''
+
+    def fields(self, card_id: int) -> Tuple[str, str, str]:
+        return parse_line(self._data[self.starts[card_id]:self.ends[card_id]].decode('utf-8'))
+
+    def write_patched(self, file: BinaryIO, patches: Dict[int, str]):
+        """원본 바이트를 복사하되 patches의 카드 줄만 새 내용으로 교체"""
+        data = memoryview(self._data)
+        position = 0
+        for card_id in sorted(patches):
+            file.write(data[position:self.starts[card_id]])
+            file.write(patches[card_id].encode('utf-8'))
+            position = self.ends[card_id]
+        file.write(data[position:])
+
+
+class DeckSet:
+    """여러 덱을 이어 붙인 카드 저장소 원본"""
+
+    def __init__(self, folder: str):
+        self.path = folder
+        self.decks: List[MemoryDeck] = []
+        self.offsets = array('q', [0])  # 덱 번호 → 첫 카드 ID (마지막 = 전체 카드 수)
+
+    def add(self, deck: MemoryDeck):
+        self.decks.append(deck)
+        self.offsets.append(self.offsets[-1] + len(deck))
+
+    def __len__(self) -> int:
+        return self.offsets[-1]
+
+    def locate(self, card_id: int) -> Tuple[int, int]:
+        """카드 ID → (덱 번호, 덱 안의 카드 ID)"""
+        index = bisect.bisect_right(self.offsets, card_id) - 1
+        return index, card_id - self.offsets[index]
+
+    def deck_of(self, card_id: int) -> MemoryDeck:
+        return self.decks[self.locate(card_id)[0]]
+
+    def name(self, index: int) -> str:
+        """덱 이름 (폴더 기준 상대 경로, 확장자 제외)"""
+        return os.path.splitext(os.path.relpath(self.decks[index].path, self.path))[0]
+
+    def deck_name(self, card_id: int) -> str:
+        """카드가 속한 덱 이름"""
+        return self.name(self.locate(card_id)[0])
+
+    def fields(self, card_id: int) -> Tuple[str, str, str]:
+        index, local = self.locate(card_id)
+        return self.decks[index].fields(local)
+
+    def open(self):
+        pass  # 덱별 교체/재로딩은 DeckView가 처리
+
+    def close(self):
+        for deck in self.decks:
+            deck.close()
+
+
+class DeckView:
+    """카드 저장소에서 덱 하나만 보이는 창 (ResultJournal이 쓰는 부분만)"""
+
+    def __init__(self, store: CardStore, deck_set: DeckSet, index: int):
+        self.store = store
+        self.source = deck_set.decks[index]
+        self.offset = deck_set.offsets[index]
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def _dirty(self) -> List[int]:
+        end = self.offset + len(self.source)
+        return [card_id for card_id in self.store.dirty if self.offset <= card_id < end]
+
+    def set_result(self, card_id: int, result: str):
+        self.store.set_result(self.offset + card_id, result)
+
+    def write_to(self, file: BinaryIO):
+        patches = {card_id - self.offset: self.store.format_row(card_id) for card_id in self._dirty()}
+        self.source.write_patched(file, patches)
+
+    def mark_clean(self):
+        self.store.dirty.difference_update(self._dirty())
+
+
+class JournalSet:
+    """덱별 저널 묶음 — 레코드 위치는 각 덱 안의 카드 ID라 덱을 따로 열어도 그대로 재적용됨"""
+
+    def __init__(self, deck_set: DeckSet, compact_threshold: int = 500):
+        self.deck_set = deck_set
+        self.path = deck_set.path
+        self.compact_threshold = compact_threshold
+        self._journals: Dict[int, ResultJournal] = {}  # 덱 번호 → 저널 (채점한 덱만)
+
+    def _journal(self, index: int) -> ResultJournal:
+        journal = self._journals.get(index)
+        if journal is None:
+            journal = self._journals[index] = ResultJournal(self.deck_set.decks[index].path)
+        return journal
+
+    @property
+    def pending(self) -> int:
+        return sum(journal.pending for journal in list(self._journals.values()))
+
+    def needs_compaction(self) -> bool:
+        return self.pending >= self.compact_threshold
+
+    def append_many(self, records: Iterable[Tuple[int, str]]):
+        by_deck: Dict[int, List[Tuple[int, str]]] = {}
+        for card_id, result in records:
+            index, local = self.deck_set.locate(card_id)
+            by_deck.setdefault(index, []).append((local, result))
+        for index, deck_records in by_deck.items():
+            self._journal(index).append_many(deck_records)
+
+    def replay(self, store: CardStore) -> int:
+        applied = 0
+        for index, deck in enumerate(self.deck_set.decks):
+            if os.path.exists(deck.path + JOURNAL_SUFFIX):
+                applied += self._journal(index).replay(DeckView(store, self.deck_set, index))
+        return applied
+
+    def compact(self, store: CardStore):
+        """채점이 쌓인 덱 파일만 다시 씀"""
+        for index, journal in list(self._journals.items()):
+            if journal.pending:
+                journal.compact(DeckView(store, self.deck_set, index))
+
+    def close(self):
+        for journal in self._journals.values():
+            journal.close()
@@ -22,14 +22,16 @@ from __future__ import annotations
 
 import csv
 import datetime as dt
-import json
-import os
-import random
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox
 from typing import Dict, List, Tuple
 
+from deck_loader import load_csv_rows
+from progress_store import ProgressStore
+from sm2_scheduler import DueQueue
+from sqlite_store import DB_FILE, SqliteStore
+
 ######################## Internationalisation ###############################
 LANG_DATA = {
     "ko": {
@@ -73,6 +75,7 @@ LANG_DATA = {
 }
 ###############################################################################
 PROG_FILE = "progress.json"
+BACKEND = "json"             # "json" (progress.json) | "sqlite" (progress.db, sqlite_store.py)
 
 ######################## Spaced‑Repetition (SM‑2) ############################
 
@@ -123,9 +126,14 @@ class FlashcardApp(tk.Tk):
         # Data
         self.csv_path: Path | None = None
         self.cards: List[Tuple[str, str]] = []          # (word, meaning)
-        self.stats: Dict[str, CardStats] = {}
+        self.stats: Dict[str | int, CardStats] = {}      # json: 단어 → 통계, sqlite: cards.id → 통계
         self.results: Dict[str, int] = {}                # 1 = correct, 0 = wrong
-        self.deck: List[Tuple[str, str]] = []            # shuffled list (today‑due)
+        self.progress = ProgressStore(PROG_FILE)         # progress.json + 델타 로그
+        self.db = SqliteStore(DB_FILE) if BACKEND == "sqlite" else None
+        self.card_ids: List[int] = []                    # sqlite: card index → cards.id
+        self.csv_dirty = False                           # CSV 결과 열 갱신 필요 여부
+        self.queue = DueQueue()                          # card index → next_due bucket
+        self.deck: List[int] = []                        # card indices drawn this session
         self.idx: int = -1                               # pointer in deck
         self.showing_answer = False
 
@@ -181,7 +189,8 @@ class FlashcardApp(tk.Tk):
         self.bind("<F1>", lambda _: self.show_list())
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
-        self._load_progress()
+        if self.db is None:
+            self._load_progress()
 
     # ---------------- i18n ----------------
     def _t(self, key):
@@ -214,36 +223,43 @@ class FlashcardApp(tk.Tk):
         except Exception as e:
             messagebox.showerror(self._t("error_read"), str(e))
             return
-        for w, _ in self.cards:
-            self.stats.setdefault(w, CardStats())
+        self.queue = DueQueue()
+        if self.db is not None:
+            self._queue_due_from_db(path)
+        else:
+            for i, (w, _) in enumerate(self.cards):
+                self.queue.add(i, self.stats.setdefault(w, CardStats()).next_due)
+        self.deck = []
         self.restart_session()
 
     def _load_csv(self, path: Path):
         out = []
-        with path.open(newline='', encoding='utf-8') as f:
-            for row in csv.reader(f):
-                if len(row) < 2:      # 단어 칸조차 없으면 skip
-                    continue
-                word = row[0].strip()
-                # 맨 끝 셀이 0/1 이면 결과, 아니면 결과 없음
-                maybe_result = row[-1].strip()
-                if maybe_result in ('0', '1'):
-                    result = int(maybe_result)
-                    meaning_cells = row[1:-1]
-                else:
-                    result = None
-                    meaning_cells = row[1:]
-                meaning = ', '.join(c.strip() for c in meaning_cells)
-                out.append((word, meaning))
-                if result is not None:
-                    self.results[word] = result
+        for word, meaning, result in load_csv_rows(str(path)):
+            out.append((word, meaning))
+            if result:
+                self.results[word] = int(result)
         return out
 
+    def _queue_due_from_db(self, path: str):
+        """sqlite: 덱을 등록하고 오늘 만기 카드의 통계만 읽어 대기열 구성"""
+        deck_id, self.card_ids = self.db.import_deck(path, self.cards)
+        # 같은 단어라도 뜻이 다르면 다른 카드 → 통계는 단어가 아닌 card_id 기준
+        for card_id, pos, _, _, ef, interval, reps, next_due in self.db.due_cards(deck_id, dt.date.today()):
+            cs = self.stats[card_id] = CardStats(ef, interval, reps, next_due)
+            self.queue.add(pos, cs.next_due)
+
+    def _stats_key(self, i: int):
+        """카드 i의 self.stats 키 (sqlite: card_id, json: 단어)"""
+        return self.card_ids[i] if self.db is not None else self.cards[i][0]
+
     # ---------------- Session Deck ----------------
     def restart_session(self):
-        today = dt.date.today()
-        self.deck = [c for c in self.cards if self.stats[c[0]].next_due <= today]
-        random.shuffle(self.deck)
+        # 지난 세션에서 뽑았지만 채점하지 않은 카드는 대기열로 복귀
+        for i in self.deck:
+            if i not in self.queue:
+                self.queue.add(i, self.stats[self._stats_key(i)].next_due)
+        # 만기 카드는 next_card에서 대기열로부터 무작위로 하나씩 뽑음 (전체 필터링/셔플 없음)
+        self.deck = []
         self.idx = -1
         self.btn_prev.config(state=tk.DISABLED)
         self.btn_show.config(state=tk.NORMAL)
@@ -252,11 +268,14 @@ class FlashcardApp(tk.Tk):
         self.next_card()
 
     def next_card(self):
-        if not self.deck:
+        if not self.cards:
             return
         if self.idx >= len(self.deck) - 1:
-            self.finish_deck()
-            return
+            i = self.queue.draw(dt.date.today())
+            if i is None:
+                self.finish_deck()
+                return
+            self.deck.append(i)
         self.idx += 1
         self.show_current()
 
@@ -267,7 +286,7 @@ class FlashcardApp(tk.Tk):
 
     def show_current(self):
         self.showing_answer = False
-        w, _ = self.deck[self.idx]
+        w, _ = self.cards[self.deck[self.idx]]
         self.lbl_text.config(text=w)
         self.btn_correct.config(state=tk.DISABLED)
         self.btn_wrong.config(state=tk.DISABLED)
@@ -279,7 +298,7 @@ class FlashcardApp(tk.Tk):
         if not self.deck or self.idx < 0:
             return
         self.showing_answer = not self.showing_answer
-        word, meaning = self.deck[self.idx]
+        word, meaning = self.cards[self.deck[self.idx]]
         if self.showing_answer:
             self.lbl_text.config(text=meaning)
             self.btn_correct.config(state=tk.NORMAL)
@@ -292,11 +311,19 @@ class FlashcardApp(tk.Tk):
     def answer(self, quality: int):
         if not self.deck or self.idx < 0 or not self.showing_answer:
             return
-        word, _ = self.deck[self.idx]
-        cs = self.stats[word]
+        i = self.deck[self.idx]
+        word, _ = self.cards[i]
+        cs = self.stats[self._stats_key(i)]
         cs.ef, cs.interval, cs.reps = sm2_update(cs.ef, cs.interval, cs.reps, quality)
         cs.next_due = dt.date.today() + dt.timedelta(days=cs.interval)
-        self.results[word] = 1 if quality >= 3 else 0
+        self.queue.add(i, cs.next_due)                   # O(log D) 버킷 이동
+        # 새 결과를 먼저 반영해야 기록에도 이번 채점 결과가 남음 (처음 채점하는 카드도 포함)
+        result = self.results[word] = 1 if quality >= 3 else 0
+        if self.db is not None:
+            self.db.record_review(self.card_ids[i], cs.ef, cs.interval, cs.reps, cs.next_due, quality, result)
+        else:
+            self.progress.record(word, cs.to_json(), result)
+        self.csv_dirty = True
         # move to next automatically
         self.next_card()
 
@@ -311,30 +338,29 @@ class FlashcardApp(tk.Tk):
         self.update_progress()
 
     def update_progress(self):
-        total = len(self.deck) if self.deck else 0
+        # 뽑은 카드 + 아직 대기 중인 만기 카드 (채점된 카드는 미래 버킷에 있으므로 제외됨)
+        total = len(self.deck) + self.queue.count_due(dt.date.today()) if self.cards else 0
         done = self.idx + 1 if self.idx >= 0 else 0
         pct = done / total if total else 0
         self.lbl_progress.config(text=self._t("progress").format(done=done, total=total, pct=pct))
 
     # ---------------- List Popup (F1) ----------------
     def show_list(self):
-        if not self.deck:
+        if not self.cards:
             return
         win = tk.Toplevel(self)
         win.title(self._t("list_title"))
         win.geometry("300x400")
         box = tk.Listbox(win, font=("Helvetica", 12))
-        for w, m in self.deck:
+        for i in self.deck + self.queue.due_keys(dt.date.today()):
+            w, m = self.cards[i]
             box.insert(tk.END, f"{w} → {m}")
         box.pack(fill=tk.BOTH, expand=True)
 
     # ---------------- Persistence ----------------
     def _load_progress(self):
-        if not os.path.exists(PROG_FILE):
-            return
         try:
-            with open(PROG_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self.progress.load()
             self.stats = {w: CardStats.from_json(val) for w, val in data.get("stats", {}).items()}
             self.results = {w: int(v) for w, v in data.get("results", {}).items()}
         except Exception:
@@ -342,19 +368,22 @@ class FlashcardApp(tk.Tk):
             self.results = {}
 
     def _save_progress(self):
-        with open(PROG_FILE, "w", encoding="utf-8") as f:
-            payload = {
-                "stats": {w: s.to_json() for w, s in self.stats.items()},
-                "results": self.results,
-            }
-            json.dump(payload, f, ensure_ascii=False, indent=2)
-        # also update CSV 3rd column
-        if self.csv_path and self.cards:
+        # 바뀐 카드만 로그에 덧붙이고, 로그가 길어지면 전체 스냅샷으로 compact
+        # (sqlite 백엔드는 answer() 마다 이미 커밋됨)
+        if self.db is None:
+            self.progress.flush()
+            if self.progress.needs_compaction():
+                payload = {
+                    "stats": {w: s.to_json() for w, s in self.stats.items()},
+                    "results": self.results,
+                }
+                self.progress.compact(payload)
+        # also update CSV 3rd column (결과가 바뀐 경우에만)
+        if self.csv_path and self.cards and self.csv_dirty:
             tmp = self.csv_path.with_suffix(".tmp")
             with self.csv_path.open(newline="", encoding="utf-8") as fr, tmp.open("w", newline="", encoding="utf-8") as fw:
-                reader = list(csv.reader(fr))
                 writer = csv.writer(fw)
-                for row in reader:
+                for row in csv.reader(fr):
                     if len(row) < 2:
                         continue
                     word = row[0].strip()
@@ -366,10 +395,13 @@ class FlashcardApp(tk.Tk):
                             row.append(str(result))
                     writer.writerow(row)
             tmp.replace(self.csv_path)
+            self.csv_dirty = False
 
     # ---------------- Window close ----------------
     def on_close(self):
         self._save_progress()
+        if self.db is not None:
+            self.db.close()
         self.destroy()
 
 if __name__ == "__main__":
@@ -17,6 +17,8 @@ import os
 from pathlib import Path
 from typing import List, Dict, Optional
 
+from deck_loader import load_rows
+
 
 class FlashcardApp:
     def __init__(self, root):
@@ -198,25 +200,13 @@ class FlashcardApp:
         """파일에서 카드 데이터 로드"""
         cards = []
         
-        with open(file_path, 'r', encoding='utf-8') as file:
-            for line_num, line in enumerate(file, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                parts = line.split('\\')
-                if len(parts) < 2:
-                    continue
-                    
-                word = parts[0].strip()
-                meaning = parts[1].strip()
-                result = parts[2].strip() if len(parts) > 2 else ''
-                
-                cards.append({
-                    'word': word,
-                    'meaning': meaning,
-                    'result': result
-                })
+        # 파싱 결과는 덱 옆 바이너리 캐시(.cache)에서 재사용
+        for word, meaning, result in load_rows(file_path):
+            cards.append({
+                'word': word,
+                'meaning': meaning,
+                'result': result
+            })
         
         if not cards:
             raise ValueError("유효한 카드를 찾을 수 없습니다.")
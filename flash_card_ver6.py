@@ -17,6 +17,8 @@ import os
 from pathlib import Path
 from typing import List, Dict, Optional
 
+from deck_loader import load_rows
+
 
 class FlashcardApp:
     def __init__(self, root):
@@ -253,25 +255,13 @@ class FlashcardApp:
         """파일에서 카드 데이터 로드"""
         cards = []
         
-        with open(file_path, 'r', encoding='utf-8') as file:
-            for line_num, line in enumerate(file, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                parts = line.split('\\')
-                if len(parts) < 2:
-                    continue
-                    
-                word = parts[0].strip()
-                meaning = parts[1].strip()
-                result = parts[2].strip() if len(parts) > 2 else ''
-                
-                cards.append({
-                    'word': word,
-                    'meaning': meaning,
-                    'result': result
-                })
+        # 파싱 결과는 덱 옆 바이너리 캐시(.cache)에서 재사용
+        for word, meaning, result in load_rows(file_path):
+            cards.append({
+                'word': word,
+                'meaning': meaning,
+                'result': result
+            })
         
         if not cards:
             raise ValueError("유효한 카드를 찾을 수 없습니다.")
@@ -437,13 +427,8 @@ class FlashcardApp:
                 import shutil
                 shutil.copy2(self.file_path, backup_path)
             
-            # 원본 순서로 저장하기 위해 original_cards 사용
-            # 현재 카드의 결과를 original_cards에 반영
-            current_card = self.cards[self.current_index]
-            for orig_card in self.original_cards:
-                if orig_card['word'] == current_card['word'] and orig_card['meaning'] == current_card['meaning']:
-                    orig_card['result'] = current_card['result']
-                    break
+            # cards와 original_cards는 같은 카드 객체를 공유하므로
+            # 현재 카드의 결과는 이미 original_cards에 반영되어 있음
             
             # 새 내용으로 파일 쓰기
             with open(self.file_path, 'w', encoding='utf-8') as file:
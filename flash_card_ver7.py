@@ -3,44 +3,146 @@
 """
 플래시카드 학습 앱
 - Python 3.10+ 및 Tkinter 사용
-- UTF-8 인코딩 .txt 파일 지원
+- UTF-8 인코딩 .txt 파일 지원 (mmap 지연 로딩, 큰 덱도 즉시 표시)
+- 덱은 백그라운드 스레드에서 읽음: 첫 묶음이 오면 바로 학습, 나머지는 이어서 추가 (Esc: 취소)
+- 폴더 열기: 폴더 아래 모든 덱을 프로세스 풀로 읽어 한 세션으로 학습 (채점은 카드가 속한 덱 파일에 저장)
+- 덱 섞어 학습: 덱별 가중치/할당량으로 번갈아 출제, 학습 중에 바꿔도 다음 카드부터 바로 반영
 - 단어\뜻\결과 형식 (백슬래시 구분자)
 - 키보드 단축키 지원 (Space, 방향키, A, S)
 - 셔플 기능 토글 및 진행률 표시
-- 정답/오답 실시간 저장
+- 정답/오답 실시간 저장 (저장 스레드가 모아서 저널에 기록, 채점이 멈추면/종료 시 .txt로 compact)
 - 3D 카드 회전 애니메이션
+- 단어/뜻 검색 (Ctrl+F, 2-gram 색인을 덱 옆에 캐시)
+- 덱 백업: 세션당 한 번, 내용 주소 방식으로 여러 세대 보관 (파일 > 백업에서 복원)
+- 다시 열면 마지막 카드에서 이어서 (세션 스냅샷: 닫을 때/쉬는 동안 기록, 앱을 켜면 마지막 덱을 바로 엶)
+- 덱/세션/채점/저장 로직은 study_engine.StudyEngine (Tk 없음), 이 파일은 화면과 백그라운드 로딩만
+  (터미널 학습: python study_cli.py 덱.txt)
 """
 
 import tkinter as tk
-from tkinter import messagebox, filedialog, Menu
-import random
+from tkinter import messagebox, filedialog, simpledialog, Menu
+from tkinter import font as tkfont
 import os
 import math
+import queue
+import time
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Optional
 
+import palette
+import session_snapshot
+from background_loader import DeckLoader, FolderLoader
+from backup_store import describe, session_store
+from card_store import CardStore
+from deck_loader import MappedDeck
+from deck_set import DeckSet, JournalSet
+from result_journal import ResultJournal
+from study_engine import SEARCH_LIMIT, StudyEngine
 
-class FlashcardApp:
+LOAD_POLL_MS = 50  # 백그라운드 로딩 메시지 확인 간격 (밀리초)
+COMPACT_QUIET_MS = 2000  # 마지막 채점 후 이만큼 입력이 없으면 compact (밀리초)
+SNAPSHOT_IDLE_MS = 3000  # 위치가 바뀐 뒤 이만큼 입력이 없으면 세션 스냅샷 기록 (밀리초)
+
+
+class VirtualCardList:
+    """보이는 행만 그리는 카드 목록 — 스크롤할 때마다 해당 범위의 카드만 저장소에서 읽음"""
+    LINES_PER_ROW = 3  # 단어 줄, 뜻 줄, 빈 줄
+    WHEEL_ROWS = 3  # 마우스 휠 한 칸에 움직이는 카드 수
+    
+    def __init__(self, parent, store: CardStore, font=("맑은 고딕", 10)):
+        self.store = store
+        self.top = 0  # 맨 위에 보이는 카드의 위치
+        self.visible = 1  # 한 화면에 보이는 카드 수 (창 크기에 따라 갱신)
+        
+        frame = tk.Frame(parent)
+        frame.pack(fill='both', expand=True, padx=10, pady=10)
+        self.scrollbar = tk.Scrollbar(frame, orient='vertical', command=self.on_scrollbar)
+        self.scrollbar.pack(side='right', fill='y')
+        self.text = tk.Text(frame, wrap=tk.WORD, width=60, height=20, font=font, state='disabled')
+        self.text.pack(side='left', fill='both', expand=True)
+        self.row_height = tkfont.Font(font=font).metrics('linespace') * self.LINES_PER_ROW
+        
+        self.text.bind('<Configure>', self.on_resize)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.text.bind(sequence, self.on_wheel)
+        for sequence, rows in (('<Up>', -1), ('<Down>', 1), ('<Prior>', -20), ('<Next>', 20)):
+            self.text.bind(sequence, lambda event, rows=rows: self.scroll_by(rows))
+        self.render()
+        
+    def row_text(self, position: int) -> str:
+        word, meaning, result = self.store.card(position)
+        result_text = ""
+        if result == '1':
+            result_text = " ✓"
+        elif result == '0':
+            result_text = " ✗"
+        return f"{position + 1}. {word}{result_text}\n   → {meaning}\n\n"
+        
+    def render(self):
+        """top부터 한 화면 분량의 카드만 다시 그림"""
+        total = len(self.store.order)
+        last = min(self.top + self.visible, total)
+        self.text.config(state='normal')
+        self.text.delete('1.0', tk.END)
+        self.text.insert(tk.END, "".join(self.row_text(i) for i in range(self.top, last)))
+        self.text.config(state='disabled')
+        if total:
+            self.scrollbar.set(self.top / total, last / total)
+        else:
+            self.scrollbar.set(0, 1)
+        
+    def scroll_to(self, position: int):
+        """position번째 카드가 맨 위에 오도록 이동 (목록 끝을 넘지 않게 보정)"""
+        top = max(0, min(position, len(self.store.order) - self.visible))
+        if top != self.top:
+            self.top = top
+            self.render()
+        
+    def scroll_by(self, rows: int):
+        self.scroll_to(self.top + rows)
+        return 'break'
+        
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(int(float(amount) * len(self.store.order)))
+        elif action == 'scroll':
+            rows = int(amount) * (self.visible if unit == 'pages' else 1)
+            self.scroll_by(rows)
+        
+    def on_wheel(self, event):
+        up = event.num == 4 or getattr(event, 'delta', 0) > 0
+        return self.scroll_by(-self.WHEEL_ROWS if up else self.WHEEL_ROWS)
+        
+    def on_resize(self, event):
+        visible = max(1, event.height // self.row_height)
+        if visible != self.visible:
+            self.visible = visible
+            self.top = max(0, min(self.top, len(self.store.order) - visible))
+            self.render()
+
+
+class FlashcardApp(StudyEngine):
     def __init__(self, root):
+        super().__init__()
         self.root = root
         self.root.title("플래시카드 학습 앱")
         self.root.geometry("600x400")
         self.root.configure(bg='#f0f0f0')
         
-        # 데이터 관련 변수
-        self.cards: List[Dict] = []  # [{'word': str, 'meaning': str, 'result': str}, ...]
-        self.original_cards: List[Dict] = []  # 원본 순서 저장
-        self.current_index = 0
-        self.show_answer = False
-        self.file_path: Optional[str] = None
-        self.reverse_mode = False  # False: 단어→정답, True: 정답→단어
-        self.shuffle_enabled = False  # 셔플 활성화 여부
+        # 데이터 관련 변수 (덱/세션/저장 상태는 StudyEngine)
+        self.compact_timer = None  # 예약된 compact (root.after id)
+        self.snapshot_timer = None  # 예약된 세션 스냅샷 기록 (root.after id)
+        self.loading_deck: Optional[MappedDeck] = None  # 로딩 중인 덱 (오프셋을 묶음마다 추가)
+        self.list_window: Optional[tk.Toplevel] = None  # 열려 있는 카드 목록 창 (지금 덱을 보여줌)
         
         # 애니메이션 관련 변수
         self.is_animating = False
         self.animation_steps = 20  # 더 부드러운 애니메이션을 위해 증가
         self.animation_delay = 15  # 밀리초
         self.card_original_width = 560
+        self.keyframe_cache: Dict[int, tuple] = {}  # animation_steps → 키프레임 표
+        self.frame_size = (self.card_original_width, 200)  # 마지막으로 적용한 카드 크기
+        self.frame_shadow = palette.BACKGROUND  # 마지막으로 적용한 그림자 색
         
         # UI 설정
         self.setup_menu()
@@ -56,8 +158,11 @@ class FlashcardApp:
         file_menu = Menu(menubar, tearoff=0)
         menubar.add_cascade(label="파일", menu=file_menu)
         file_menu.add_command(label="열기(txt)...", command=self.open_file, accelerator="Ctrl+O")
+        file_menu.add_command(label="폴더 열기...", command=self.open_folder, accelerator="Ctrl+Shift+O")
+        file_menu.add_command(label="불러오기 취소", command=self.cancel_loading, accelerator="Esc")
+        file_menu.add_command(label="백업에서 복원...", command=self.restore_backup)
         file_menu.add_separator()
-        file_menu.add_command(label="종료", command=self.root.quit)
+        file_menu.add_command(label="종료", command=self.quit_app)
         
         # 학습 메뉴
         study_menu = Menu(menubar, tearoff=0)
@@ -66,8 +171,10 @@ class FlashcardApp:
         study_menu.add_separator()
         study_menu.add_command(label="방향 전환", command=self.toggle_direction, accelerator="Ctrl+T")
         study_menu.add_command(label="셔플 토글", command=self.toggle_shuffle, accelerator="Ctrl+S")
+        study_menu.add_command(label="덱 섞어 학습...", command=self.show_interleave_settings, accelerator="Ctrl+I")
         study_menu.add_separator()
         study_menu.add_command(label="카드 목록", command=self.show_card_list, accelerator="Ctrl+L")
+        study_menu.add_command(label="검색", command=self.focus_search, accelerator="Ctrl+F")
         
     def setup_ui(self):
         """UI 구성 요소 설정"""
@@ -105,6 +212,19 @@ class FlashcardApp:
         )
         self.shuffle_label.pack(side='left', padx=5)
         
+        # 검색 입력줄 (Enter: 다음 결과로 이동, Esc: 학습으로 돌아가기)
+        search_frame = tk.Frame(self.root, bg='#f0f0f0')
+        search_frame.pack(pady=(5, 0))
+        tk.Label(search_frame, text="검색:", font=("맑은 고딕", 10), bg='#f0f0f0', fg='#666666').pack(side='left')
+        self.search_entry = tk.Entry(search_frame, width=30, font=("맑은 고딕", 10))
+        self.search_entry.pack(side='left', padx=5)
+        # 입력 중인 글자가 창 전체 단축키(A, S, Space 등)로 처리되지 않도록 창 바인딩 제외
+        self.search_entry.bindtags((str(self.search_entry), 'Entry', 'all'))
+        self.search_entry.bind('<Return>', self.search_cards)
+        self.search_entry.bind('<Escape>', lambda e: self.root.focus_set())
+        self.search_label = tk.Label(search_frame, text="", font=("맑은 고딕", 10), bg='#f0f0f0', fg='#666666')
+        self.search_label.pack(side='left', padx=5)
+        
         # 카드 컨테이너 (3D 효과를 위한 중앙 정렬)
         self.card_container = tk.Frame(self.root, bg='#f0f0f0')
         self.card_container.pack(pady=20, padx=20, fill='both', expand=True)
@@ -245,14 +365,30 @@ class FlashcardApp:
         self.root.bind('<s>', lambda e: self.mark_wrong())
         self.root.bind('<S>', lambda e: self.mark_wrong())
         self.root.bind('<Control-o>', lambda e: self.open_file())
+        self.root.bind('<Control-O>', lambda e: self.open_folder())
         self.root.bind('<Control-r>', lambda e: self.restart_study())
         self.root.bind('<Control-l>', lambda e: self.show_card_list())
         self.root.bind('<Control-t>', lambda e: self.toggle_direction())
         self.root.bind('<Control-s>', lambda e: self.toggle_shuffle())
+        self.root.bind('<Control-f>', lambda e: self.focus_search())
+        self.root.bind('<Control-i>', lambda e: self.show_interleave_settings())
+        self.root.bind('<Escape>', lambda e: self.cancel_loading())
         
         # 포커스 설정 (키보드 이벤트 수신용)
         self.root.focus_set()
         
+    def reset(self):
+        """덱 상태 정리 — 이전 덱을 보여주던 카드 목록 창도 닫음 (닫힌 저장소를 읽지 않도록)"""
+        self.close_card_list()
+        super().reset()
+        
+    def quit_app(self):
+        """종료 (메뉴/창 닫기 공통): 로딩 취소, 스냅샷·남은 채점 저장 후 창 닫기"""
+        self.cancel_loading()
+        self.close()
+        self.root.quit()
+        self.root.destroy()
+        
     def open_file(self):
         """파일 열기"""
         file_path = filedialog.askopenfilename(
@@ -261,61 +397,174 @@ class FlashcardApp:
         )
         
         if file_path:
+            self.start_loading(file_path)
+            
+    def open_folder(self):
+        """폴더 열기 (폴더 아래 .txt 덱 전체를 한 세션으로)"""
+        folder = filedialog.askdirectory(title="플래시카드 폴더 선택")
+        if folder:
+            self.start_loading(folder)
+            
+    def start_loading(self, file_path: str):
+        """백그라운드 스레드로 덱(또는 덱 폴더) 읽기 시작 (UI 스레드는 root.after로 진행 상황만 확인)"""
+        self.cancel_loading()
+        folder = os.path.isdir(file_path)
+        try:
+            deck = DeckSet(file_path) if folder else MappedDeck(file_path, build_index=False)
+        except Exception as e:
+            messagebox.showerror("오류", f"파일을 열 수 없습니다:\n{str(e)}")
+            return
+            
+        # 이전 덱의 저널을 먼저 반영하고 닫기
+        self.close()
+        
+        self.loading_deck = deck
+        self.loader = FolderLoader(file_path) if folder else DeckLoader(file_path)
+        self.loader.start()
+        self.progress_label.config(text="불러오는 중... (Esc: 취소)")
+        self.root.after(LOAD_POLL_MS, self.poll_loader, self.loader)
+        
+    def poll_loader(self, loader: DeckLoader):
+        """작업 스레드가 보낸 메시지를 처리 (취소된 로더의 남은 메시지는 무시)"""
+        if loader is not self.loader:
+            return
+        while True:
             try:
-                self.load_cards(file_path)
-                self.file_path = file_path
-                self.restart_study()
-                messagebox.showinfo("성공", f"파일을 성공적으로 열었습니다!\n총 {len(self.cards)}개의 카드가 로드되었습니다.")
-            except Exception as e:
-                messagebox.showerror("오류", f"파일을 열 수 없습니다:\n{str(e)}")
-                
-    def load_cards(self, file_path: str):
-        """파일에서 카드 데이터 로드"""
-        cards = []
-        
-        with open(file_path, 'r', encoding='utf-8') as file:
-            for line_num, line in enumerate(file, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                parts = line.split('\\')
-                if len(parts) < 2:
-                    continue
-                    
-                word = parts[0].strip()
-                meaning = parts[1].strip()
-                result = parts[2].strip() if len(parts) > 2 else ''
+                message = loader.messages.get_nowait()
+            except queue.Empty:
+                break
                 
-                cards.append({
-                    'word': word,
-                    'meaning': meaning,
-                    'result': result
-                })
-        
-        if not cards:
-            raise ValueError("유효한 카드를 찾을 수 없습니다.")
+            kind = message[0]
+            if kind == "cards":
+                self.receive_cards(*message[1:])
+            elif kind == "decks":
+                self.receive_decks(*message[1:])
+            elif kind == "indexing":
+                self.progress_label.config(text=f"{self.progress_text()}  (검색 색인 {message[1] * 100 // max(message[2], 1)}%)")
+            elif kind == "index":
+                self.search_index = message[1]
+            elif kind == "done":
+                self.finish_loading()
+                return
+            elif kind == "error":
+                self.discard_loading()
+                messagebox.showerror("오류", f"파일을 열 수 없습니다:\n{str(message[1])}")
+                return
+            elif kind == "cancelled":
+                return
+        self.root.after(LOAD_POLL_MS, self.poll_loader, loader)
+        
+    def receive_cards(self, starts, ends, scanned: int, total: int):
+        """카드 오프셋 묶음 반영 — 첫 묶음이 오면 바로 학습 시작"""
+        self.loading_deck.extend_index(starts, ends)
+        self.grow_store(scanned, total)
+        
+    def receive_decks(self, decks, scanned: int, total: int):
+        """폴더 로딩: 읽은 덱 파일 묶음 반영"""
+        for deck in decks:
+            self.loading_deck.add(deck)
+        self.grow_store(scanned, total)
+        
+    def grow_store(self, scanned: int, total: int):
+        """로딩 중인 원본에 새로 들어온 카드를 학습 순서 끝에 추가"""
+        deck = self.loading_deck
+        if self.file_path is None:
+            if not len(deck):
+                return
+            self.store = CardStore.from_source(deck)
+            self.file_path = self.loader.path
+            # 폴더 세션은 덱 파일별 저널 (채점은 카드가 속한 덱 파일에 반영)
+            self.open_journal(JournalSet(deck) if isinstance(deck, DeckSet) else ResultJournal(self.file_path))
+            self.restart_study()
+        else:
+            self.store.extend_source(len(deck) - len(self.store))
+        if scanned < total:
+            self.progress_label.config(text=f"{self.progress_text()}  (불러오는 중 {scanned * 100 // total}%)")
+        else:
+            self.progress_label.config(text=self.progress_text())
+            
+    def finish_loading(self):
+        """로딩 완료: 저널 재적용(크래시 복구), 남은 카드 셔플, 완료 안내"""
+        self.loader = None
+        self.loading_deck = None
+        if not self.store:
+            self.discard_loading()
+            messagebox.showerror("오류", "파일을 열 수 없습니다:\n유효한 카드를 찾을 수 없습니다.")
+            return
+            
+        # 로딩 중 채점한 결과도 저널 끝에 있으므로 순서대로 재적용하면 최신 값이 남음
+        if not self.flush_results():
+            return
+        if self.journal.replay(self.store):
+            self.compact_results()
+        if self.resume_snapshot():
+            self.update_shuffle_labels()
+        elif self.shuffle_enabled:
+            self.store.shuffle(self.current_index + 1)
+        self.update_display()
+        messagebox.showinfo("성공", f"파일을 성공적으로 열었습니다!\n총 {len(self.store)}개의 카드가 로드되었습니다.")
         
-        # 원본 순서 저장
-        self.original_cards = cards.copy()
-        self.cards = cards
+    def cancel_loading(self):
+        """진행 중인 로딩을 취소하고 일부만 읽은 덱을 닫음"""
+        if self.loader is None:
+            return
+        self.loader.cancel()
+        self.discard_loading()
+        self.progress_label.config(text="불러오기를 취소했습니다")
+        
+    def discard_loading(self):
+        """로딩 중이던 덱 정리 (로딩 중 채점 결과는 저널에 남아 다음에 열 때 반영)"""
+        self.loader = None
+        self.reset()
+        if self.loading_deck is not None:
+            self.loading_deck.close()
+        self.loading_deck = None
+        self.progress_label.config(text="파일을 열어주세요")
+        
+    def restore_backup(self):
+        """덱을 백업 세대로 되돌린 뒤 다시 열기 (지금 내용도 세대로 남아 다시 되돌릴 수 있음)"""
+        deck_path = self.current_deck_path()
+        if not deck_path:
+            messagebox.showwarning("경고", "먼저 파일을 열어주세요.")
+            return
+        backups = session_store()
+        generations = backups.generations(deck_path)
+        if not generations:
+            messagebox.showinfo("백업에서 복원", "이 덱의 백업이 없습니다.")
+            return
+            
+        listing = "\n".join(f"{number}. {describe(generation)}" for number, generation in enumerate(generations, 1))
+        number = simpledialog.askinteger(
+            "백업에서 복원", f"{os.path.basename(deck_path)}\n복원할 세대 번호 (1 = 최신)\n\n{listing}",
+            parent=self.root, minvalue=1, maxvalue=len(generations))
+        if number is None:
+            return
+            
+        # 채점 결과를 먼저 .txt에 반영 (반영하지 못하면 저널이 복원된 덱에 잘못 적용되므로 중단)
+        file_path = self.file_path
+        self.cancel_loading()
+        self.compact_results()
+        if self.journal is not None and self.journal.pending:
+            return
+        self.close()
+        try:
+            backups.restore(deck_path, number)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("오류", f"백업을 복원할 수 없습니다:\n{str(e)}")
+        self.start_loading(file_path)
         
     def restart_study(self):
         """학습 재시작 (셔플 설정에 따라)"""
-        if not self.cards:
+        if not self.store:
             messagebox.showwarning("경고", "먼저 파일을 열어주세요.")
             return
         
-        # 셔플 설정에 따라 카드 순서 결정
-        if self.shuffle_enabled:
-            self.cards = self.original_cards.copy()
-            random.shuffle(self.cards)
-        else:
-            self.cards = self.original_cards.copy()
-        
-        # 초기 상태 설정
-        self.current_index = 0
-        self.show_answer = False
+        # 덱 섞어 학습 중이면 같은 설정으로 세션을 새로 시작
+        if self.session is not None:
+            self.start_interleaved()
+            return
+            
+        self.reset_order()
         
         # UI 업데이트
         self.update_display()
@@ -323,13 +572,21 @@ class FlashcardApp:
         
     def toggle_shuffle(self):
         """셔플 기능 토글"""
-        if not self.cards:
+        if not self.store:
             messagebox.showwarning("경고", "먼저 파일을 열어주세요.")
             return
         
         self.shuffle_enabled = not self.shuffle_enabled
+        self.update_shuffle_labels()
         
-        # 버튼 및 라벨 업데이트
+        # 즉시 재시작하여 설정 적용
+        self.restart_study()
+        
+        status_text = "활성화" if self.shuffle_enabled else "비활성화"
+        messagebox.showinfo("셔플 토글", f"셔플 기능이 {status_text}되었습니다.\n카드 순서가 재설정되었습니다.")
+        
+    def update_shuffle_labels(self):
+        """셔플 버튼 및 라벨 업데이트"""
         if self.shuffle_enabled:
             self.shuffle_btn.config(text="셔플 OFF", bg='#ff9800')
             self.shuffle_label.config(text="셔플: ON", fg='#ff9800')
@@ -337,29 +594,108 @@ class FlashcardApp:
             self.shuffle_btn.config(text="셔플 ON", bg='#2196F3')
             self.shuffle_label.config(text="셔플: OFF", fg='#666666')
         
-        # 즉시 재시작하여 설정 적용
+    def start_interleaved(self):
+        """덱 섞어 학습 시작 (설정 창/재시작)"""
+        try:
+            self.start_session()
+        except ValueError as e:
+            messagebox.showwarning("경고", str(e))
+            return
+        self.update_display()
+        self.enable_buttons()
+        
+    def stop_interleaved(self):
+        """덱 섞어 학습 종료 → 전체 카드 순서로 재시작"""
+        self.session = None
         self.restart_study()
         
-        status_text = "활성화" if self.shuffle_enabled else "비활성화"
-        messagebox.showinfo("셔플 토글", f"셔플 기능이 {status_text}되었습니다.\n카드 순서가 재설정되었습니다.")
+    def show_interleave_settings(self):
+        """덱별 가중치/할당량 설정 창 (적용하면 진행 중인 세션의 다음 카드부터 반영)"""
+        deck_set = self.store.source
+        if not isinstance(deck_set, DeckSet):
+            messagebox.showwarning("경고", "먼저 폴더를 열어주세요.")
+            return
+        names = [deck_set.name(index) for index in range(len(deck_set.decks))]
+        
+        window = tk.Toplevel(self.root)
+        window.title("덱 섞어 학습")
+        window.geometry("460x420")
+        window.configure(bg='#f0f0f0')
+        
+        listbox = tk.Listbox(window, font=("맑은 고딕", 10), exportselection=False)
+        listbox.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        def row(index: int) -> str:
+            weight, quota = self.deck_settings(names[index])
+            cards = deck_set.offsets[index + 1] - deck_set.offsets[index]
+            limit = "전부" if quota is None else f"{quota}장"
+            return f"{names[index]}  ({cards}장)  가중치 {weight:g}, 할당량 {limit}"
+            
+        for index in range(len(names)):
+            listbox.insert(tk.END, row(index))
+            
+        edit_frame = tk.Frame(window, bg='#f0f0f0')
+        edit_frame.pack(fill='x', padx=10)
+        tk.Label(edit_frame, text="가중치:", bg='#f0f0f0').pack(side='left')
+        weight_entry = tk.Entry(edit_frame, width=6)
+        weight_entry.pack(side='left', padx=5)
+        tk.Label(edit_frame, text="할당량(빈칸 = 전부):", bg='#f0f0f0').pack(side='left')
+        quota_entry = tk.Entry(edit_frame, width=6)
+        quota_entry.pack(side='left', padx=5)
+        
+        def select(event=None):
+            selection = listbox.curselection()
+            if not selection:
+                return
+            weight, quota = self.deck_settings(names[selection[0]])
+            weight_entry.delete(0, tk.END)
+            weight_entry.insert(0, f"{weight:g}")
+            quota_entry.delete(0, tk.END)
+            if quota is not None:
+                quota_entry.insert(0, str(quota))
+                
+        def apply(event=None):
+            selection = listbox.curselection()
+            if not selection:
+                return
+            try:
+                weight = float(weight_entry.get())
+                quota = int(quota_entry.get()) if quota_entry.get().strip() else None
+                if weight < 0 or (quota is not None and quota < 0):
+                    raise ValueError
+            except ValueError:
+                messagebox.showwarning("경고", "가중치는 0 이상의 수, 할당량은 0 이상의 정수로 입력하세요.", parent=window)
+                return
+            index = selection[0]
+            self.deck_weights[names[index]] = (weight, quota)
+            if self.session is not None:
+                self.session.set_weight(index, weight)
+                self.session.set_quota(index, quota)
+                self.progress_label.config(text=self.progress_text())
+            listbox.delete(index)
+            listbox.insert(index, row(index))
+            listbox.selection_set(index)
+            
+        listbox.bind('<<ListboxSelect>>', select)
+        weight_entry.bind('<Return>', apply)
+        quota_entry.bind('<Return>', apply)
+        tk.Button(edit_frame, text="적용", command=apply).pack(side='left', padx=5)
+        
+        button_frame = tk.Frame(window, bg='#f0f0f0')
+        button_frame.pack(fill='x', padx=10, pady=10)
+        tk.Button(button_frame, text="이 설정으로 섞어 학습 시작", command=self.start_interleaved).pack(side='left')
+        tk.Button(button_frame, text="섞어 학습 끝내기", command=self.stop_interleaved).pack(side='left', padx=5)
         
     def update_display(self):
         """현재 카드 표시 업데이트"""
-        if not self.cards:
+        if not self.store:
             return
             
-        current_card = self.cards[self.current_index]
-        
         # 방향에 따라 질문과 답안 결정
-        if self.reverse_mode:
-            question = current_card['meaning']
-            answer = current_card['word']
-        else:
-            question = current_card['word']
-            answer = current_card['meaning']
+        question, answer, result = self.current_card()
         
         # 진행률 업데이트
-        self.progress_label.config(text=f"{self.current_index + 1}/{len(self.cards)}")
+        self.progress_label.config(text=self.progress_text())
         
         # 방향 표시 업데이트
         direction_text = "정답 → 단어" if self.reverse_mode else "단어 → 정답"
@@ -369,278 +705,264 @@ class FlashcardApp:
         if not self.is_animating:
             if self.show_answer:
                 display_text = f"Q: {question}\n\nA: {answer}"
-                self.card_label.config(text=display_text, fg='#0066cc')
-                self.card_frame.config(bg='#f0f8ff')  # 답안 상태 배경색
+                self.card_label.config(text=display_text, fg=palette.TEXT_ANSWER)
+                self.card_frame.config(bg=palette.CARD_ANSWER)  # 답안 상태 배경색
                 self.toggle_btn.config(text="질문 보기 (Space)")
             else:
                 display_text = f"Q: {question}\n\n(Space를 눌러 답안 확인)"
-                self.card_label.config(text=display_text, fg='#333333')
-                self.card_frame.config(bg='white')  # 질문 상태 배경색
+                self.card_label.config(text=display_text, fg=palette.TEXT)
+                self.card_frame.config(bg=palette.CARD)  # 질문 상태 배경색
                 self.toggle_btn.config(text="답안 보기 (Space)")
         
         # 결과 표시 (테두리 색상으로) - 애니메이션 중이 아닐 때만
         if not self.is_animating:
-            result = current_card['result']
-            if result == '1':
-                self.card_frame.config(relief='raised', bd=3, highlightbackground='#4CAF50', highlightthickness=2)
-            elif result == '0':
-                self.card_frame.config(relief='raised', bd=3, highlightbackground='#f44336', highlightthickness=2)
-            else:
-                self.card_frame.config(relief='raised', bd=3, highlightbackground='#cccccc', highlightthickness=0)
+            border_color, border_width = palette.result_border(result)
+            self.card_frame.config(relief='raised', bd=3, highlightbackground=border_color, highlightthickness=border_width)
             
     def toggle_answer(self):
         """답안 토글 (3D 회전 애니메이션 효과)"""
-        if not self.cards or self.is_animating:
+        if not self.store or self.is_animating:
             return
         
         self.animate_card_flip()
         
     def animate_card_flip(self):
-        """3D 카드 회전 애니메이션"""
+        """3D 카드 회전 애니메이션 (앞면 접기 → 내용 전환 → 뒷면 펼치기)"""
         self.is_animating = True
         
-        # 첫 번째 단계: 카드 좌측으로 회전 (앞면 숨기기)
-        self.animate_rotation(0, True)
-        
-    def animate_rotation(self, step, shrinking=True):
-        """카드 회전 애니메이션 (3D 원근 효과)"""
-        if shrinking:
-            # 회전 각도 (0도 → 90도)
-            angle = (step / self.animation_steps) * (math.pi / 2)
-            
-            # 3D 원근 효과: cos(angle)로 가로 크기 계산
-            scale_x = math.cos(angle)
-            
-            # 음수가 되지 않도록 최소값 설정
-            if scale_x < 0:
-                scale_x = 0
-            
-            # 카드 크기 조정
-            new_width = int(self.card_original_width * scale_x)
-            if new_width < 5:
-                new_width = 5
-            
-            self.card_frame.config(width=new_width)
-            
-            # 깊이감을 위한 그림자 효과
-            shadow_intensity = 1.0 - scale_x
-            shadow_color = self.blend_colors('#f0f0f0', '#cccccc', shadow_intensity)
-            self.card_container.config(bg=shadow_color)
-            
-            # 원근 효과를 위한 약간의 세로 크기 변화
-            height_scale = 0.95 + (0.05 * scale_x)
-            new_height = int(200 * height_scale)
-            self.card_frame.config(height=new_height)
-            
-            if step >= self.animation_steps:
-                # 답안 상태 토글
-                self.show_answer = not self.show_answer
-                self.update_card_content()
-                # 두 번째 단계: 카드 확대 (뒷면 보이기)
-                self.animate_rotation(0, False)
-                return
-            
-            # 다음 단계
-            self.root.after(self.animation_delay, lambda: self.animate_rotation(step + 1, True))
-            
-        else:
-            # 회전 각도 (90도 → 0도)
-            angle = ((self.animation_steps - step) / self.animation_steps) * (math.pi / 2)
-            
-            # 3D 원근 효과
-            scale_x = math.cos(angle)
-            
-            if scale_x < 0:
-                scale_x = 0
-            
-            # 카드 크기 조정
-            new_width = int(self.card_original_width * scale_x)
-            if new_width < 5:
-                new_width = 5
-            
-            self.card_frame.config(width=new_width)
-            
-            # 그림자 효과
-            shadow_intensity = 1.0 - scale_x
-            shadow_color = self.blend_colors('#f0f0f0', '#cccccc', shadow_intensity)
-            self.card_container.config(bg=shadow_color)
-            
-            # 세로 크기 변화
-            height_scale = 0.95 + (0.05 * scale_x)
-            new_height = int(200 * height_scale)
-            self.card_frame.config(height=new_height)
-            
-            if step >= self.animation_steps:
-                # 애니메이션 완료
-                self.is_animating = False
-                self.card_frame.config(width=self.card_original_width, height=200)
-                self.card_container.config(bg='#f0f0f0')
-                self.update_display()
-                return
-            
-            # 다음 단계
-            self.root.after(self.animation_delay, lambda: self.animate_rotation(step + 1, False))
-    
-    def blend_colors(self, color1, color2, ratio):
-        """두 색상을 블렌드하는 함수"""
-        def hex_to_rgb(hex_color):
-            hex_color = hex_color.lstrip('#')
-            return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        
-        def rgb_to_hex(rgb):
-            return '#%02x%02x%02x' % rgb
+        # 접는 구간은 키프레임 표 그대로, 펼치는 구간은 역순으로 재생
+        frames = self.flip_keyframes()
+        self.flip_frames = frames + frames[::-1]
+        self.flip_turn = len(frames)  # 이 프레임부터 뒷면
+        self.flip_turned = False
+        self.flip_start = time.monotonic()
+        self.animate_rotation()
+        
+    def flip_keyframes(self):
+        """animation_steps 설정별 (너비, 높이, 그림자 색) 키프레임 표 — 설정마다 한 번만 계산"""
+        frames = self.keyframe_cache.get(self.animation_steps)
+        if frames is not None:
+            return frames
+        
+        # 회전 각도 (0도 → 90도), 3D 원근 효과: cos(angle)로 가로 크기 계산
+        scales = [max(math.cos((step / self.animation_steps) * (math.pi / 2)), 0)
+                  for step in range(self.animation_steps + 1)]
+        
+        # 깊이감을 위한 그림자 효과 (1 - cos(angle) 비율의 팔레트 램프, 팔레트에서 캐시)
+        shadows = palette.ramp(palette.BACKGROUND, palette.SHADOW, tuple(1.0 - scale_x for scale_x in scales))
+        
+        # 카드 크기 (가로는 최소 5px, 세로는 원근 효과로 약간만 변화)
+        frames = tuple(
+            (max(int(self.card_original_width * scale_x), 5), int(200 * (0.95 + (0.05 * scale_x))), shadow_color)
+            for scale_x, shadow_color in zip(scales, shadows)
+        )
+        self.keyframe_cache[self.animation_steps] = frames
+        return frames
+        
+    def animate_rotation(self):
+        """카드 회전 애니메이션 한 틱 (모노토닉 시계 기준, 늦으면 프레임을 건너뛰어 제시간에 끝남)"""
+        delay = self.animation_delay / 1000
+        index = int((time.monotonic() - self.flip_start) / delay)
+        
+        if index >= self.flip_turn and not self.flip_turned:
+            # 답안 상태 토글 (90도 지점)
+            self.flip_turned = True
+            self.show_answer = not self.show_answer
+            self.update_card_content()
+        
+        if index >= len(self.flip_frames):
+            # 애니메이션 완료
+            self.is_animating = False
+            self.apply_frame(self.card_original_width, 200, palette.BACKGROUND)
+            self.update_display()
+            return
         
-        rgb1 = hex_to_rgb(color1)
-        rgb2 = hex_to_rgb(color2)
+        self.apply_frame(*self.flip_frames[index])
         
-        blended = tuple(int(rgb1[i] * (1 - ratio) + rgb2[i] * ratio) for i in range(3))
-        return rgb_to_hex(blended)
+        # 다음 프레임 예정 시각까지 대기 (지연이 누적되지 않도록 시작 시각 기준으로 계산)
+        next_time = self.flip_start + (index + 1) * delay
+        wait_ms = max(1, round((next_time - time.monotonic()) * 1000))
+        self.root.after(wait_ms, self.animate_rotation)
         
+    def apply_frame(self, width, height, shadow_color):
+        """카드 크기/그림자 색 적용 (이전 프레임과 같은 값이면 Tk 호출 생략)"""
+        if (width, height) != self.frame_size:
+            self.card_frame.config(width=width, height=height)
+            self.frame_size = (width, height)
+        if shadow_color != self.frame_shadow:
+            self.card_container.config(bg=shadow_color)
+            self.frame_shadow = shadow_color
+    
     def update_card_content(self):
         """카드 내용만 업데이트 (애니메이션 중 사용)"""
-        if not self.cards:
+        if not self.store:
             return
             
-        current_card = self.cards[self.current_index]
-        
         # 방향에 따라 질문과 답안 결정
-        if self.reverse_mode:
-            question = current_card['meaning']
-            answer = current_card['word']
-        else:
-            question = current_card['word']
-            answer = current_card['meaning']
+        question, answer, result = self.current_card()
         
         # 카드 내용 업데이트
         if self.show_answer:
             display_text = f"Q: {question}\n\nA: {answer}"
-            self.card_label.config(text=display_text, fg='#0066cc')
-            self.card_frame.config(bg='#f0f8ff')
+            self.card_label.config(text=display_text, fg=palette.TEXT_ANSWER)
+            self.card_frame.config(bg=palette.CARD_ANSWER)
             self.toggle_btn.config(text="질문 보기 (Space)")
         else:
             display_text = f"Q: {question}\n\n(Space를 눌러 답안 확인)"
-            self.card_label.config(text=display_text, fg='#333333')
-            self.card_frame.config(bg='white')
+            self.card_label.config(text=display_text, fg=palette.TEXT)
+            self.card_frame.config(bg=palette.CARD)
             self.toggle_btn.config(text="답안 보기 (Space)")
         
     def prev_card(self):
         """이전 카드"""
-        if not self.cards or self.is_animating:
+        if not self.store or self.is_animating:
             return
             
-        if self.current_index > 0:
-            self.current_index -= 1
-            self.show_answer = False
+        if self.back():
             self.update_display()
             
     def next_card(self):
         """다음 카드"""
-        if not self.cards or self.is_animating:
+        if not self.store or self.is_animating:
             return
             
-        if self.current_index < len(self.cards) - 1:
-            self.current_index += 1
-            self.show_answer = False
+        if self.advance():
             self.update_display()
         else:
             messagebox.showinfo("완료", "모든 카드를 학습했습니다!")
             
     def mark_correct(self):
         """정답 처리"""
-        if not self.cards or self.is_animating:
+        if not self.store or self.is_animating:
             return
             
-        self.cards[self.current_index]['result'] = '1'
-        self.save_results()
+        self.grade('1')
         self.update_display()
         
     def mark_wrong(self):
         """오답 처리"""
-        if not self.cards or self.is_animating:
+        if not self.store or self.is_animating:
             return
             
-        self.cards[self.current_index]['result'] = '0'
-        self.save_results()
+        self.grade('0')
         self.update_display()
         
     def toggle_direction(self):
         """학습 방향 전환 (단어→정답 ↔ 정답→단어)"""
-        if not self.cards:
+        if not self.store:
             messagebox.showwarning("경고", "먼저 파일을 열어주세요.")
             return
             
         self.reverse_mode = not self.reverse_mode
         self.show_answer = False  # 답안 숨기기
+        self.schedule_snapshot()
         self.update_display()
         
         direction_text = "정답 → 단어" if self.reverse_mode else "단어 → 정답"
         messagebox.showinfo("방향 전환", f"학습 방향이 '{direction_text}'로 변경되었습니다.")
     
-    def save_results(self):
-        """결과를 파일에 저장"""
-        if not self.file_path:
+    def report_error(self, title: str, message: str):
+        messagebox.showerror(title, message)
+        
+    def schedule_compaction(self):
+        """저널이 충분히 쌓이면 채점이 잠시 멈췄을 때 .txt로 반영 (키 반복 중에는 미룸)"""
+        self.cancel_compaction()
+        self.compact_timer = self.root.after(COMPACT_QUIET_MS, self.compact_results)
+        
+    def cancel_compaction(self):
+        if self.compact_timer is not None:
+            self.root.after_cancel(self.compact_timer)
+            self.compact_timer = None
+            
+    def compact_results(self):
+        # 직접 호출(닫기/로딩 완료)이면 예약된 compact가 나중에 또 돌지 않도록 취소
+        self.cancel_compaction()
+        super().compact_results()
+        
+    def schedule_snapshot(self):
+        """위치가 바뀌면 입력이 잠시 멈췄을 때 세션 스냅샷 기록 (키 반복 중에는 미룸)"""
+        if self.snapshot_timer is not None:
+            self.root.after_cancel(self.snapshot_timer)
+        self.snapshot_timer = self.root.after(SNAPSHOT_IDLE_MS, self.save_snapshot)
+        
+    def save_snapshot(self):
+        if self.snapshot_timer is not None:
+            self.root.after_cancel(self.snapshot_timer)
+            self.snapshot_timer = None
+        super().save_snapshot()
+        
+    def open_last_session(self):
+        """앱 시작: 마지막으로 학습한 덱을 열어 스냅샷 위치에서 이어서"""
+        path = session_snapshot.last_deck()
+        if path:
+            self.start_loading(path)
+        
+    def focus_search(self):
+        """검색 입력줄로 포커스 이동"""
+        self.search_entry.focus_set()
+        self.search_entry.select_range(0, tk.END)
+        
+    def search_cards(self, event=None):
+        """검색어가 단어나 뜻에 들어간 카드로 이동 (같은 검색어로 다시 누르면 다음 결과)"""
+        if not self.store or self.is_animating:
+            return
+        if self.loader is not None and self.search_index is None:
+            return  # 검색 색인은 로딩 스레드가 만드는 중
+        query = self.search_entry.get().strip()
+        if not query:
             return
             
-        try:
-            # 백업 파일 생성
-            backup_path = self.file_path + '.backup'
-            if os.path.exists(self.file_path):
-                import shutil
-                shutil.copy2(self.file_path, backup_path)
-            
-            # 원본 순서로 저장하기 위해 original_cards 사용
-            # 현재 카드의 결과를 original_cards에 반영
-            current_card = self.cards[self.current_index]
-            for orig_card in self.original_cards:
-                if orig_card['word'] == current_card['word'] and orig_card['meaning'] == current_card['meaning']:
-                    orig_card['result'] = current_card['result']
-                    break
-            
-            # 새 내용으로 파일 쓰기
-            with open(self.file_path, 'w', encoding='utf-8') as file:
-                for card in self.original_cards:
-                    line = f"{card['word']}\\{card['meaning']}\\{card['result']}\n"
-                    file.write(line)
-                    
-        except Exception as e:
-            messagebox.showerror("저장 오류", f"결과를 저장하는 중 오류가 발생했습니다:\n{str(e)}")
-            
+        found = self.find_next(query)
+        if found is None:
+            self.search_label.config(text="결과 없음")
+            return
+        hit, count = found
+        self.update_display()
+        more = "+" if count == SEARCH_LIMIT else ""
+        self.search_label.config(text=f"{hit + 1}/{count}{more}")
+        
     def show_card_list(self):
         """카드 목록 팝업"""
-        if not self.cards:
+        if not self.store:
             messagebox.showwarning("경고", "먼저 파일을 열어주세요.")
             return
             
-        # 새 창 생성
-        list_window = tk.Toplevel(self.root)
+        # 새 창 생성 (목록 창은 하나만)
+        self.close_card_list()
+        list_window = self.list_window = tk.Toplevel(self.root)
         list_window.title("카드 목록")
         list_window.geometry("500x400")
         list_window.configure(bg='#f0f0f0')
         
-        # 스크롤 가능한 텍스트 영역
-        from tkinter import scrolledtext
+        # 이동 입력줄
+        jump_frame = tk.Frame(list_window, bg='#f0f0f0')
+        jump_frame.pack(fill='x', padx=10, pady=(10, 0))
+        tk.Label(jump_frame, text=f"카드 번호 (1–{len(self.store.order)}):", bg='#f0f0f0').pack(side='left')
+        jump_entry = tk.Entry(jump_frame, width=10)
+        jump_entry.pack(side='left', padx=5)
         
-        text_area = scrolledtext.ScrolledText(
-            list_window,
-            wrap=tk.WORD,
-            width=60,
-            height=20,
-            font=("맑은 고딕", 10)
-        )
-        text_area.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # 카드 목록 표시
-        for i, card in enumerate(self.cards, 1):
-            result_text = ""
-            if card['result'] == '1':
-                result_text = " ✓"
-            elif card['result'] == '0':
-                result_text = " ✗"
-                
-            text_area.insert(tk.END, f"{i}. {card['word']}{result_text}\n")
-            text_area.insert(tk.END, f"   → {card['meaning']}\n\n")
-            
-        text_area.config(state='disabled')
+        # 보이는 행만 그리는 목록 (카드 수와 무관하게 바로 열림)
+        card_list = VirtualCardList(list_window, self.store)
+        
+        def jump(event=None):
+            try:
+                number = int(jump_entry.get())
+            except ValueError:
+                number = 0
+            if not 1 <= number <= len(self.store.order):
+                messagebox.showwarning("경고", f"1부터 {len(self.store.order)} 사이의 번호를 입력하세요.", parent=list_window)
+                return
+            card_list.scroll_to(number - 1)
+        
+        tk.Button(jump_frame, text="이동", command=jump).pack(side='left')
+        jump_entry.bind('<Return>', jump)
+        
+    def close_card_list(self):
+        """카드 목록 창이 열려 있으면 닫기"""
+        if self.list_window is not None:
+            if self.list_window.winfo_exists():
+                self.list_window.destroy()
+            self.list_window = None
         
     def enable_buttons(self):
         """버튼 활성화"""
@@ -658,6 +980,7 @@ def main():
     """메인 함수"""
     root = tk.Tk()
     app = FlashcardApp(root)
+    app.open_last_session()
     
     # 창 아이콘 설정 (선택사항)
     try:
@@ -665,12 +988,8 @@ def main():
     except:
         pass  # 아이콘 파일이 없어도 무시
     
-    # 창 종료 처리
-    def on_closing():
-        root.quit()
-        root.destroy()
-    
-    root.protocol("WM_DELETE_WINDOW", on_closing)
+    # 창 종료 처리 (메뉴의 종료와 같은 경로)
+    root.protocol("WM_DELETE_WINDOW", app.quit_app)
     
     # 앱 실행
     root.mainloop()
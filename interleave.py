@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 덱을 섞어 학습하는 세션 (덱별 가중치/할당량)
+- 덱마다 "다음 차례 시각"(pass)을 두고 가장 이른 덱에서 한 장 뽑은 뒤
+  그 덱의 pass를 1/가중치만큼 미룸 (stride 스케줄링) → 가중치 비율대로 섞임
+- 다음 카드: pass 최소 힙에서 O(log D) (D = 덱 수), 전체를 이어 붙여 섞지 않음
+- 덱 안의 카드 순서는 그 덱에서 처음 뽑을 때 만듦 (셔플이면 덱 안에서만 섞음)
+- set_weight / set_quota: 힙에 새 항목만 넣고(버전이 다른 옛 항목은 꺼낼 때 버림) 바로 다음 카드부터 반영
+  * 가중치 0 = 그 덱은 쉼, 할당량 None = 덱 카드를 모두
+- take(): 검색 등으로 순서 밖에서 고른 카드를 세션에서 뺌 (나중에 다시 나오지 않게)
+- Tk를 import하지 않음
+"""
+
+import bisect
+import heapq
+import random
+from array import array
+from typing import List, Optional, Sequence, Set, Tuple
+
+DEFAULT_WEIGHT = 1.0
+
+
+class InterleavedSession:
+    def __init__(self, offsets: Sequence[int], weights: Optional[Sequence[float]] = None,
+                 quotas: Optional[Sequence[Optional[int]]] = None, shuffle: bool = False,
+                 rng: Optional[random.Random] = None):
+        """offsets: 덱 번호 → 첫 카드 ID (마지막 = 전체 카드 수, DeckSet.offsets)"""
+        self.offsets = offsets
+        count = len(offsets) - 1
+        self.shuffle = shuffle
+        self.rng = rng or random.Random()
+        self.weights: List[float] = list(weights) if weights is not None else [DEFAULT_WEIGHT] * count
+        self.quotas: List[Optional[int]] = list(quotas) if quotas is not None else [None] * count
+        self.drawn = [0] * count                           # 덱별로 이번 세션에 뽑은 카드 수
+        self._cards: List[Optional[array]] = [None] * count  # 덱별 남은 카드 (끝에서부터 뽑음, 처음 뽑을 때 만듦)
+        self._taken: Set[int] = set()                      # 순서 밖에서 이미 나온 카드 ID
+        self._seen: Set[int] = set()                       # 이번 세션에 나온 카드 ID (뽑기 + take)
+        self._taken_count = [0] * count                    # 덱별 _taken 중 아직 _cards에 남은 수
+        self._pass = [0.0] * count
+        self._version = [0] * count
+        self._heap: List[Tuple[float, int, int]] = []      # (pass, 덱 번호, 버전)
+        self._now = 0.0                                    # 마지막으로 뽑은 카드의 pass
+        self.remaining = 0                                 # 앞으로 나올 카드 수 (덱별 _left 합)
+        for deck in range(count):
+            self.remaining += self._left(deck)
+            self._schedule(deck, self._stride(deck))
+
+    # ---------- 덱 상태 ----------
+    def _size(self, deck: int) -> int:
+        cards = self._cards[deck]
+        if cards is None:
+            return self.offsets[deck + 1] - self.offsets[deck]
+        return len(cards) - self._taken_count[deck]
+
+    def _left(self, deck: int) -> int:
+        """덱에서 앞으로 나올 카드 수 (가중치 0이면 0)"""
+        if self.weights[deck] <= 0:
+            return 0
+        left = self._size(deck)
+        quota = self.quotas[deck]
+        if quota is not None:
+            left = min(left, max(quota - self.drawn[deck], 0))
+        return left
+
+    def _stride(self, deck: int) -> float:
+        return 1.0 / self.weights[deck] if self.weights[deck] > 0 else 0.0
+
+    def _schedule(self, deck: int, delay: float):
+        """덱의 다음 차례를 now + delay로 (옛 힙 항목은 버전으로 무효화)"""
+        self._version[deck] += 1
+        if self._left(deck) <= 0:
+            return
+        self._pass[deck] = self._now + delay
+        heapq.heappush(self._heap, (self._pass[deck], deck, self._version[deck]))
+
+    def _materialize(self, deck: int) -> array:
+        cards = self._cards[deck]
+        if cards is None:
+            cards = array('l', range(self.offsets[deck + 1] - 1, self.offsets[deck] - 1, -1))
+            if self.shuffle:
+                self.rng.shuffle(cards)
+            self._cards[deck] = cards
+        return cards
+
+    def _pop_card(self, deck: int) -> int:
+        cards = self._materialize(deck)
+        while True:
+            card_id = cards.pop()
+            if card_id not in self._taken:
+                return card_id
+            self._taken.discard(card_id)
+            self._taken_count[deck] -= 1
+
+    # ---------- 뽑기 ----------
+    def draw(self) -> Optional[int]:
+        """다음 카드 ID (세션이 끝났으면 None)"""
+        while self._heap:
+            when, deck, version = heapq.heappop(self._heap)
+            if version != self._version[deck]:
+                continue  # 가중치/할당량이 바뀌기 전 항목
+            self._now = when
+            card_id = self._pop_card(deck)
+            self._seen.add(card_id)
+            self.drawn[deck] += 1
+            self.remaining -= 1
+            self._schedule(deck, self._stride(deck))
+            return card_id
+        return None
+
+    def deck_of(self, card_id: int) -> int:
+        return bisect.bisect_right(self.offsets, card_id) - 1
+
+    def take(self, card_id: int):
+        """순서 밖에서 고른 카드를 세션에서 뺌 (이미 나온 카드면 무시, O(1) — 세션 이어 하기에서 카드마다 부름)"""
+        if card_id in self._seen:
+            return
+        deck = self.deck_of(card_id)
+        self._materialize(deck)
+        before = self._left(deck)
+        self._seen.add(card_id)
+        self._taken.add(card_id)
+        self._taken_count[deck] += 1
+        self.drawn[deck] += 1
+        self.remaining += self._left(deck) - before
+        if self._left(deck) <= 0:
+            self._version[deck] += 1  # 힙 항목 무효화
+
+    # ---------- 설정 변경 ----------
+    def set_weight(self, deck: int, weight: float):
+        """가중치 변경 — 남은 대기 시간을 새 가중치 비율로 조정해 바로 반영"""
+        before = self._left(deck)
+        old_stride = self._stride(deck)
+        waiting = max(self._pass[deck] - self._now, 0.0)
+        self.weights[deck] = max(weight, 0.0)
+        self.remaining += self._left(deck) - before
+        new_stride = self._stride(deck)
+        delay = waiting * new_stride / old_stride if old_stride > 0 else new_stride
+        self._schedule(deck, delay)
+
+    def set_quota(self, deck: int, quota: Optional[int]):
+        """할당량 변경 (None = 제한 없음, 이미 뽑은 카드도 포함한 개수)"""
+        before = self._left(deck)
+        active = before > 0
+        self.quotas[deck] = quota
+        self.remaining += self._left(deck) - before
+        delay = max(self._pass[deck] - self._now, 0.0) if active else self._stride(deck)
+        self._schedule(deck, delay)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+채점 결과 write-behind 저장 스레드
+- UI 스레드는 put()으로 메모리에만 기록하고 바로 돌아감 (디스크 I/O 없음)
+- 작업 스레드가 모아 둔 채점을 한 번에 저널에 기록 + fsync
+    * 첫 미기록 채점 후 flush_interval초가 지났거나 flush_count건이 쌓이면 기록
+    * 같은 카드를 여러 번 채점하면 마지막 결과 한 줄만 기록 (묶음 안에서 합침)
+- flush(): 지금까지 put한 채점이 저널에 기록·fsync될 때까지 대기
+  (compact / replay / 종료 전에 호출 → 저널이 항상 .txt보다 먼저 디스크에 반영됨)
+- 기록 실패는 error에 남기고 해당 묶음은 flush_interval 뒤에 다시 시도 (close 이후에는 포기)
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from result_journal import ResultJournal
+
+FLUSH_INTERVAL = 0.5  # 초
+FLUSH_COUNT = 50      # 채점 건수
+
+
+class JournalWriter(threading.Thread):
+    def __init__(self, journal: ResultJournal,
+                 flush_interval: float = FLUSH_INTERVAL, flush_count: int = FLUSH_COUNT):
+        super().__init__(name=f"JournalWriter({journal.path})", daemon=True)
+        self.journal = journal
+        self.flush_interval = flush_interval
+        self.flush_count = flush_count
+        self.error: Optional[Exception] = None
+        self._cond = threading.Condition()
+        self._pending: Dict[int, str] = {}  # 카드 ID → 마지막 결과
+        self._count = 0                     # 마지막 기록 이후 put 건수 (합치기 전)
+        self._first = 0.0                   # 가장 오래된 미기록 채점 시각 (monotonic)
+        self._urgent = False                # flush() 요청 — 기다리지 말고 바로 기록
+        self._writing = False
+        self._failed = False                # 마지막 기록 실패 → flush_interval 뒤에 재시도
+        self._closed = False
+
+    def put(self, card_id: int, result: str):
+        """채점 결과 한 건 (저널 기록은 작업 스레드에서)"""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("저장 스레드가 이미 닫혔습니다.")
+            if not self._pending:
+                self._first = time.monotonic()
+            self._pending[card_id] = result
+            self._count += 1
+            if self._count >= self.flush_count:
+                self._cond.notify_all()
+
+    @property
+    def backlog(self) -> int:
+        """아직 저널에 기록되지 않은 채점 건수"""
+        return self._count
+
+    def flush(self):
+        """put한 채점이 모두 저널에 기록·fsync될 때까지 대기 (기록 실패 시 그 예외를 다시 발생)"""
+        with self._cond:
+            self._urgent = True
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: not self._writing and (not self._pending or self.error is not None))
+            self._urgent = False
+        error = self.take_error()
+        if error is not None:
+            raise error
+
+    def take_error(self) -> Optional[Exception]:
+        """마지막 기록 실패 (한 번만 보고)"""
+        with self._cond:
+            error, self.error = self.error, None
+        return error
+
+    def close(self):
+        """남은 채점을 기록하고 스레드 종료 (저널 파일은 닫지 않음)"""
+        try:
+            self.flush()
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+            if self.is_alive():
+                self.join()
+
+    # ---------- 작업 스레드 ----------
+    def _due(self) -> bool:
+        if self._failed:
+            return time.monotonic() - self._first >= self.flush_interval
+        return (self._urgent or self._closed or self._count >= self.flush_count
+                or time.monotonic() - self._first >= self.flush_interval)
+
+    def _next_batch(self) -> Optional[Dict[int, str]]:
+        with self._cond:
+            while True:
+                if self._closed and (self._failed or not self._pending):
+                    return None
+                if self._pending and self._due():
+                    break
+                timeout = None
+                if self._pending:
+                    timeout = self._first + self.flush_interval - time.monotonic()
+                self._cond.wait(timeout)
+            batch, self._pending, self._count = self._pending, {}, 0
+            self._writing = True
+            return batch
+
+    def run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            error = None
+            try:
+                self.journal.append_many(batch.items())
+            except Exception as e:
+                error = e
+            with self._cond:
+                if error is not None:
+                    # 실패한 묶음은 되돌림 (그 사이 새로 들어온 결과가 우선)
+                    for card_id, result in batch.items():
+                        self._pending.setdefault(card_id, result)
+                    self._count = max(self._count, len(self._pending))
+                    self._first = time.monotonic()
+                    self.error = error
+                self._failed = error is not None
+                self._writing = False
+                self._cond.notify_all()
@@ -0,0 +1,71 @@
+"""
+UI 색상 팔레트
+==============
+* 테마 색상 상수 (배경, 그림자, 채점 결과 테두리 등)
+* parse_color : '#rrggbb' → (r, g, b) — 문자열별로 한 번만 파싱 (LRU 캐시)
+* blend       : 두 색을 ratio 비율로 섞은 '#rrggbb' — 파싱 결과는 캐시에서 재사용
+* ramp        : c1 → c2 를 주어진 비율 목록대로 섞은 색 튜플 — (c1, c2, ratios) 키로 LRU 캐시
+                (선형이 아닌 곡선, 예: 카드 뒤집기 그림자의 1 - cos(angle) 에도 사용)
+* gradient    : c1 → c2 를 steps 단계로 나눈 색 튜플 (steps + 1 개)
+                (c1, c2, steps) 키로 LRU 캐시 — 균등 비율의 ramp
+* Tk 를 import 하지 않음 — 앱과 벤치마크에서 공용
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Tuple
+
+RGB = Tuple[int, int, int]
+
+# 테마 색상
+BACKGROUND = '#f0f0f0'
+SHADOW = '#cccccc'
+CARD = 'white'
+CARD_ANSWER = '#f0f8ff'
+TEXT = '#333333'
+TEXT_ANSWER = '#0066cc'
+CORRECT = '#4CAF50'
+WRONG = '#f44336'
+NEUTRAL = '#cccccc'
+
+# 채점 결과('1', '0', '') → (테두리 색, 테두리 두께)
+RESULT_BORDER: Dict[str, Tuple[str, int]] = {
+    '1': (CORRECT, 2),
+    '0': (WRONG, 2),
+}
+NO_RESULT_BORDER = (NEUTRAL, 0)
+
+
+@lru_cache(maxsize=256)
+def parse_color(color: str) -> RGB:
+    """'#rrggbb' 문자열을 (r, g, b) 로"""
+    hex_color = color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+def to_hex(rgb: RGB) -> str:
+    return '#%02x%02x%02x' % rgb
+
+
+def blend(color1: str, color2: str, ratio: float) -> str:
+    """두 색상을 ratio(0 → color1, 1 → color2) 비율로 블렌드"""
+    rgb1 = parse_color(color1)
+    rgb2 = parse_color(color2)
+    return to_hex(tuple(int(rgb1[i] * (1 - ratio) + rgb2[i] * ratio) for i in range(3)))
+
+
+@lru_cache(maxsize=64)
+def ramp(color1: str, color2: str, ratios: Tuple[float, ...]) -> Tuple[str, ...]:
+    """ratios 의 각 비율(0 → color1, 1 → color2)로 블렌드한 색 튜플"""
+    return tuple(blend(color1, color2, ratio) for ratio in ratios)
+
+
+@lru_cache(maxsize=64)
+def gradient(color1: str, color2: str, steps: int) -> Tuple[str, ...]:
+    """color1 → color2 를 steps 등분한 색 (양 끝 포함, steps + 1 개)"""
+    return ramp(color1, color2, tuple(i / steps for i in range(steps + 1)))
+
+
+def result_border(result: str) -> Tuple[str, int]:
+    """채점 결과에 맞는 (테두리 색, 테두리 두께)"""
+    return RESULT_BORDER.get(result, NO_RESULT_BORDER)
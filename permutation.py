@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시드로 정해지는 지연 순열 (셔플 순서를 배열로 만들지 않음)
+- FeistelPermutation: [0, size) 위의 전단사 함수 — i번째 값과 역함수를 (시드, i)만으로 O(1)에 계산
+    * size 이상인 2의 거듭제곱 범위에서 불균형 Feistel 네트워크(짝수 라운드)를 돌리고
+      size 밖으로 나가면 다시 돌림 (cycle walking, 범위가 size의 2배 미만이라 평균 2회 미만)
+    * 라운드 함수: (R + 라운드 키) × 황금비 상수의 상위 32비트 (라운드 키는 시드에서)
+- ShuffledOrder: CardStore.order 대역 — 원본 순서 + 구간 셔플 목록 (시작, 끝, 시드)
+    * 위치 → 카드 ID: 셔플을 뒤에서부터 거꾸로 적용, 카드 ID → 위치(index): 앞에서부터 역순열
+    * 재시작/셔플은 셔플 목록만 바꾸므로 덱 크기와 무관하게 즉시
+    * 로딩 중 늘어나는 카드(extend/append)는 끝에 원본 순서로 붙음 → 이전 셔플 구간에 영향 없음
+- Tk를 import하지 않음
+"""
+
+import random
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+ROUNDS = 6  # 짝수 (불균형 Feistel에서 왼쪽/오른쪽 폭이 원래대로 돌아오도록)
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+
+
+class FeistelPermutation:
+    """[0, size)의 시드 고정 순열 (perm[i], perm.index(value) 모두 O(1))"""
+    __slots__ = ('size', 'seed', '_keys', '_masks', '_right_bits')
+
+    def __init__(self, size: int, seed: int):
+        self.size = size
+        self.seed = seed
+        rng = random.Random(seed)
+        self._keys = [rng.getrandbits(64) for _ in range(ROUNDS)]
+        bits = max(size - 1, 0).bit_length()
+        self._right_bits = bits // 2
+        # 라운드마다 왼쪽 폭이 바뀜 (왼쪽, 오른쪽, 왼쪽, ...) — 라운드 출력 마스크
+        widths = (bits - self._right_bits, self._right_bits)
+        self._masks = [(1 << widths[round % 2]) - 1 for round in range(ROUNDS)]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _encrypt(self, value: int) -> int:
+        right_bits = self._right_bits
+        left, right = value >> right_bits, value & ((1 << right_bits) - 1)
+        for key, mask in zip(self._keys, self._masks):
+            # (L, R) → (R, L ^ F(R)): 폭이 라운드마다 바뀜
+            left, right = right, (left ^ (((right + key) * _GOLDEN) & _MASK64) >> 32) & mask
+        return (left << right_bits) | right
+
+    def _decrypt(self, value: int) -> int:
+        right_bits = self._right_bits
+        left, right = value >> right_bits, value & ((1 << right_bits) - 1)
+        for key, mask in zip(reversed(self._keys), reversed(self._masks)):
+            left, right = (right ^ (((left + key) * _GOLDEN) & _MASK64) >> 32) & mask, left
+        return (left << right_bits) | right
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            raise IndexError("순열 범위를 벗어났습니다.")
+        value = self._encrypt(index)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+    def index(self, value: int) -> int:
+        """역순열: perm[i] == value인 i"""
+        if not 0 <= value < self.size:
+            raise ValueError("순열 범위를 벗어났습니다.")
+        index = self._decrypt(value)
+        while index >= self.size:
+            index = self._decrypt(index)
+        return index
+
+
+class ShuffledOrder:
+    """원본 순서에 구간 셔플을 차례로 적용한 학습 순서 (배열 없이 위치 ↔ 카드 ID 계산)"""
+    __slots__ = ('size', 'shuffles', '_perms', '_last')
+
+    def __init__(self, size: int, shuffles: Iterable[Tuple[int, int, int]] = ()):
+        self.size = size
+        self.shuffles: List[Tuple[int, int, int]] = []  # (시작, 끝, 시드) — 적용한 순서대로
+        self._perms: List[FeistelPermutation] = []
+        self._last = (-1, -1)  # 마지막으로 계산한 (위치, 카드 ID) — 같은 카드를 연달아 조회하는 경우가 대부분
+        for start, end, seed in shuffles:
+            self.shuffle(start, end, seed)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def shuffle(self, start: int, end: int, seed: int):
+        """[start, end) 위치를 seed 순열로 섞음"""
+        if not 0 <= start <= end <= self.size:
+            raise ValueError("셔플 구간이 순서 범위를 벗어났습니다.")
+        self.shuffles.append((start, end, seed))
+        self._perms.append(FeistelPermutation(end - start, seed))
+        self._last = (-1, -1)
+
+    def __getitem__(self, position: int) -> int:
+        if position < 0:
+            position += self.size
+        if not 0 <= position < self.size:
+            raise IndexError("학습 순서 범위를 벗어났습니다.")
+        if self._last[0] == position:
+            return self._last[1]
+        # 나중에 적용한 셔플부터: 새 순서[start + j] = 이전 순서[start + perm[j]]
+        card_id = position
+        for (start, end, _), perm in zip(reversed(self.shuffles), reversed(self._perms)):
+            if start <= card_id < end:
+                card_id = start + perm[card_id - start]
+        self._last = (position, card_id)
+        return card_id
+
+    def index(self, card_id: int) -> int:
+        """카드 ID의 학습 위치 (array.index와 같은 용도, O(셔플 수))"""
+        if not 0 <= card_id < self.size:
+            raise ValueError("학습 순서에 없는 카드입니다.")
+        position = card_id
+        for (start, end, _), perm in zip(self.shuffles, self._perms):
+            if start <= position < end:
+                position = start + perm.index(position - start)
+        return position
+
+    def __iter__(self) -> Iterator[int]:
+        return (self[position] for position in range(self.size))
+
+    def tolist(self) -> List[int]:
+        return list(self)
+
+    def append(self, card_id: int):
+        """끝에 카드 추가 (카드 ID가 이어지는 경우만 — CardStore.add)"""
+        self.extend(range(card_id, card_id + 1))
+
+    def extend(self, card_ids: Sequence[int]):
+        """끝에 원본 순서로 카드 추가 (CardStore.extend_source의 range)"""
+        if not isinstance(card_ids, range) or card_ids.step != 1 or (card_ids and card_ids.start != self.size):
+            raise ValueError("이어지는 카드 ID만 붙일 수 있습니다.")
+        self.size += len(card_ids)
@@ -0,0 +1,96 @@
+"""
+Progress persistence (progress.json + 델타 로그)
+===============================================
+* progress.json      : 전체 스냅샷 (기존 형식 그대로, indent=2)
+* progress.json.log  : 마지막 스냅샷 이후 바뀐 카드만 JSON Lines 로 덧붙임
+    {"w": 단어, "s": CardStats.to_json(), "r": 0 | 1 | null}
+* flush()   : 바뀐 카드 수에 비례하는 비용 (append + fsync)
+* compact() : 스냅샷을 임시 파일에 쓰고 os.replace 로 교체한 뒤 로그 삭제
+* load()    : 스냅샷 + 로그 재생 (크래시로 잘린 마지막 줄은 무시)
+"""
+from __future__ import annotations
+
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+LOG_SUFFIX = ".log"
+
+
+class ProgressStore:
+    def __init__(self, path: str, compact_every: int = 1000):
+        self.path = path
+        self.log_path = path + LOG_SUFFIX
+        self.compact_every = compact_every
+        self._pending: Dict[str, Tuple[dict, Optional[int]]] = {}   # 아직 로그에 안 쓴 변경
+        self._logged = 0                                             # 스냅샷 이후 로그 레코드 수
+
+    # ---------------- 읽기 ----------------
+    def load(self) -> dict:
+        """{"stats": {...}, "results": {...}} — 스냅샷에 로그를 덮어쓴 결과"""
+        data = {"stats": {}, "results": {}}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            data.setdefault("stats", {})
+            data.setdefault("results", {})
+
+        self._logged = 0
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "rb") as f:
+                raw = f.read()
+            good = raw.rfind(b"\n") + 1
+            if good < len(raw):
+                # 크래시로 잘린 꼬리는 잘라 냄 (다음 append 가 그 뒤에 이어 붙지 않도록)
+                with open(self.log_path, "r+b") as f:
+                    f.truncate(good)
+            for line in raw[:good].splitlines():
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                data["stats"][rec["w"]] = rec["s"]
+                if rec.get("r") is not None:
+                    data["results"][rec["w"]] = rec["r"]
+                self._logged += 1
+        return data
+
+    # ---------------- 쓰기 ----------------
+    def record(self, word: str, stats: dict, result: Optional[int]):
+        """카드 한 장의 최신 상태를 변경 목록에 기록 (같은 카드는 마지막 값만 남음)"""
+        self._pending[word] = (stats, result)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._pending)
+
+    def flush(self):
+        """변경된 카드만 로그 끝에 덧붙임"""
+        if not self._pending:
+            return
+        lines = "".join(
+            json.dumps({"w": w, "s": s, "r": r}, ensure_ascii=False) + "\n"
+            for w, (s, r) in self._pending.items()
+        )
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._logged += len(self._pending)
+        self._pending.clear()
+
+    def needs_compaction(self) -> bool:
+        return self._logged >= self.compact_every
+
+    def compact(self, payload: dict):
+        """전체 스냅샷을 원자적으로 교체하고 로그를 비움"""
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
+        self._pending.clear()
+        self._logged = 0
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+채점 결과 저널 (append-only)
+- 덱 파일 옆 사이드카 파일(<덱>.txt.journal)에 채점 한 번당 한 줄을 덧붙임
+- 레코드 형식: 위치\결과  (위치 = 원본 순서상의 카드 번호, 0부터)
+- 덱 로드 시 replay로 크래시 이전 채점을 복구
+- compact로 저널을 .txt에 반영한 뒤 저널을 비움 (교체 전 내용은 backup_store에 세대로 보관)
+"""
+
+import os
+from typing import Iterable, Optional, Tuple
+
+from backup_store import BackupStore, session_store
+from card_store import CardStore
+
+JOURNAL_SUFFIX = '.journal'
+DELIM = '\\'
+
+
+def _fsync_dir(path: str):
+    """파일 교체(rename)가 디스크에 남도록 디렉터리 fsync (지원하지 않는 OS는 무시)"""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class ResultJournal:
+    def __init__(self, deck_path: str, compact_threshold: int = 500, backups: Optional[BackupStore] = None):
+        self.deck_path = deck_path
+        self.backups = backups if backups is not None else session_store()
+        self.path = deck_path + JOURNAL_SUFFIX
+        self.compact_threshold = compact_threshold
+        self.pending = 0  # 마지막 compact 이후 기록된 레코드 수
+        self._file = None
+
+    def append(self, position: int, result: str):
+        """채점 결과 한 건을 저널 끝에 기록"""
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(f"{position}{DELIM}{result}\n")
+        self._file.flush()
+        self.pending += 1
+
+    def append_many(self, records: Iterable[Tuple[int, str]]):
+        """채점 결과 여러 건을 한 번에 기록하고 fsync (write-behind 저장 스레드용)"""
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        lines = [f"{position}{DELIM}{result}\n" for position, result in records]
+        self._file.write(''.join(lines))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.pending += len(lines)
+
+    def needs_compaction(self) -> bool:
+        return self.pending >= self.compact_threshold
+
+    def replay(self, store: CardStore) -> int:
+        """저널 레코드를 카드 저장소에 적용하고 적용 건수를 반환"""
+        if not os.path.exists(self.path):
+            return 0
+
+        with open(self.path, 'rb') as file:
+            raw = file.read()
+        good = raw.rfind(b'\n') + 1
+        if good < len(raw):
+            # 크래시로 잘린 마지막 줄은 잘라 냄 (다음 append가 그 뒤에 이어 붙지 않도록)
+            with open(self.path, 'r+b') as file:
+                file.truncate(good)
+
+        applied = 0
+        for line in raw[:good].decode('utf-8', errors='replace').splitlines():
+            parts = line.split(DELIM)
+            if len(parts) != 2 or not parts[0].isdigit():
+                continue
+            position = int(parts[0])
+            if position < len(store):
+                store.set_result(position, parts[1])
+                applied += 1
+
+        self.pending = applied
+        return applied
+
+    def compact(self, store: CardStore):
+        """카드 저장소 전체를 원본 순서로 덱 파일에 원자적으로 다시 쓰고 저널을 비움"""
+        self.close()
+
+        # 교체 전 내용을 백업 세대로 (세션당 한 번, 내용이 같으면 쓰지 않음)
+        self.backups.snapshot(self.deck_path)
+
+        tmp_path = self.deck_path + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            store.write_to(file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        # mmap된 원본은 교체 전에 닫고 교체 후 다시 연다 (Windows는 매핑된 파일 교체 불가)
+        source = store.source
+        if source is not None:
+            source.close()
+        os.replace(tmp_path, self.deck_path)
+        if source is not None:
+            source.open()
+        store.mark_clean()
+        _fsync_dir(self.deck_path)
+
+        # .txt가 디스크에 반영된 뒤에만 저널 제거
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.pending = 0
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+카드 전문 검색 색인 (단어 + 뜻)
+- 2-gram 역색인: 한국어처럼 띄어쓰기와 무관한 부분 문자열 검색용
+  * 각 필드 끝에 구분 문자(\\x00)를 붙여 모든 글자가 어떤 2-gram의 첫 글자가 되게 함
+    → 한 글자 검색은 그 글자로 시작하는 2-gram들의 합집합
+- 포스팅: 카드 ID 오름차순 array('i') 하나에 이어 붙이고 gram별 오프셋만 보관
+  (gram은 정렬 순서로 저장 → 같은 글자로 시작하는 gram이 연속 구간)
+- 검색: 가장 짧은 포스팅을 따라가며 나머지 포스팅은 이분 탐색으로 확인,
+        실제 단어/뜻에 부분 문자열로 있는지 확인한 뒤 limit개에서 멈춤
+- add(): 카드 추가/내용 변경을 증분 반영 (기본 색인은 그대로, 작은 델타 색인에 기록)
+- <덱>.txt.sidx 캐시 (deck_cache 헤더로 유효성 확인) → 덱을 열 때마다 다시 만들지 않음
+"""
+
+import bisect
+import heapq
+import struct
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from deck_cache import read_cache, write_cache
+
+INDEX_SUFFIX = '.sidx'
+INDEX_MAGIC = b'FCSX'
+_COUNTS = struct.Struct('<QQQ')  # gram 수, 포스팅 수, gram 블롭 길이
+
+_END = '\x00'  # 필드 끝 표식 (덱 줄에는 나오지 않음)
+
+
+def _normalize(text: str) -> str:
+    return text.casefold()
+
+
+def _grams(word: str, meaning: str) -> Set[str]:
+    text = _normalize(f"{word}{_END}{meaning}{_END}")
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class SearchIndex:
+    """단어/뜻 2-gram 역색인 (카드 ID 기준)"""
+
+    def __init__(self):
+        self._keys: Dict[str, int] = {}   # gram → 오프셋 표의 위치
+        self._sorted: List[str] = []      # gram 오름차순 (= 오프셋 표 순서, 한 글자 검색용)
+        self._offsets = array('q', [0])   # gram별 포스팅 시작 (마지막 = 전체 길이)
+        self._postings = array('i')       # 카드 ID (gram별로 오름차순)
+        self._delta: Dict[str, Set[int]] = {}  # 증분 반영된 gram → 카드 ID
+        self._changed: Set[int] = set()   # 기본 색인 정보가 낡은 카드 ID
+        self.cache_stale = False          # 덱 파일이 바뀌어 캐시를 다시 써야 함
+
+    @classmethod
+    def build(cls, texts: Iterable[Tuple[str, str]]) -> 'SearchIndex':
+        """카드 ID 순서의 (단어, 뜻)으로 색인 구성"""
+        postings: Dict[str, array] = {}
+        for card_id, (word, meaning) in enumerate(texts):
+            for gram in _grams(word, meaning):
+                ids = postings.get(gram)
+                if ids is None:
+                    ids = postings[gram] = array('i')
+                ids.append(card_id)
+
+        index = cls()
+        offsets = index._offsets
+        flat = index._postings
+        index._sorted = sorted(postings)
+        for position, gram in enumerate(index._sorted):
+            ids = postings[gram]
+            index._keys[gram] = position
+            flat.extend(ids)
+            offsets.append(len(flat))
+        return index
+
+    # ---------- 증분 갱신 ----------
+    def add(self, card_id: int, word: str, meaning: str):
+        """카드 추가 또는 내용 변경 반영 (이전 내용의 gram은 검색 시 실제 문자열 확인으로 걸러짐)"""
+        self._changed.add(card_id)
+        for gram in _grams(word, meaning):
+            self._delta.setdefault(gram, set()).add(card_id)
+
+    # ---------- 검색 ----------
+    def _posting_at(self, position: int) -> memoryview:
+        return memoryview(self._postings)[self._offsets[position]:self._offsets[position + 1]]
+
+    def _posting(self, gram: str) -> memoryview:
+        position = self._keys.get(gram)
+        if position is None:
+            return memoryview(self._postings)[:0]
+        return self._posting_at(position)
+
+    def _base_candidates(self, query: str) -> Iterable[int]:
+        """기본 색인에서 query의 모든 gram을 가진 카드 ID (오름차순, 중복 없음)"""
+        if len(query) == 1:
+            # query로 시작하는 gram은 정렬된 목록에서 연속 구간
+            first = bisect.bisect_left(self._sorted, query)
+            last = bisect.bisect_left(self._sorted, chr(ord(query) + 1))
+            postings = [self._posting_at(position) for position in range(first, last)]
+            previous = None
+            for card_id in heapq.merge(*postings):
+                if card_id != previous:
+                    previous = card_id
+                    yield card_id
+            return
+
+        postings = sorted((self._posting(query[i:i + 2]) for i in range(len(query) - 1)), key=len)
+        shortest, others = postings[0], postings[1:]
+        for card_id in shortest:
+            for posting in others:
+                i = bisect.bisect_left(posting, card_id)
+                if i == len(posting) or posting[i] != card_id:
+                    break
+            else:
+                yield card_id
+
+    def _delta_candidates(self, query: str) -> Set[int]:
+        if not self._delta:
+            return set()
+        if len(query) == 1:
+            return set().union(*(ids for gram, ids in self._delta.items() if gram[0] == query))
+        sets = [self._delta.get(query[i:i + 2], set()) for i in range(len(query) - 1)]
+        return set.intersection(*sets)
+
+    def search(self, query: str, text_of: Callable[[int], Tuple[str, str]], limit: int = 100) -> List[int]:
+        """query를 단어나 뜻에 포함하는 카드 ID (오름차순, 최대 limit개)"""
+        query = _normalize(query.strip())
+        if not query:
+            return []
+
+        def matches(card_id: int) -> bool:
+            word, meaning = text_of(card_id)
+            return query in _normalize(word) or query in _normalize(meaning)
+
+        found = []
+        for card_id in self._base_candidates(query):
+            if card_id not in self._changed and matches(card_id):
+                found.append(card_id)
+                if len(found) == limit:
+                    break
+        found.extend(card_id for card_id in self._delta_candidates(query) if matches(card_id))
+        return sorted(found)[:limit]
+
+    # ---------- 캐시 ----------
+    def save(self, deck_path: str):
+        """덱 옆 캐시에 기록 (증분 반영분은 기본 색인에 합치지 않으므로 없을 때만)"""
+        if self._delta:
+            return
+        blob = '\n'.join(self._sorted).encode('utf-8')
+        write_cache(deck_path, INDEX_SUFFIX, INDEX_MAGIC, [
+            _COUNTS.pack(len(self._keys), len(self._postings), len(blob)),
+            self._offsets.tobytes(), self._postings.tobytes(), blob,
+        ])
+        self.cache_stale = False
+
+    @classmethod
+    def load(cls, deck_path: str) -> Optional['SearchIndex']:
+        body = read_cache(deck_path, INDEX_SUFFIX, INDEX_MAGIC)
+        if body is None or len(body) < _COUNTS.size:
+            return None
+
+        key_count, posting_count, blob_size = _COUNTS.unpack_from(body)
+        offsets_size = (key_count + 1) * array('q').itemsize
+        postings_size = posting_count * array('i').itemsize
+        body = body[_COUNTS.size:]
+        if len(body) != offsets_size + postings_size + blob_size:
+            return None
+
+        index = cls()
+        index._offsets = array('q')
+        index._offsets.frombytes(body[:offsets_size])
+        index._postings.frombytes(body[offsets_size:offsets_size + postings_size])
+        keys = str(body[offsets_size + postings_size:], 'utf-8').split('\n') if key_count else []
+        if len(keys) != key_count:
+            return None
+        index._sorted = keys
+        index._keys = dict(zip(keys, range(key_count)))
+        return index
+
+    @classmethod
+    def for_deck(cls, deck_path: str, texts: Callable[[], Iterable[Tuple[str, str]]]) -> 'SearchIndex':
+        """캐시가 유효하면 읽고, 아니면 texts()로 새로 만들어 캐시에 저장"""
+        index = cls.load(deck_path)
+        if index is None:
+            index = cls.build(texts())
+            index.save(deck_path)
+        return index
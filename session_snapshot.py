@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+학습 세션 스냅샷 (다시 열면 마지막 카드에서 이어서)
+- 덱별로 위치/방향/셔플 설정과 학습 순서를 기록, 마지막으로 연 덱도 기록 (앱 시작 시 바로 열기)
+- 학습 순서는 순열 대신 셔플 시드 목록(CardStore.shuffles)만 저장 → 덱 크기와 무관하게 작음
+  * 덱 섞어 학습 중이면 지금까지 나온 카드 ID와 덱별 가중치/할당량 저장
+- 덱 구분: 절대 경로 + 카드 수 (compact로 결과만 바뀌어도 그대로 사용, 카드 수가 다르면 버림)
+- 파일: ~/.flashcard_session.json (FLASHCARD_SESSION_FILE로 변경), 최근 MAX_DECKS개 덱만 보관
+- 임시 파일에 쓰고 교체 (쓰다 멈춰도 이전 스냅샷 유지)
+"""
+
+import json
+import os
+from typing import Dict, Optional
+
+SNAPSHOT_VERSION = 2  # 2: 셔플 시드가 Feistel 순열 기준 (1의 시드는 다른 순서가 됨)
+SNAPSHOT_FILE_ENV = 'FLASHCARD_SESSION_FILE'
+MAX_DECKS = 20
+
+
+def snapshot_path() -> str:
+    return os.environ.get(SNAPSHOT_FILE_ENV) or os.path.join(os.path.expanduser('~'), '.flashcard_session.json')
+
+
+def deck_key(path: str) -> str:
+    return os.path.abspath(path)
+
+
+def _read() -> Dict:
+    try:
+        with open(snapshot_path(), 'r', encoding='utf-8') as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != SNAPSHOT_VERSION:
+        return {}
+    return data
+
+
+def load(path: str) -> Optional[Dict]:
+    """덱의 마지막 스냅샷 (없으면 None)"""
+    return _read().get('decks', {}).get(deck_key(path))
+
+
+def last_deck() -> Optional[str]:
+    """마지막으로 학습한 덱 (파일/폴더가 없어졌으면 None)"""
+    path = _read().get('last')
+    return path if path and os.path.exists(path) else None
+
+
+def save(path: str, snapshot: Dict):
+    """덱의 스냅샷을 기록하고 마지막 덱으로 표시"""
+    data = _read()
+    decks = data.get('decks', {})
+    key = deck_key(path)
+    decks.pop(key, None)
+    decks[key] = snapshot  # 최근에 저장한 덱이 뒤로
+    for old in list(decks)[:-MAX_DECKS]:
+        del decks[old]
+
+    target = snapshot_path()
+    tmp_path = target + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump({'version': SNAPSHOT_VERSION, 'last': key, 'decks': decks}, file, ensure_ascii=False)
+    os.replace(tmp_path, target)
@@ -0,0 +1,146 @@
+"""
+SM‑2 일괄(batch) 계산 및 복습량 예측
+====================================
+* NumPy 배열(ef, interval, reps, next_due)에 품질 점수를 한꺼번에 적용
+* 결과는 flash_card_ver2.sm2_update(스칼라)와 비트 단위로 동일
+  - ef 증감은 품질별로 스칼라 식 그대로 미리 계산한 표에서 조회
+  - round() 와 np.rint() 는 모두 짝수 쪽 반올림(banker's rounding)
+* 캐시에 들어가는 블록 단위로 계산 — 분기 마스크는 블록마다 한 번 만들고
+  마스크 곱/덧셈으로 합침 (무작위 마스크의 copyto(where=)/np.where 는 분기 예측 실패로 느림)
+* forecast : 컬렉션 전체의 향후 N일 일별 복습 수를 시뮬레이션
+* next_due 는 날짜 대신 정수 ordinal(date.toordinal())로 다룸
+* NumPy 는 선택 의존성 — 이 모듈을 쓸 때만 필요
+"""
+from __future__ import annotations
+
+import datetime as dt
+from typing import Iterable, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성
+    np = None
+
+QUALITY_CORRECT = 5   # A 키
+QUALITY_WRONG = 2     # S 키
+
+
+# 품질(0–5)별 ef 증감 — 스칼라 식을 파이썬 float 로 그대로 계산해 둔 표
+_EF_DELTA = None if np is None else np.array(
+    [0.1 - (5 - q) * (0.08 + (5 - q) * 0.02) for q in range(6)], dtype=np.float64)
+
+
+_BLOCK = 1 << 14  # 한 번에 계산하는 카드 수 (블록 임시 배열이 CPU 캐시에 머물도록)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("sm2_batch 는 NumPy 가 필요합니다: pip install numpy")
+
+
+def sm2_update_batch(ef, interval, reps, quality) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """배열 단위 sm2_update. 새 (ef, interval, reps) 배열을 반환 (입력은 변경하지 않음).
+    품질이 0–5 밖이면 ValueError (ef 증감 표 밖 — 스칼라 식과 달라지지 않도록 조용히 자르지 않음)."""
+    _require_numpy()
+    ef = np.asarray(ef, dtype=np.float64)
+    shape = ef.shape
+    ef = ef.reshape(-1)
+    interval = np.asarray(interval).reshape(-1)
+    reps = np.asarray(reps).reshape(-1)
+    quality = np.asarray(quality, dtype=np.intp)
+    if quality.size and (quality.min() < 0 or quality.max() >= len(_EF_DELTA)):
+        raise ValueError("품질 점수는 0 ~ 5 사이여야 합니다.")
+    quality = np.broadcast_to(quality, shape).reshape(-1)
+    size = ef.size
+
+    new_ef = np.empty(size, dtype=np.float64)
+    new_interval = np.empty(size, dtype=np.int64)
+    new_reps = np.empty(size, dtype=np.int64)
+    # 블록 임시 배열 (블록마다 재사용)
+    block = min(size, _BLOCK)
+    passed_buf = np.empty(block, dtype=bool)
+    second_buf = np.empty(block, dtype=bool)
+    later_buf = np.empty(block, dtype=bool)
+    grown_buf = np.empty(block, dtype=np.float64)
+
+    for start in range(0, size, _BLOCK):
+        part = slice(start, start + _BLOCK)
+        count = min(_BLOCK, size - start)
+        passed, second, later, grown = (buf[:count] for buf in (passed_buf, second_buf, later_buf, grown_buf))
+        q, r = quality[part], reps[part]
+
+        # 분기 마스크는 한 번만: 정답(q >= 3) 중 두 번째 복습(reps == 1) / 그 이후(reps >= 2)
+        np.greater_equal(q, 3, out=passed)
+        np.equal(r, 1, out=second)
+        second &= passed
+        np.greater_equal(r, 2, out=later)
+        later &= passed
+
+        # interval = later ? round(interval × 이전 ef) : (second ? 6 : 1) — 마스크 곱/덧셈으로 분기 없이
+        # (상수 부분 1 + 5·second − later 는 마스크 버퍼를 uint8로 보고 제자리 계산)
+        fixed = second.view(np.uint8)
+        fixed *= 5
+        fixed += 1
+        fixed -= later.view(np.uint8)
+        np.multiply(interval[part], ef[part], out=grown)
+        np.rint(grown, out=grown)
+        grown *= later
+        grown += fixed
+        np.copyto(new_interval[part], grown, casting='unsafe')
+
+        # reps = passed ? reps + 1 : 0
+        out = new_reps[part]
+        np.add(r, 1, out=out)
+        out *= passed
+
+        out = new_ef[part]
+        np.take(_EF_DELTA, q, out=out, mode='clip')  # 범위는 위에서 확인 ('raise'는 out을 버퍼에 한 번 더 복사)
+        out += ef[part]
+        np.maximum(out, 1.3, out=out)
+    return new_ef.reshape(shape), new_interval.reshape(shape), new_reps.reshape(shape)
+
+
+def arrays_from_stats(stats: Iterable) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """CardStats(ef, interval, reps, next_due) 목록 → (ef, interval, reps, next_due ordinal) 배열"""
+    _require_numpy()
+    stats = list(stats)
+    ef = np.fromiter((s.ef for s in stats), dtype=np.float64, count=len(stats))
+    interval = np.fromiter((s.interval for s in stats), dtype=np.int64, count=len(stats))
+    reps = np.fromiter((s.reps for s in stats), dtype=np.int64, count=len(stats))
+    next_due = np.fromiter((s.next_due.toordinal() for s in stats), dtype=np.int64, count=len(stats))
+    return ef, interval, reps, next_due
+
+
+def review_batch(ef, interval, reps, next_due, quality, today: dt.date):
+    """선택된 카드들을 today 에 채점한 결과 (ef, interval, reps, next_due) 배열"""
+    new_ef, new_interval, new_reps = sm2_update_batch(ef, interval, reps, quality)
+    return new_ef, new_interval, new_reps, today.toordinal() + new_interval
+
+
+def forecast(ef, interval, reps, next_due, days: int, today: dt.date | None = None,
+             recall_rate: float = 0.9, seed: int | None = None) -> "np.ndarray":
+    """
+    향후 days 일 동안의 일별 복습 수를 시뮬레이션.
+    매일 만기(next_due <= 그날)인 카드를 모두 복습하고, recall_rate 확률로 정답(5), 아니면 오답(2).
+    반환: 길이 days 의 int64 배열 (0번째 = today)
+    """
+    _require_numpy()
+    today = today or dt.date.today()
+    rng = np.random.default_rng(seed)
+    ef = np.array(ef, dtype=np.float64)
+    interval = np.array(interval, dtype=np.int64)
+    reps = np.array(reps, dtype=np.int64)
+    next_due = np.array(next_due, dtype=np.int64)
+
+    counts = np.zeros(days, dtype=np.int64)
+    start = today.toordinal()
+    for offset in range(days):
+        day = start + offset
+        due = np.flatnonzero(next_due <= day)
+        counts[offset] = due.size
+        if not due.size:
+            continue
+        quality = np.where(rng.random(due.size) < recall_rate, QUALITY_CORRECT, QUALITY_WRONG)
+        ef[due], interval[due], reps[due] = sm2_update_batch(ef[due], interval[due], reps[due], quality)
+        next_due[due] = day + interval[due]
+    return counts
@@ -0,0 +1,94 @@
+"""
+SM‑2 복습 대기열 (Due Queue)
+=============================
+* next_due 날짜별 버킷 + 날짜 힙으로 카드를 관리
+* 오늘까지 만기된 카드는 ready 풀로 옮겨 두므로
+  - 만기 카드 수 : O(1)
+  - 다음 만기 카드 뽑기 : O(1) (무작위, 세션 셔플 대체)
+  - 채점 후 새 날짜로 이동 : O(log D)  (D = 서로 다른 예정일 수)
+* 전체 카드를 훑는 연산은 없음 (대기열 구성 시 1회 제외)
+"""
+from __future__ import annotations
+
+import datetime as dt
+import heapq
+import random
+from typing import Dict, Hashable, List, Tuple
+
+_READY = -1  # ready 풀에 있는 카드의 버킷 표식
+
+
+class DueQueue:
+    def __init__(self):
+        self._buckets: Dict[int, List[Hashable]] = {}   # 예정일(ordinal) → 카드 키
+        self._days: List[int] = []                       # 버킷이 있는 예정일 힙 (빈 버킷은 지연 삭제)
+        self._ready: List[Hashable] = []                 # 만기된 카드
+        self._slot: Dict[Hashable, Tuple[int, int]] = {}  # 카드 키 → (버킷, 버킷 내 위치)
+        self._horizon = 0                                # 이 날짜(ordinal)까지는 ready 풀로 이동 완료
+
+    def __len__(self) -> int:
+        return len(self._slot)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._slot
+
+    # ---------------- 갱신 ----------------
+    def add(self, key: Hashable, due: dt.date):
+        """카드를 예정일 버킷에 넣음 (이미 있으면 이동)"""
+        if key in self._slot:
+            self.remove(key)
+        day = due.toordinal()
+        if day <= self._horizon:
+            self._slot[key] = (_READY, len(self._ready))
+            self._ready.append(key)
+            return
+
+        bucket = self._buckets.get(day)
+        if bucket is None:
+            bucket = self._buckets[day] = []
+            heapq.heappush(self._days, day)
+        self._slot[key] = (day, len(bucket))
+        bucket.append(key)
+
+    def remove(self, key: Hashable):
+        """카드를 대기열에서 제거 (swap-remove, O(1))"""
+        day, pos = self._slot.pop(key)
+        bucket = self._ready if day == _READY else self._buckets[day]
+        last = bucket.pop()
+        if pos < len(bucket):
+            bucket[pos] = last
+            self._slot[last] = (day, pos)
+        if not bucket and day != _READY:
+            del self._buckets[day]
+
+    # ---------------- 조회 ----------------
+    def count_due(self, today: dt.date) -> int:
+        self._advance(today)
+        return len(self._ready)
+
+    def draw(self, today: dt.date) -> Hashable | None:
+        """만기 카드 하나를 무작위로 꺼냄 (없으면 None)"""
+        self._advance(today)
+        if not self._ready:
+            return None
+        key = self._ready[random.randrange(len(self._ready))]
+        self.remove(key)
+        return key
+
+    def due_keys(self, today: dt.date) -> List[Hashable]:
+        self._advance(today)
+        return list(self._ready)
+
+    # ---------------- 내부 ----------------
+    def _advance(self, today: dt.date):
+        """today까지 만기된 버킷을 ready 풀로 옮김 (카드당 한 번만 이동)"""
+        day_limit = today.toordinal()
+        while self._days and self._days[0] <= day_limit:
+            day = heapq.heappop(self._days)
+            bucket = self._buckets.pop(day, None)
+            if not bucket:
+                continue
+            for key in bucket:
+                self._slot[key] = (_READY, len(self._ready))
+                self._ready.append(key)
+        self._horizon = max(self._horizon, day_limit)
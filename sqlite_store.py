@@ -0,0 +1,197 @@
+"""
+SQLite 진행 상황/덱 저장소 (선택 백엔드)
+========================================
+* WAL 모드, synchronous=NORMAL
+* 테이블
+  - decks   : 덱 파일 경로
+  - cards   : 덱별 카드 (단어, 뜻, 덱 내 위치) — 카드 식별자 = (deck_id, word, meaning)
+  - stats   : 카드별 SM‑2 상태 (ef, interval, reps, next_due)
+  - history : 채점 이력 (날짜, quality, 결과)
+* 인덱스 : cards(deck_id, position), stats(next_due), history(card_id)
+  - progress.json 에서 가져온 결과(reviewed 가 NULL)는 카드당 한 줄 (부분 UNIQUE 인덱스)
+* 앱은 due_cards() 로 오늘 만기 카드만 조회 (progress.json 전체 로드 없음)
+
+가져오기(import) 사용법:
+    python sqlite_store.py progress.db progress.json 덱.txt|덱.csv|덱디렉터리 ...
+"""
+from __future__ import annotations
+
+import datetime as dt
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from deck_loader import load_csv_rows, parse_line
+
+DB_FILE = "progress.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS decks (
+    id    INTEGER PRIMARY KEY,
+    path  TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS cards (
+    id        INTEGER PRIMARY KEY,
+    deck_id   INTEGER NOT NULL REFERENCES decks(id),
+    position  INTEGER NOT NULL,
+    word      TEXT NOT NULL,
+    meaning   TEXT NOT NULL,
+    UNIQUE (deck_id, word, meaning)
+);
+CREATE INDEX IF NOT EXISTS idx_cards_deck ON cards(deck_id, position);
+CREATE TABLE IF NOT EXISTS stats (
+    card_id   INTEGER PRIMARY KEY REFERENCES cards(id),
+    ef        REAL NOT NULL,
+    interval  INTEGER NOT NULL,
+    reps      INTEGER NOT NULL,
+    next_due  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_stats_due ON stats(next_due);
+CREATE TABLE IF NOT EXISTS history (
+    id        INTEGER PRIMARY KEY,
+    card_id   INTEGER NOT NULL REFERENCES cards(id),
+    reviewed  TEXT,
+    quality   INTEGER,
+    result    INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_history_card ON history(card_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_history_imported ON history(card_id) WHERE reviewed IS NULL;
+"""
+
+# (card_id, position, word, meaning, ef, interval, reps, next_due)
+DueRow = Tuple[int, int, str, str, float, int, int, str]
+
+
+class SqliteStore:
+    def __init__(self, path: str = DB_FILE):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    # ---------------- 덱 ----------------
+    def import_deck(self, path: str, rows: Iterable[Tuple[str, str]]) -> Tuple[int, List[int]]:
+        """덱을 등록/갱신하고 (deck_id, 덱 순서대로의 card_id 목록)을 반환. 기존 카드의 통계는 유지."""
+        path = str(Path(path).resolve())
+        rows = list(rows)
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO decks(path) VALUES (?)", (path,))
+            (deck_id,) = self.conn.execute("SELECT id FROM decks WHERE path = ?", (path,)).fetchone()
+            # 덱 파일이 바뀌지 않았으면 (같은 카드, 같은 순서) 쓰기 없이 기존 id 반환
+            current = self.conn.execute(
+                "SELECT id, word, meaning FROM cards WHERE deck_id = ? AND position >= 0 ORDER BY position",
+                (deck_id,)).fetchall()
+            if len(current) == len(rows) and all(
+                    (word, meaning) == row for (_, word, meaning), row in zip(current, rows)):
+                return deck_id, [card_id for card_id, _, _ in current]
+            # 파일에서 사라진 카드는 position = -1 로 남겨 이력만 보존
+            self.conn.execute("UPDATE cards SET position = -1 WHERE deck_id = ?", (deck_id,))
+            self.conn.executemany(
+                "INSERT INTO cards(deck_id, position, word, meaning) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(deck_id, word, meaning) DO UPDATE SET position = excluded.position",
+                ((deck_id, pos, word, meaning) for pos, (word, meaning) in enumerate(rows)),
+            )
+            ids = {
+                (word, meaning): card_id
+                for card_id, word, meaning in self.conn.execute(
+                    "SELECT id, word, meaning FROM cards WHERE deck_id = ? AND position >= 0", (deck_id,))
+            }
+        return deck_id, [ids[row] for row in rows]
+
+    # ---------------- 조회 ----------------
+    def due_cards(self, deck_id: int, today: dt.date) -> List[DueRow]:
+        """오늘까지 만기인 카드 (통계가 없는 새 카드는 오늘 만기로 취급)"""
+        day = today.isoformat()
+        return self.conn.execute(
+            "SELECT c.id, c.position, c.word, c.meaning, "
+            "       COALESCE(s.ef, 2.5), COALESCE(s.interval, 0), COALESCE(s.reps, 0), COALESCE(s.next_due, ?) "
+            "FROM cards c LEFT JOIN stats s ON s.card_id = c.id "
+            "WHERE c.deck_id = ? AND c.position >= 0 AND (s.next_due IS NULL OR s.next_due <= ?)",
+            (day, deck_id, day),
+        ).fetchall()
+
+    def count_due(self, today: dt.date) -> int:
+        (n,) = self.conn.execute(
+            "SELECT COUNT(*) FROM stats WHERE next_due <= ?", (today.isoformat(),)).fetchone()
+        return n
+
+    # ---------------- 기록 ----------------
+    def record_review(self, card_id: int, ef: float, interval: int, reps: int,
+                      next_due: dt.date, quality: Optional[int], result: Optional[int]):
+        """SM‑2 상태 갱신 + 이력 추가 (한 트랜잭션)"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO stats(card_id, ef, interval, reps, next_due) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(card_id) DO UPDATE SET ef = excluded.ef, interval = excluded.interval, "
+                "reps = excluded.reps, next_due = excluded.next_due",
+                (card_id, ef, interval, reps, next_due.isoformat()),
+            )
+            self.conn.execute(
+                "INSERT INTO history(card_id, reviewed, quality, result) VALUES (?, ?, ?, ?)",
+                (card_id, dt.date.today().isoformat(), quality, result),
+            )
+
+    # ---------------- progress.json 가져오기 ----------------
+    def import_progress_json(self, json_path: str) -> int:
+        """progress.json 의 단어별 stats/results 를 같은 단어의 모든 카드에 적용. 적용한 카드 수 반환.
+        여러 번 실행해도 가져온 결과 이력은 카드당 한 줄 (마지막으로 가져온 값으로 교체)."""
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        stats: Dict[str, dict] = data.get("stats", {})
+        results: Dict[str, int] = data.get("results", {})
+
+        applied = 0
+        with self.conn:
+            for card_id, word in self.conn.execute("SELECT id, word FROM cards").fetchall():
+                st = stats.get(word)
+                if st is not None:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO stats(card_id, ef, interval, reps, next_due) VALUES (?, ?, ?, ?, ?)",
+                        (card_id, st["ef"], st["interval"], st["reps"], st["next_due"]),
+                    )
+                    applied += 1
+                if word in results:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO history(card_id, reviewed, quality, result) VALUES (?, NULL, NULL, ?)",
+                        (card_id, int(results[word])),
+                    )
+        return applied
+
+
+def read_deck(path: Path) -> List[Tuple[str, str]]:
+    """.txt(단어\\뜻) 또는 .csv 덱의 (단어, 뜻) 목록"""
+    if path.suffix.lower() == ".csv":
+        return [(w, m) for w, m, _ in load_csv_rows(str(path))]
+    rows = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            row = parse_line(line)
+            if row is not None:
+                rows.append(row[:2])
+    return rows
+
+
+def main(db_path: str, json_path: str, deck_paths: List[str]) -> None:
+    store = SqliteStore(db_path)
+    files: List[Path] = []
+    for p in map(Path, deck_paths):
+        files.extend(sorted(p.rglob("*.txt")) + sorted(p.rglob("*.csv")) if p.is_dir() else [p])
+    for f in files:
+        _, card_ids = store.import_deck(str(f), read_deck(f))
+        print(f"덱 {f}: {len(card_ids)}장")
+    if Path(json_path).exists():
+        print(f"progress.json → 통계 {store.import_progress_json(json_path)}장 적용")
+    store.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 4:
+        print("사용법: python sqlite_store.py progress.db progress.json 덱.txt|덱.csv|덱디렉터리 ...")
+        sys.exit(1)
+    main(sys.argv[1], sys.argv[2], sys.argv[3:])
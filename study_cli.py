@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+터미널 학습 (Tk를 import하지 않음)
+- GUI와 같은 StudyEngine으로 덱/폴더를 열고 채점은 같은 저널/덱 파일에 저장
+- 세션 스냅샷이 있으면 마지막 카드/순서/방향에서 이어서, 종료할 때 기록
+  (--restart 또는 순서/방향 옵션 --shuffle/--seed/--reverse를 주면 스냅샷 대신 그 설정으로 처음부터)
+- 명령 (입력 후 Enter)
+    (빈 줄)  답 보기 → 다음 카드
+    a, 1     정답 후 다음 카드      s, 0   오답 후 다음 카드
+    p        이전 카드              r      재시작
+    t        방향 전환              /검색어 단어/뜻 검색 (다시 입력하면 다음 결과)
+    q        종료 (채점 결과를 덱 파일에 반영)
+사용법:
+    python study_cli.py <덱.txt | 폴더> [--shuffle] [--seed N] [--reverse] [--interleave] [--restart]
+    python study_cli.py                         # 마지막으로 학습한 덱 이어서
+    python study_cli.py <덱.txt> --first-card   # 첫 카드만 출력하고 종료 (시작 시간 측정용)
+"""
+
+import argparse
+import sys
+
+import session_snapshot
+from study_engine import StudyEngine
+
+HELP = "Enter: 답/다음  a: 정답  s: 오답  p: 이전  r: 재시작  t: 방향 전환  /검색어  q: 종료"
+RESULT_MARKS = {'1': " ✓", '0': " ✗"}
+
+
+def show_card(engine: StudyEngine):
+    question, answer, result = engine.current_card()
+    print(f"[{engine.progress_text()}]{RESULT_MARKS.get(result, '')}  Q: {question}")
+    if engine.show_answer:
+        print(f"  A: {answer}")
+
+
+def next_card(engine: StudyEngine):
+    if engine.advance():
+        show_card(engine)
+    else:
+        print("모든 카드를 학습했습니다! (r: 재시작, q: 종료)")
+
+
+def study(engine: StudyEngine):
+    """명령을 읽어 학습 (EOF/Ctrl+C도 종료)"""
+    print(HELP)
+    show_card(engine)
+    while True:
+        try:
+            command = input("> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            return
+
+        if command == 'q':
+            return
+        elif command == '':
+            if engine.show_answer:
+                next_card(engine)
+            else:
+                engine.show_answer = True
+                show_card(engine)
+        elif command in ('a', '1', 's', '0'):
+            engine.grade('1' if command in ('a', '1') else '0')
+            next_card(engine)
+        elif command == 'p':
+            if engine.back():
+                show_card(engine)
+        elif command == 'r':
+            engine.restart()
+            show_card(engine)
+        elif command == 't':
+            engine.reverse_mode = not engine.reverse_mode
+            engine.show_answer = False
+            show_card(engine)
+        elif command.startswith('/') and command[1:].strip():
+            found = engine.find_next(command[1:].strip())
+            if found is None:
+                print("결과 없음")
+            else:
+                print(f"검색 결과 {found[0] + 1}/{found[1]}")
+                show_card(engine)
+        else:
+            print(HELP)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="플래시카드 터미널 학습")
+    parser.add_argument('path', nargs='?', help="덱 파일(.txt) 또는 덱 폴더 (생략하면 마지막으로 학습한 덱)")
+    parser.add_argument('--shuffle', action='store_true', help="카드 순서 섞기")
+    parser.add_argument('--seed', type=int, help="셔플 시드 (같은 시드 = 같은 순서, --shuffle 포함)")
+    parser.add_argument('--reverse', action='store_true', help="정답 → 단어 방향으로 학습")
+    parser.add_argument('--interleave', action='store_true', help="폴더의 덱들을 번갈아 출제")
+    parser.add_argument('--restart', action='store_true',
+                        help="스냅샷을 무시하고 처음부터 (--shuffle/--seed/--reverse를 주면 자동)")
+    parser.add_argument('--jobs', type=int, default=1, help="폴더를 읽을 프로세스 수")
+    parser.add_argument('--first-card', action='store_true', help="첫 카드만 출력하고 종료")
+    args = parser.parse_args(argv)
+    path = args.path or session_snapshot.last_deck()
+    if path is None:
+        parser.error("이어서 학습할 덱이 없습니다. 덱 파일이나 폴더를 지정하세요.")
+
+    engine = StudyEngine()
+    engine.shuffle_enabled = args.shuffle or args.seed is not None
+    engine.seed = args.seed
+    engine.reverse_mode = args.reverse
+    # 직접 준 순서/방향 옵션이 스냅샷보다 우선
+    engine.resume = not (args.restart or args.shuffle or args.seed is not None or args.reverse)
+    try:
+        engine.load(path, args.jobs)
+        if args.interleave and engine.session is None:
+            engine.start_session()
+    except (OSError, ValueError) as e:
+        print(f"파일을 열 수 없습니다: {e}", file=sys.stderr)
+        engine.close()
+        return 1
+
+    try:
+        if args.first_card:
+            show_card(engine)
+        else:
+            study(engine)
+    finally:
+        engine.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
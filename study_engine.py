@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+플래시카드 학습 엔진 (Tk 없음)
+- 덱/폴더 열기, 학습 순서(셔플, 덱 섞어 학습), 채점, 저널 저장/compact, 검색
+- GUI(flash_card_ver7)와 터미널 학습(study_cli)이 같은 엔진을 사용
+- 덱을 열면 세션 스냅샷(session_snapshot)으로 마지막 카드/순서/방향을 복원, 닫을 때 기록
+- 화면/대화상자가 필요한 곳은 훅으로 분리
+    report_error(title, message)  저장 오류 등 알림 (기본: 표준 오류로 출력)
+    schedule_compaction()         저널이 충분히 쌓였을 때 (기본: 바로 compact, GUI는 입력이 멈춘 뒤로 미룸)
+    cancel_compaction()           예약된 compact 취소
+    schedule_snapshot()           위치/순서가 바뀜 (기본: 아무것도 안 함 — 닫을 때만 기록, GUI는 쉬는 동안 기록)
+- 사용 예
+    engine = StudyEngine()
+    engine.load('덱.txt')            # 폴더면 폴더 아래 덱 전체
+    question, answer, result = engine.current_card()
+    engine.grade('1'); engine.advance()
+    engine.close()
+"""
+
+import os
+import sys
+import time
+from array import array
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import session_snapshot
+from card_store import CardStore
+from deck_loader import MappedDeck
+from deck_set import DeckSet, JournalSet, MemoryDeck, iter_deck_files, scan_deck
+from interleave import InterleavedSession
+from journal_writer import JournalWriter
+from result_journal import ResultJournal
+from search_index import SearchIndex
+
+if TYPE_CHECKING:
+    from background_loader import DeckLoader
+
+SEARCH_LIMIT = 1000  # 검색 결과 최대 개수
+
+
+class StudyEngine:
+    def __init__(self):
+        self.store = CardStore()  # 카드 ID = 원본 순서상의 위치, store.order = 학습 순서
+        self.current_index = 0
+        self.show_answer = False
+        self.file_path: Optional[str] = None  # 연 덱 파일 또는 폴더
+        self.reverse_mode = False  # False: 단어→정답, True: 정답→단어
+        self.shuffle_enabled = False  # 셔플 활성화 여부
+        self.seed: Optional[int] = None  # 셔플 시드 (None이면 셔플할 때마다 새로, 같은 시드 = 같은 순서)
+        self.journal: Optional[ResultJournal] = None  # 채점 결과 저널 (폴더면 JournalSet)
+        self.writer: Optional[JournalWriter] = None  # 저널 write-behind 저장 스레드
+        self.search_index: Optional[SearchIndex] = None  # 단어/뜻 검색 색인
+        self.search_query = ""  # 마지막 검색어
+        self.search_hits: List[int] = []  # 마지막 검색 결과 (카드 ID)
+        self.search_hit = -1  # 지금 보고 있는 검색 결과 위치
+        self.loader: Optional['DeckLoader'] = None  # 진행 중인 백그라운드 로딩 (GUI)
+        self.session: Optional[InterleavedSession] = None  # 덱 섞어 학습 (store.order = 지금까지 뽑은 카드)
+        self.deck_weights: Dict[str, Tuple[float, Optional[int]]] = {}  # 덱 이름 → (가중치, 할당량)
+        self.resume = True  # 덱을 열 때 스냅샷이 있으면 마지막 카드에서 이어서
+
+    # ---------- 훅 ----------
+    def report_error(self, title: str, message: str):
+        print(f"[{title}] {message}", file=sys.stderr)
+
+    def schedule_compaction(self):
+        self.compact_results()
+
+    def cancel_compaction(self):
+        pass
+
+    def schedule_snapshot(self):
+        pass
+
+    # ---------- 열기/닫기 ----------
+    def load(self, path: str, jobs: int = 1):
+        """덱 파일 또는 덱 폴더를 한 번에 열기"""
+        if os.path.isdir(path):
+            self.load_folder(path, jobs)
+        else:
+            self.load_cards(path)
+
+    def load_cards(self, file_path: str):
+        """파일에서 카드 데이터를 한 번에 로드 (줄 오프셋 인덱스만 구성, 카드 내용은 표시할 때 디코딩)"""
+        deck = MappedDeck(file_path)
+        if not len(deck):
+            deck.close()
+            raise ValueError("유효한 카드를 찾을 수 없습니다.")
+        self.attach(CardStore.from_source(deck), file_path, ResultJournal(file_path))
+
+    def load_folder(self, folder: str, jobs: int = 1):
+        """폴더 아래 .txt 덱 전체를 한 번에 로드 (jobs > 1이면 프로세스 풀)"""
+        paths = iter_deck_files(folder)
+        deck_set = DeckSet(folder)
+        if jobs > 1 and len(paths) > 1:
+            from multiprocessing import Pool
+            with Pool(min(jobs, len(paths))) as pool:
+                for result in pool.imap(scan_deck, paths, chunksize=max(1, len(paths) // (jobs * 8))):
+                    deck_set.add(MemoryDeck(*result))
+        else:
+            for path in paths:
+                deck_set.add(MemoryDeck(*scan_deck(path)))
+        if not len(deck_set):
+            raise ValueError("유효한 카드를 찾을 수 없습니다.")
+        self.attach(CardStore.from_source(deck_set), folder, JournalSet(deck_set))
+
+    def attach(self, store: CardStore, path: str, journal: ResultJournal):
+        """다 읽은 카드 저장소로 전환 (이전 덱 정리 → 크래시 복구 → 학습 순서 초기화)"""
+        self.close()
+        if journal.replay(store):
+            journal.compact(store)
+        self.store = store
+        self.file_path = path
+        self.open_journal(journal)
+        if self.resume_snapshot():
+            return
+        self.reset_order()
+
+    def close(self):
+        """세션 스냅샷을 남기고 채점 결과를 덱 파일에 반영한 뒤 덱 닫기"""
+        self.save_snapshot()
+        self.compact_results()
+        self.save_search_index()
+        self.reset()
+
+    def reset(self):
+        """반영 없이 덱 상태 정리 (남은 채점은 저널에 있어 다음에 열 때 반영)"""
+        self.close_journal()
+        self.store.close()
+        self.store = CardStore()
+        self.file_path = None
+        self.session = None
+        self.search_index = None
+        self.search_query = ""
+        self.search_hits = []
+        self.search_hit = -1
+        self.current_index = 0
+        self.show_answer = False
+
+    # ---------- 학습 순서 ----------
+    def reset_order(self):
+        """셔플 설정에 따라 카드 순서 결정 (시드 순열이라 덱 크기와 무관하게 즉시)"""
+        self.store.reset_order()
+        if self.shuffle_enabled:
+            self.store.shuffle(seed=self.seed)
+        self.current_index = 0
+        self.show_answer = False
+        self.schedule_snapshot()
+
+    def deck_settings(self, name: str) -> Tuple[float, Optional[int]]:
+        return self.deck_weights.get(name, (1.0, None))
+
+    def start_session(self):
+        """폴더의 덱들을 가중치/할당량대로 번갈아 내는 세션 시작 (카드는 필요할 때 한 장씩 뽑음)"""
+        session = self.new_session()
+        first = session.draw()
+        if first is None:
+            raise ValueError("가중치가 0보다 큰 덱에 남은 카드가 없습니다.")
+
+        self.session = session
+        self.store.order = array('l', [first])
+        self.current_index = 0
+        self.show_answer = False
+        self.schedule_snapshot()
+
+    def new_session(self) -> InterleavedSession:
+        """지금 덱별 설정으로 만든 덱 섞어 학습 세션 (아직 뽑지 않음)"""
+        deck_set = self.store.source
+        if not isinstance(deck_set, DeckSet) or self.loader is not None:
+            raise ValueError("폴더를 연 뒤(불러오기가 끝난 뒤) 사용할 수 있습니다.")
+
+        names = [deck_set.name(index) for index in range(len(deck_set.decks))]
+        settings = [self.deck_settings(name) for name in names]
+        return InterleavedSession(
+            deck_set.offsets, [weight for weight, _ in settings], [quota for _, quota in settings],
+            shuffle=self.shuffle_enabled)
+
+    def stop_session(self):
+        self.session = None
+        self.reset_order()
+
+    def restart(self):
+        """학습 재시작 (덱 섞어 학습 중이면 같은 설정으로 세션을 새로 시작)"""
+        if self.session is not None:
+            self.start_session()
+        else:
+            self.reset_order()
+
+    def draw_next(self) -> bool:
+        """덱 섞어 학습: 다음 카드를 한 장 뽑아 학습 순서 끝에 붙임"""
+        if self.session is None:
+            return False
+        card_id = self.session.draw()
+        if card_id is None:
+            return False
+        self.store.order.append(card_id)
+        return True
+
+    def advance(self) -> bool:
+        """다음 카드로 (마지막 카드였으면 False)"""
+        if self.current_index < len(self.store.order) - 1 or self.draw_next():
+            self.current_index += 1
+            self.show_answer = False
+            self.schedule_snapshot()
+            return True
+        return False
+
+    def back(self) -> bool:
+        if self.current_index > 0:
+            self.current_index -= 1
+            self.show_answer = False
+            self.schedule_snapshot()
+            return True
+        return False
+
+    # ---------- 현재 카드 ----------
+    def current_card(self) -> Tuple[str, str, str]:
+        """학습 방향에 맞춘 (질문, 답, 결과)"""
+        word, meaning, result = self.store.card(self.current_index)
+        if self.reverse_mode:
+            return meaning, word, result
+        return word, meaning, result
+
+    def progress_text(self) -> str:
+        if not self.store:
+            return "불러오는 중..."
+        total = len(self.store.order) + self.session.remaining if self.session is not None else len(self.store)
+        text = f"{self.current_index + 1}/{total}"
+        if isinstance(self.store.source, DeckSet):
+            text += f"  [{self.store.source.deck_name(self.store.card_id(self.current_index))}]"
+        return text
+
+    def current_deck_path(self) -> Optional[str]:
+        """지금 카드가 속한 덱 파일 (폴더 세션이면 그 카드의 덱)"""
+        if isinstance(self.store.source, DeckSet) and self.store:
+            return self.store.source.deck_of(self.store.card_id(self.current_index)).path
+        return self.file_path
+
+    # ---------- 채점/저장 ----------
+    def grade(self, result: str):
+        """현재 카드 채점 ('1' 정답, '0' 오답)"""
+        self.store.set_result(self.store.card_id(self.current_index), result)
+        self.save_results()
+        self.schedule_snapshot()
+
+    def save_results(self):
+        """현재 카드의 결과를 저널에 기록 (전체 파일 재작성 없음)"""
+        if not self.file_path or self.journal is None:
+            return
+
+        # 카드 ID(= 원본 순서상의 위치)로 기록 — 디스크 쓰기는 저장 스레드가 모아서 처리
+        card_id = self.store.card_id(self.current_index)
+        self.writer.put(card_id, self.store.result(card_id))
+        error = self.writer.take_error()
+        if error is not None:
+            self.report_error("저장 오류", f"결과를 저장하는 중 오류가 발생했습니다:\n{str(error)}")
+
+        if self.journal.pending + self.writer.backlog >= self.journal.compact_threshold:
+            self.schedule_compaction()
+
+    def open_journal(self, journal: ResultJournal):
+        """저널과 그 저장 스레드 시작"""
+        self.journal = journal
+        self.writer = JournalWriter(journal)
+        self.writer.start()
+
+    def close_journal(self):
+        """남은 채점을 저널에 기록하고 저장 스레드/저널 닫기"""
+        self.cancel_compaction()
+        if self.writer is not None:
+            try:
+                self.writer.close()
+            except Exception as e:
+                self.report_error("저장 오류", f"결과를 저장하는 중 오류가 발생했습니다:\n{str(e)}")
+        self.writer = None
+        if self.journal is not None:
+            self.journal.close()
+        self.journal = None
+
+    def flush_results(self) -> bool:
+        """저장 스레드에 쌓인 채점을 저널에 기록·fsync (실패하면 False)"""
+        if self.writer is None:
+            return True
+        try:
+            self.writer.flush()
+        except Exception as e:
+            self.report_error("저장 오류", f"결과를 저장하는 중 오류가 발생했습니다:\n{str(e)}")
+            return False
+        return True
+
+    def compact_results(self):
+        """저널에 쌓인 결과를 원본 순서로 파일에 반영 (저널이 먼저 fsync된 뒤에만)"""
+        if self.journal is None or self.loader is not None:
+            return  # 로딩 중에는 덱 파일을 교체하지 않음 (끝난 뒤 반영)
+        if not self.flush_results() or not self.journal.pending:
+            return
+
+        try:
+            self.journal.compact(self.store)
+            if self.search_index is not None:
+                self.search_index.cache_stale = True  # 내용은 같지만 파일이 바뀌어 캐시 헤더가 맞지 않음
+        except Exception as e:
+            self.report_error("저장 오류", f"결과를 저장하는 중 오류가 발생했습니다:\n{str(e)}")
+
+    # ---------- 검색 ----------
+    def ensure_search_index(self) -> Optional[SearchIndex]:
+        """검색 색인 (처음 검색할 때 캐시에서 읽거나 구성, 백그라운드 로딩 중이면 None)"""
+        if self.search_index is None and self.store and self.loader is None:
+            texts = lambda: ((word, meaning) for word, meaning, _ in self.store.iter_rows())
+            if os.path.isfile(self.file_path):
+                self.search_index = SearchIndex.for_deck(self.file_path, texts)
+            else:
+                self.search_index = SearchIndex.build(texts())
+        return self.search_index
+
+    def save_search_index(self):
+        """compact로 덱 파일이 바뀌었으면 검색 색인 캐시를 새 파일 기준으로 다시 기록"""
+        if self.search_index is None or not self.search_index.cache_stale or not self.file_path:
+            return
+        if not os.path.isfile(self.file_path):
+            return  # 폴더 세션의 색인은 캐시하지 않음
+        try:
+            self.search_index.save(self.file_path)
+        except OSError:
+            pass  # 캐시는 없어도 동작
+
+    def find_next(self, query: str) -> Optional[Tuple[int, int]]:
+        """query가 단어나 뜻에 들어간 다음 카드로 이동 → (몇 번째 결과, 결과 수), 없으면 None
+        (같은 검색어로 다시 부르면 다음 결과)"""
+        index = self.ensure_search_index()
+        if index is None:
+            return None
+        if query != self.search_query:
+            self.search_query = query
+            self.search_hits = index.search(
+                query, lambda card_id: (self.store.word(card_id), self.store.meaning(card_id)), SEARCH_LIMIT)
+            self.search_hit = -1
+        if not self.search_hits:
+            return None
+
+        self.search_hit = (self.search_hit + 1) % len(self.search_hits)
+        card_id = self.search_hits[self.search_hit]
+        try:
+            self.current_index = self.store.order.index(card_id)
+        except ValueError:
+            # 덱 섞어 학습에서 아직 나오지 않은 카드 → 세션에서 빼고 지금 카드 다음에 끼워 넣음
+            self.session.take(card_id)
+            self.current_index += 1
+            self.store.order.insert(self.current_index, card_id)
+        self.show_answer = False
+        self.schedule_snapshot()
+        return self.search_hit, len(self.search_hits)
+
+    # ---------- 세션 스냅샷 ----------
+    def snapshot(self) -> Optional[Dict]:
+        """지금 위치/방향/학습 순서 (순열 대신 셔플 시드, 덱 섞어 학습이면 나온 카드 ID)"""
+        if not self.store or not self.file_path or self.loader is not None:
+            return None
+        snapshot = {
+            'cards': len(self.store),
+            'position': self.current_index,
+            'reverse': self.reverse_mode,
+            'shuffle': self.shuffle_enabled,
+            'shuffles': [list(entry) for entry in self.store.shuffles],
+            'time': time.time(),
+        }
+        if self.deck_weights:
+            snapshot['weights'] = {name: list(setting) for name, setting in self.deck_weights.items()}
+        if self.session is not None:
+            snapshot['drawn'] = self.store.order.tolist()
+        return snapshot
+
+    def save_snapshot(self):
+        snapshot = self.snapshot()
+        if snapshot is None:
+            return
+        try:
+            session_snapshot.save(self.file_path, snapshot)
+        except OSError:
+            pass  # 스냅샷은 없어도 동작 (처음부터 학습)
+
+    def resume_snapshot(self) -> bool:
+        """연 덱의 스냅샷이 있으면 그 순서/위치/방향으로 복원 (맞지 않는 스냅샷은 무시)"""
+        if not self.resume or not self.store:
+            return False
+        snapshot = session_snapshot.load(self.file_path)
+        if not isinstance(snapshot, dict) or snapshot.get('cards') != len(self.store):
+            return False
+        try:
+            weights = {name: (float(weight), None if quota is None else int(quota))
+                       for name, (weight, quota) in snapshot.get('weights', {}).items()}
+            shuffles = [(int(start), int(end), int(seed)) for start, end, seed in snapshot['shuffles']]
+            drawn = [int(card_id) for card_id in snapshot['drawn']] if 'drawn' in snapshot else None
+            position = int(snapshot['position'])
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return False
+
+        self.deck_weights.update(weights)
+        self.shuffle_enabled = bool(snapshot.get('shuffle'))
+        if drawn is not None:
+            if not self.resume_session(drawn):
+                self.reset_order()
+                return False
+        elif not self.store.replay_shuffles(shuffles):
+            self.reset_order()
+            return False
+        self.reverse_mode = bool(snapshot.get('reverse'))
+        self.current_index = min(max(position, 0), len(self.store.order) - 1)
+        self.show_answer = False
+        return True
+
+    def resume_session(self, drawn: List[int]) -> bool:
+        """덱 섞어 학습 이어 하기: 이미 나온 카드는 세션에서 빼고 남은 카드만 앞으로 뽑음"""
+        if not drawn or any(not 0 <= card_id < len(self.store) for card_id in drawn):
+            return False
+        try:
+            session = self.new_session()
+        except ValueError:
+            return False
+        for card_id in drawn:
+            session.take(card_id)
+        self.session = session
+        self.store.order = array('l', drawn)
+        return True
@@ -1,18 +1,38 @@
 #!/usr/bin/env python3
 """
 변환 스크립트: '단어\\의미'를 '의미\\단어'로 바꾼 뒤 새로운 디렉터리에 저장
-사용법: python transform_flashcards.py /path/to/정처기공부파일
+사용법: python transform_flashcards.py /path/to/정처기공부파일 [--jobs N] [--full]
+- 증분 변환: 결과 디렉터리의 매니페스트(원본 크기/mtime/해시 → 결과 해시)로
+  바뀐 파일만 다시 검증·변환하고, 원본이 사라진 결과 파일은 삭제
+  (크기/mtime이 같으면 stat만으로 건너뜀, mtime만 다르면 내용 해시로 재확인)
+- 파일별 검증+변환은 프로세스 풀에서 실행 (--jobs, 기본 CPU 수)
+- 검증과 변환은 한 번의 읽기로 처리: 줄마다 '\\' 규칙을 검사하면서 임시 파일에 쓰고,
+  파일 전체가 통과했을 때만 os.replace로 반영 (원본/결과 해시도 같은 패스에서 계산)
+- --full: 매니페스트와 상관없이 전부 다시 변환 (원본이 사라진 결과 파일 삭제는 그대로)
 """
 from pathlib import Path
-import sys
+from multiprocessing import Pool
+from typing import Dict, Iterator, Tuple
+import argparse
+import hashlib
+import io
+import json
+import mmap
+import os
 import logging
-from validate_flashcards import validate_file
+from deck_cache import content_hash
+from validate_flashcards import MAX_REPORTED_LINES
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(levelname)s | %(message)s",
 )
 
+MANIFEST_NAME = ".transform_manifest.json"
+MANIFEST_VERSION = 1
+OUT_BUFFER_SIZE = 1 << 20  # 변환 결과를 이만큼 모아서 임시 파일에 씀
+
+
 def transform_line(line: str) -> str:
     line = line.rstrip("\n")
     if line.strip() == "":
@@ -24,30 +44,269 @@ def transform_line(line: str) -> str:
         logging.warning(f"⚠️ 변환 실패 (\\ 없음): {line!r}")
         return line + "\n"
 
-def process_file(src: Path, dst_root: Path) -> None:
-    dst_path = dst_root / src.relative_to(src.parents[1])
+def _is_blank(segment: bytes) -> bool:
+    """str.strip() 기준 공백 줄인지 (ASCII 공백으로 먼저 판정하고, 남는 게 있으면 디코딩해서 확인)"""
+    stripped = segment.strip()
+    return not stripped or not stripped.decode("utf-8", "replace").strip()
+
+
+def _next_cut(data, pos: int, end: int) -> int:
+    """pos 부터 약 OUT_BUFFER_SIZE 바이트 안에서 마지막 줄바꿈 바로 뒤 위치 (블록을 줄 경계에서 자르기 위함)"""
+    limit = pos + OUT_BUFFER_SIZE
+    if limit >= end:
+        return end
+    cut = data.rfind(b"\n", pos, limit) + 1
+    if cut <= pos:
+        # \n 없이 \r 만 쓰는 파일 (\r\n 사이를 자르지 않도록 마지막 바이트는 제외)
+        cut = data.rfind(b"\r", pos, limit - 1) + 1
+    if cut <= pos:
+        # 블록보다 긴 줄: 그 줄 끝까지 한 블록으로
+        cut = data.find(b"\n", limit) + 1 or end
+    return cut
+
+
+def _transform_buffer(data, write, validate: bool = False) -> Tuple[int, list]:
+    r"""
+    바이트 단위 변환 엔진. data(bytes/mmap)를 find로 줄 경계를 찾아 약 OUT_BUFFER_SIZE 크기의
+    블록으로 나누고, 블록마다 줄을 첫 '\' 위치에서 갈라 '오른쪽\왼쪽' 으로 이어 붙여
+    write(블록 결과)로 바로 내보냄 (str 디코딩 없음, 메모리는 파일 크기와 무관하게 블록 몇 개 분량).
+    결과는 transform_line을 텍스트 모드로 돌린 것과 바이트 단위로 동일
+    (줄바꿈 \r\n·\r 은 \n 으로, 공백 줄은 \n 으로, '\' 없는 줄은 그대로).
+    validate=True 이면 첫 실패 줄부터는 출력을 멈추고 검사만 계속.
+    반환: (검증 실패 줄 수, 실패 줄 번호 일부)
+    """
+    end = len(data)
+    has_cr = data.find(b"\r") >= 0
+    bad = 0
+    bad_lines = []
+    line_no = 0
+    pos = 0
+    while pos < end:
+        cut = _next_cut(data, pos, end)
+        block = data[pos:cut]
+        pos = cut
+        if has_cr:
+            # 텍스트 모드의 universal newlines 와 같게 맞춤 (블록은 \r\n 사이에서 잘리지 않음)
+            block = block.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        lines = block.split(b"\n")
+        if not lines[-1]:
+            lines.pop()  # 마지막 줄바꿈 뒤의 빈 조각
+        out = []
+        append = out.append
+        for line_no, line in enumerate(lines, line_no + 1):
+            left, sep, right = line.partition(b"\\")
+            if sep:
+                append(right + sep + left)
+                if validate and b"\\" in right:
+                    bad += 1
+                    if len(bad_lines) < MAX_REPORTED_LINES:
+                        bad_lines.append(line_no)
+            elif _is_blank(line):
+                append(b"")
+            else:
+                append(line)
+                if validate:
+                    bad += 1
+                    if len(bad_lines) < MAX_REPORTED_LINES:
+                        bad_lines.append(line_no)
+                else:
+                    logging.warning(f"⚠️ 변환 실패 (\\ 없음): {line.decode('utf-8', 'replace')!r}")
+        if not bad:
+            append(b"")
+            write(b"\n".join(out))
+    return bad, bad_lines
+
+
+def transform_bytes(data) -> bytes:
+    """파일 전체(bytes/mmap)를 바이트 단위로 변환 — transform_line 을 줄마다 적용한 것과 동일"""
+    out = io.BytesIO()
+    _transform_buffer(data, out.write)
+    return out.getvalue()
+
+
+def convert_file(src: str, dst: str) -> dict:
+    """
+    원본을 mmap으로 한 번만 훑으며 검증과 변환을 함께 수행.
+    변환 결과는 버퍼 단위로 임시 파일에 바로 씀 (파일 전체를 메모리에 만들지 않음).
+    모든 줄이 통과하면 임시 파일을 dst로 원자적으로 교체하고, 아니면 임시 파일을 버림.
+    반환: {"ok", "bad", "bad_lines", "src_hash", "dst_hash"(통과 시)}
+    """
+    tmp = dst + ".tmp"
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    out_digest = hashlib.blake2b(digest_size=16)
+
+    def write(chunk):
+        out_digest.update(chunk)
+        w.write(chunk)
+
+    with open(src, "rb") as f, open(tmp, "wb") as w:
+        size = os.fstat(f.fileno()).st_size
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        try:
+            src_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+            bad, bad_lines = _transform_buffer(data, write, validate=True)
+        finally:
+            if size:
+                data.close()
+
+    result = {"ok": not bad, "bad": bad, "bad_lines": bad_lines, "src_hash": src_hash}
+    if bad:
+        os.remove(tmp)
+    else:
+        os.replace(tmp, dst)
+        result["dst_hash"] = out_digest.hexdigest()
+    return result
+
+
+def process_file(src: Path, dst_path: Path) -> None:
+    """src를 변환해 dst_path에 원자적으로 기록 (임시 파일 → os.replace)"""
     dst_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dst_path.with_name(dst_path.name + ".tmp")
 
-    with src.open(encoding="utf-8") as r, dst_path.open("w", encoding="utf-8") as w:
+    with src.open(encoding="utf-8") as r, tmp_path.open("w", encoding="utf-8") as w:
         for line in r:
             transformed = transform_line(line)
             w.write(transformed)
+    os.replace(tmp_path, dst_path)
+
 
-    logging.info(f"✔️ {src.name} → {dst_path.relative_to(dst_root.parent)}")
+def build_file(job: Tuple[str, str, str]) -> Tuple[str, dict]:
+    """(풀 작업) 파일 한 개를 검증하고 통과하면 변환. (상대 경로, 매니페스트 항목) 반환"""
+    rel, src, dst = job
+    stat = os.stat(src)
+    result = convert_file(src, dst)
+    entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "src_hash": result["src_hash"], "ok": result["ok"]}
+    if not result["ok"]:
+        logging.warning(
+            f"[{os.path.basename(src)}] '\\' 갯수 오류 {result['bad']}줄 (줄 번호: {result['bad_lines']})"
+        )
+        return rel, entry
 
-def main(root: Path) -> None:
+    dst_stat = os.stat(dst)
+    entry.update(dst_hash=result["dst_hash"], dst_size=dst_stat.st_size, dst_mtime_ns=dst_stat.st_mtime_ns)
+    return rel, entry
+
+
+def iter_sources(root: Path) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """root 아래 .txt 파일의 (상대 경로, 경로, stat) — os.scandir로 재귀 탐색 (Path 객체 생성 없음)"""
+    stack = [("", str(root))]
+    while stack:
+        rel_dir, path = stack.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((rel, entry.path))
+                elif entry.name.endswith(".txt") and entry.is_file():
+                    yield rel, entry.path, entry.stat()
+
+
+def load_manifest(dst_root: Path) -> Dict[str, dict]:
+    try:
+        with (dst_root / MANIFEST_NAME).open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def save_manifest(dst_root: Path, files: Dict[str, dict]) -> None:
+    path = dst_root / MANIFEST_NAME
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "files": files}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def is_fresh(entry: dict, stat: os.stat_result, src: str, dst: str) -> bool:
+    """원본과 결과가 매니페스트에 기록된 그대로인지 (mtime만 다르면 해시로 확인 후 항목 갱신)"""
+    if entry.get("size") != stat.st_size:
+        return False
+    if entry.get("mtime_ns") != stat.st_mtime_ns:
+        if content_hash(src).hex() != entry.get("src_hash"):
+            return False
+        entry["mtime_ns"] = stat.st_mtime_ns
+    if not entry.get("ok"):
+        return True  # 검증 실패한 원본이 그대로면 다시 검사할 필요 없음
+    try:
+        dst_stat = os.stat(dst)
+    except OSError:
+        return False
+    return entry.get("dst_size") == dst_stat.st_size and entry.get("dst_mtime_ns") == dst_stat.st_mtime_ns
+
+
+def remove_output(dst_root: Path, rel: str) -> None:
+    """원본이 사라진 결과 파일을 지우고, 비게 된 하위 디렉터리도 정리"""
+    dst = dst_root / rel
+    dst.unlink(missing_ok=True)
+    for parent in dst.parents:
+        if parent == dst_root:
+            break
+        try:
+            parent.rmdir()
+        except OSError:
+            break
+
+
+def main(root: Path, jobs: int = os.cpu_count() or 1, full: bool = False) -> None:
     dst_root = root.parent / f"{root.name}reverse"
     dst_root.mkdir(exist_ok=True)
 
-    for txt_file in root.rglob("*.txt"):
-        if validate_file(txt_file):
-            process_file(txt_file, dst_root)
+    old = load_manifest(dst_root)  # --full이어도 삭제 대상 추적에 필요
+    manifest: Dict[str, dict] = {}
+    todo = []
+    changed = False  # 매니페스트를 다시 써야 하는지
+    dst_dir = str(dst_root)
+    for rel, src, stat in iter_sources(root):
+        dst = os.path.join(dst_dir, rel)
+        entry = old.get(rel)
+        mtime_ns = entry and entry.get("mtime_ns")
+        if not full and entry is not None and is_fresh(entry, stat, src, dst):
+            manifest[rel] = entry
+            changed |= entry["mtime_ns"] != mtime_ns
         else:
-            logging.error(f"⚠️  검증 실패 → 변환 건너뜀: {txt_file}")
-    logging.info(f"✅ 변환 완료. 결과 디렉터리: {dst_root}")
+            todo.append((rel, src, dst))
+
+    current = manifest.keys() | {job[0] for job in todo}
+    removed = [rel for rel in old if rel not in current]
+    for rel in removed:
+        remove_output(dst_root, rel)
+        logging.info(f"🗑️ 원본 없음 → 삭제: {rel}")
+
+    failed = [rel for rel, entry in manifest.items() if not entry.get("ok")]
+    if todo:
+        pool = Pool(min(jobs, len(todo))) if jobs > 1 and len(todo) > 1 else None
+        try:
+            results = pool.imap_unordered(build_file, todo, chunksize=8) if pool else map(build_file, todo)
+            for rel, entry in results:
+                prev = old.get(rel, {})
+                if not entry["ok"]:
+                    # 변환을 건너뛴 경우 이전 결과 파일 정보는 유지 (삭제 대상 추적용)
+                    entry.update({k: v for k, v in prev.items() if k.startswith("dst_")})
+                    failed.append(rel)
+                    logging.error(f"⚠️  검증 실패 → 변환 건너뜀: {root / rel}")
+                else:
+                    logging.info(f"✔️ {rel} → {dst_root.name}/{rel}")
+                manifest[rel] = entry
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+
+    if changed or todo or removed:
+        save_manifest(dst_root, manifest)
+    logging.info(
+        f"✅ 변환 완료. 다시 변환 {len(todo)}개, 변경 없음 {len(manifest) - len(todo)}개, "
+        f"삭제 {len(removed)}개, 검증 실패 {len(failed)}개. 결과 디렉터리: {dst_root}"
+    )
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("사용법: python transform_flashcards.py /path/to/정처기공부파일")
-        sys.exit(1)
-    main(Path(sys.argv[1]).expanduser().resolve())
+    parser = argparse.ArgumentParser(description="플래시카드 .txt 파일의 '단어\\의미'를 '의미\\단어'로 변환")
+    parser.add_argument("root", help="변환할 디렉터리 (예: 정처기 공부파일)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="병렬 변환 프로세스 수 (기본 CPU 수)")
+    parser.add_argument("--full", action="store_true", help="매니페스트와 상관없이 전부 다시 변환")
+    args = parser.parse_args()
+    main(Path(args.root).expanduser().resolve(), args.jobs, args.full)
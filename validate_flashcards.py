@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 """
 검증 스크립트: 각 .txt 파일의 모든 행에 백슬래시(\\)가 정확히 한 개만 있는지 확인
-사용법: python validate_flashcards.py /path/to/정처기공부파일
+사용법: python validate_flashcards.py /path/to/정처기공부파일 [--jobs N] [--report 결과.jsonl|-]
+- 파일은 발견되는 즉시 프로세스 풀로 전달 (--jobs, 기본 1 = 직렬)
+- 파일은 큰 바이너리 청크 단위로 검사 (str 디코딩 없이 바이트에서 바로 판정)
+  (줄바꿈은 텍스트 모드처럼 \n, \r\n, \r 모두 인정)
+- --report: 파일당 JSON 한 줄 + 마지막 요약 한 줄 (JSONL), '-'는 표준출력
 """
 from pathlib import Path
+from multiprocessing import Pool
+from typing import Iterator, Optional
+import argparse
+import json
 import sys
 import logging
 
@@ -12,46 +20,113 @@ logging.basicConfig(
     format="%(levelname)s | %(message)s",
 )
 
+CHUNK_SIZE = 1 << 20
+MAX_REPORTED_LINES = 20  # 파일당 보고할 실패 줄 번호 수
+
+def scan_file(path: Path) -> dict:
+    """파일 한 개를 바이트 단위로 검사하고 결과를 dict로 반환 (로그 없음)"""
+    bad = 0
+    bad_lines = []
+    line_no = 0  # 지금까지 읽은 줄 수
+    carry = b""
+    with path.open("rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            data = carry + chunk
+            if b"\r" in data:
+                # 텍스트 모드의 universal newlines와 같게 \r\n·\r → \n
+                # 청크 끝의 \r은 다음 청크 첫 \n과 한 줄바꿈일 수 있으므로 남겨 두었다가 같이 변환
+                hold = b"\r" if chunk and data.endswith(b"\r") else b""
+                data = data[:len(data) - len(hold)].replace(b"\r\n", b"\n").replace(b"\r", b"\n") + hold
+            if chunk:
+                # 청크 경계에 걸친 마지막 줄은 다음 청크로 넘김
+                cut = data.rfind(b"\n") + 1
+                data, carry = data[:cut], data[cut:]
+            elif not data:
+                break
+
+            # 줄마다 백슬래시 개수만 셈 (정규식 역추적 없이 줄 길이에 선형)
+            rows = data.split(b"\n")
+            if not rows[-1]:
+                rows.pop()  # 마지막 개행 뒤의 빈 조각은 줄이 아님
+            for line in rows:
+                line_no += 1
+                count = line.count(b"\\")
+                if count == 1:
+                    continue
+                # 백슬래시가 없어도 공백만 있는 줄은 통과 (유니코드 공백 포함, str.strip과 동일)
+                if not count and not line.decode("utf-8", "replace").strip():
+                    continue
+                bad += 1
+                if len(bad_lines) < MAX_REPORTED_LINES:
+                    bad_lines.append(line_no)
+            if not chunk:
+                break
+
+    return {"file": str(path), "lines": line_no, "bad": bad, "bad_lines": bad_lines, "ok": bad == 0}
+
+
 def validate_file(path: Path) -> bool:
-    """파일 한 개를 검증하고, 실패 시 상세 로그를 남깁니다."""
-    ok = True
-    with path.open(encoding="utf-8") as f:
-        for idx, line in enumerate(f, start=1):
-            # 비어있는 줄 (공백 포함)은 검사 대상에서 제외
-            if line.strip() == "":
-                continue
-
-            count = line.count("\\")
-            if count != 1:
-                logging.warning(
-                    f"[{path.name}] {idx}번째 줄 → '\\' 갯수: {count} (내용: {line.rstrip()!r})"
-                )
-                ok = False
-    return ok
-
-
-def main(root: Path) -> None:
-    txt_files = list(root.rglob("*.txt"))
-    if not txt_files:
+    """파일 한 개를 검증하고, 실패 시 파일당 한 줄 요약 로그를 남깁니다."""
+    result = scan_file(path)
+    if not result["ok"]:
+        logging.warning(
+            f"[{path.name}] '\\' 갯수 오류 {result['bad']}줄 (줄 번호: {result['bad_lines']})"
+        )
+    return result["ok"]
+
+
+def iter_txt_files(root: Path) -> Iterator[Path]:
+    """.txt 파일을 발견하는 대로 하나씩 돌려줌 (목록을 미리 만들지 않음)"""
+    return root.rglob("*.txt")
+
+
+def main(root: Path, jobs: int = 1, report: Optional[str] = None) -> None:
+    out = None
+    if report == "-":
+        out = sys.stdout
+    elif report:
+        out = open(report, "w", encoding="utf-8")
+
+    total = 0
+    failed = []
+    pool = Pool(jobs) if jobs > 1 else None
+    try:
+        results = pool.imap_unordered(scan_file, iter_txt_files(root), chunksize=8) if pool \
+            else map(scan_file, iter_txt_files(root))
+        for result in results:
+            total += 1
+            if not result["ok"]:
+                failed.append(result)
+            if out:
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    if out:
+        summary = {"summary": True, "files": total, "passed": total - len(failed), "failed": len(failed),
+                   "bad_lines": sum(r["bad"] for r in failed)}
+        out.write(json.dumps(summary, ensure_ascii=False) + "\n")
+        if out is not sys.stdout:
+            out.close()
+
+    if not total:
         logging.error("검증할 .txt 파일이 없습니다.")
         sys.exit(1)
 
-    failed, passed = [], []
-    for file in txt_files:
-        if validate_file(file):
-            passed.append(file)
-        else:
-            failed.append(file)
-
-    logging.info(f"총 {len(txt_files)}개 중 ✅ {len(passed)}개 통과, ❌ {len(failed)}개 실패")
+    logging.info(f"총 {total}개 중 ✅ {total - len(failed)}개 통과, ❌ {len(failed)}개 실패")
     if failed:
         logging.warning("실패한 파일 목록:")
-        for f in failed:
-            logging.warning(f"- {f.relative_to(root)}")
+        for r in failed:
+            logging.warning(f"- {Path(r['file']).relative_to(root)} ({r['bad']}줄)")
         sys.exit(2)
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("사용법: python validate_flashcards.py /path/to/정처기 공부파일")
-        sys.exit(1)
-    main(Path(sys.argv[1]).expanduser().resolve())
+    parser = argparse.ArgumentParser(description="플래시카드 .txt 파일의 '\\' 구분자 검증")
+    parser.add_argument("root", help="검증할 디렉터리 (예: 정처기 공부파일)")
+    parser.add_argument("--jobs", type=int, default=1, help="병렬 검사 프로세스 수 (기본 1)")
+    parser.add_argument("--report", help="JSONL 보고서 경로 ('-'는 표준출력)")
+    args = parser.parse_args()
+    main(Path(args.root).expanduser().resolve(), args.jobs, args.report)